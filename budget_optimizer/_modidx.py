@@ -5,46 +5,507 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://optimizer.mattreda.pro',
                 'git_url': 'https://github.com/redam94/budget_optimizer',
                 'lib_path': 'budget_optimizer'},
-  'syms': { 'budget_optimizer.optimizer': { 'budget_optimizer.optimizer.BaseOptimizer': ( 'optimizer.html#baseoptimizer',
+  'syms': { 'budget_optimizer.bench': { 'budget_optimizer.bench.Scenario': ('bench.html#scenario', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.Scenario.bounds': ( 'bench.html#scenario.bounds',
+                                                                                    'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.Scenario.name': ('bench.html#scenario.name', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.Scenario.write': ('bench.html#scenario.write', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.SyntheticModel': ('bench.html#syntheticmodel', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.SyntheticModel.__init__': ( 'bench.html#syntheticmodel.__init__',
+                                                                                            'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.SyntheticModel._contribution': ( 'bench.html#syntheticmodel._contribution',
+                                                                                                 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.SyntheticModel.contributions': ( 'bench.html#syntheticmodel.contributions',
+                                                                                                 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.SyntheticModel.predict': ( 'bench.html#syntheticmodel.predict',
+                                                                                           'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._LossRecorder': ('bench.html#_lossrecorder', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._LossRecorder.__call__': ( 'bench.html#_lossrecorder.__call__',
+                                                                                           'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._LossRecorder.__init__': ( 'bench.html#_lossrecorder.__init__',
+                                                                                           'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._LossRecorder.time_to_target': ( 'bench.html#_lossrecorder.time_to_target',
+                                                                                                 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._flatten': ('bench.html#_flatten', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._random_budgets': ( 'bench.html#_random_budgets',
+                                                                                    'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._run_optimizer': ('bench.html#_run_optimizer', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench._timed': ('bench.html#_timed', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.bench_cli': ('bench.html#bench_cli', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.bench_import': ('bench.html#bench_import', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.bench_model': ('bench.html#bench_model', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.bench_optimizer': ( 'bench.html#bench_optimizer',
+                                                                                    'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.compare_to_baseline': ( 'bench.html#compare_to_baseline',
+                                                                                        'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.generate_synthetic_model': ( 'bench.html#generate_synthetic_model',
+                                                                                             'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.load_synthetic_model': ( 'bench.html#load_synthetic_model',
+                                                                                         'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.run_benchmarks': ('bench.html#run_benchmarks', 'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.synthetic_budget_to_data': ( 'bench.html#synthetic_budget_to_data',
+                                                                                             'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.synthetic_budget_to_multipliers': ( 'bench.html#synthetic_budget_to_multipliers',
+                                                                                                    'budget_optimizer/bench.py'),
+                                        'budget_optimizer.bench.synthetic_initial_budget': ( 'bench.html#synthetic_initial_budget',
+                                                                                             'budget_optimizer/bench.py')},
+            'budget_optimizer.optimizer': { 'budget_optimizer.optimizer.BaseOptimizer': ( 'optimizer.html#baseoptimizer',
                                                                                           'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer.__init__': ( 'optimizer.html#baseoptimizer.__init__',
                                                                                                    'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._array_channels': ( 'optimizer.html#baseoptimizer._array_channels',
+                                                                                                          'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._batch_loss': ( 'optimizer.html#baseoptimizer._batch_loss',
+                                                                                                      'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._bind_config': ( 'optimizer.html#baseoptimizer._bind_config',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._budget_losses': ( 'optimizer.html#baseoptimizer._budget_losses',
+                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._config_module': ( 'optimizer.html#baseoptimizer._config_module',
+                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._continuation': ( 'optimizer.html#baseoptimizer._continuation',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._draw_losses': ( 'optimizer.html#baseoptimizer._draw_losses',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._finite_difference_jac': ( 'optimizer.html#baseoptimizer._finite_difference_jac',
+                                                                                                                 'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._from_worker': ( 'optimizer.html#baseoptimizer._from_worker',
+                                                                                                       'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer._load_config': ( 'optimizer.html#baseoptimizer._load_config',
                                                                                                        'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer._load_loss_fn': ( 'optimizer.html#baseoptimizer._load_loss_fn',
                                                                                                         'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer._load_optimizer_array_to_budget': ( 'optimizer.html#baseoptimizer._load_optimizer_array_to_budget',
                                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._load_optional': ( 'optimizer.html#baseoptimizer._load_optional',
+                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._map_workers': ( 'optimizer.html#baseoptimizer._map_workers',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._observe': ( 'optimizer.html#baseoptimizer._observe',
+                                                                                                   'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._observe_solutions': ( 'optimizer.html#baseoptimizer._observe_solutions',
+                                                                                                             'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer._optimizer_fn': ( 'optimizer.html#baseoptimizer._optimizer_fn',
                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._optimizer_hessp': ( 'optimizer.html#baseoptimizer._optimizer_hessp',
+                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._optimizer_jac': ( 'optimizer.html#baseoptimizer._optimizer_jac',
+                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._prediction_loss': ( 'optimizer.html#baseoptimizer._prediction_loss',
+                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._process_pool': ( 'optimizer.html#baseoptimizer._process_pool',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._run_progress': ( 'optimizer.html#baseoptimizer._run_progress',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._set_solution': ( 'optimizer.html#baseoptimizer._set_solution',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._solve_total': ( 'optimizer.html#baseoptimizer._solve_total',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._uses_draw_losses': ( 'optimizer.html#baseoptimizer._uses_draw_losses',
+                                                                                                            'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._warm_kwargs': ( 'optimizer.html#baseoptimizer._warm_kwargs',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._window': ( 'optimizer.html#baseoptimizer._window',
+                                                                                                  'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer._worker_state': ( 'optimizer.html#baseoptimizer._worker_state',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer.frontier': ( 'optimizer.html#baseoptimizer.frontier',
+                                                                                                   'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer.has_analytic_jac': ( 'optimizer.html#baseoptimizer.has_analytic_jac',
+                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer.instrument': ( 'optimizer.html#baseoptimizer.instrument',
+                                                                                                     'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer.optimize': ( 'optimizer.html#baseoptimizer.optimize',
                                                                                                    'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer.optimize_iter': ( 'optimizer.html#baseoptimizer.optimize_iter',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer.optimize_posterior': ( 'optimizer.html#baseoptimizer.optimize_posterior',
+                                                                                                             'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.BaseOptimizer.reload_config': ( 'optimizer.html#baseoptimizer.reload_config',
                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.BaseOptimizer.uninstrument': ( 'optimizer.html#baseoptimizer.uninstrument',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.Incumbent': ( 'optimizer.html#incumbent',
+                                                                                      'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.Incumbent.throughput': ( 'optimizer.html#incumbent.throughput',
+                                                                                                 'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationCancelled': ( 'optimizer.html#optimizationcancelled',
+                                                                                                  'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress': ( 'optimizer.html#optimizationprogress',
+                                                                                                 'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.__init__': ( 'optimizer.html#optimizationprogress.__init__',
+                                                                                                          'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.cancel': ( 'optimizer.html#optimizationprogress.cancel',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.cancelled': ( 'optimizer.html#optimizationprogress.cancelled',
+                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.finish': ( 'optimizer.html#optimizationprogress.finish',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.start': ( 'optimizer.html#optimizationprogress.start',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.update': ( 'optimizer.html#optimizationprogress.update',
+                                                                                                        'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptimizationProgress.wait': ( 'optimizer.html#optimizationprogress.wait',
+                                                                                                      'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.OptunaBudgetOptimizer': ( 'optimizer.html#optunabudgetoptimizer',
                                                                                                   'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.OptunaBudgetOptimizer.__init__': ( 'optimizer.html#optunabudgetoptimizer.__init__',
                                                                                                            'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer._ask': ( 'optimizer.html#optunabudgetoptimizer._ask',
+                                                                                                       'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer._on_trial_finished': ( 'optimizer.html#optunabudgetoptimizer._on_trial_finished',
+                                                                                                                     'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.OptunaBudgetOptimizer._opt_fn': ( 'optimizer.html#optunabudgetoptimizer._opt_fn',
                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer._optimize_ask_tell': ( 'optimizer.html#optunabudgetoptimizer._optimize_ask_tell',
+                                                                                                                     'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer._previous_budgets': ( 'optimizer.html#optunabudgetoptimizer._previous_budgets',
+                                                                                                                    'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer._progressive_loss': ( 'optimizer.html#optunabudgetoptimizer._progressive_loss',
+                                                                                                                    'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer._warm_kwargs': ( 'optimizer.html#optunabudgetoptimizer._warm_kwargs',
+                                                                                                               'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer.export_trials': ( 'optimizer.html#optunabudgetoptimizer.export_trials',
+                                                                                                                'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer.load_snapshot': ( 'optimizer.html#optunabudgetoptimizer.load_snapshot',
+                                                                                                                'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.OptunaBudgetOptimizer.optimize': ( 'optimizer.html#optunabudgetoptimizer.optimize',
                                                                                                            'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer.seed_study': ( 'optimizer.html#optunabudgetoptimizer.seed_study',
+                                                                                                             'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer.summary': ( 'optimizer.html#optunabudgetoptimizer.summary',
+                                                                                                          'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.OptunaBudgetOptimizer.trial_arrays': ( 'optimizer.html#optunabudgetoptimizer.trial_arrays',
+                                                                                                               'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.PopulationBudgetOptimizer': ( 'optimizer.html#populationbudgetoptimizer',
+                                                                                                      'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.PopulationBudgetOptimizer._evaluate': ( 'optimizer.html#populationbudgetoptimizer._evaluate',
+                                                                                                                'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.PopulationBudgetOptimizer._solve_total': ( 'optimizer.html#populationbudgetoptimizer._solve_total',
+                                                                                                                   'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.PopulationBudgetOptimizer._warm_kwargs': ( 'optimizer.html#populationbudgetoptimizer._warm_kwargs',
+                                                                                                                   'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.PopulationBudgetOptimizer.optimize': ( 'optimizer.html#populationbudgetoptimizer.optimize',
+                                                                                                               'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.ScipyBudgetOptimizer': ( 'optimizer.html#scipybudgetoptimizer',
                                                                                                  'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer._minimize': ( 'optimizer.html#scipybudgetoptimizer._minimize',
+                                                                                                           'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer._solve_total': ( 'optimizer.html#scipybudgetoptimizer._solve_total',
+                                                                                                              'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer._warm_kwargs': ( 'optimizer.html#scipybudgetoptimizer._warm_kwargs',
+                                                                                                              'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer.feasible_starts': ( 'optimizer.html#scipybudgetoptimizer.feasible_starts',
+                                                                                                                 'budget_optimizer/optimizer.py'),
                                             'budget_optimizer.optimizer.ScipyBudgetOptimizer.optimize': ( 'optimizer.html#scipybudgetoptimizer.optimize',
-                                                                                                          'budget_optimizer/optimizer.py')},
+                                                                                                          'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer.optimize_multistart': ( 'optimizer.html#scipybudgetoptimizer.optimize_multistart',
+                                                                                                                     'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer.project': ( 'optimizer.html#scipybudgetoptimizer.project',
+                                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.ScipyBudgetOptimizer.warm_start': ( 'optimizer.html#scipybudgetoptimizer.warm_start',
+                                                                                                            'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer._init_worker': ( 'optimizer.html#_init_worker',
+                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer._local_result': ( 'optimizer.html#_local_result',
+                                                                                          'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer._worker_budget_losses': ( 'optimizer.html#_worker_budget_losses',
+                                                                                                  'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer._worker_call': ( 'optimizer.html#_worker_call',
+                                                                                         'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer._worker_frontier': ( 'optimizer.html#_worker_frontier',
+                                                                                             'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer._worker_solve': ( 'optimizer.html#_worker_solve',
+                                                                                          'budget_optimizer/optimizer.py'),
+                                            'budget_optimizer.optimizer.optuna_storage': ( 'optimizer.html#optuna_storage',
+                                                                                           'budget_optimizer/optimizer.py')},
+            'budget_optimizer.response_curves': { 'budget_optimizer.response_curves.ResponseCurves': ( 'response_curves.html#responsecurves',
+                                                                                                       'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.__init__': ( 'response_curves.html#responsecurves.__init__',
+                                                                                                                'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.allocate': ( 'response_curves.html#responsecurves.allocate',
+                                                                                                                'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.compute': ( 'response_curves.html#responsecurves.compute',
+                                                                                                               'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.default_path': ( 'response_curves.html#responsecurves.default_path',
+                                                                                                                    'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.load': ( 'response_curves.html#responsecurves.load',
+                                                                                                            'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.marginal_roi': ( 'response_curves.html#responsecurves.marginal_roi',
+                                                                                                                    'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.save': ( 'response_curves.html#responsecurves.save',
+                                                                                                            'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves.ResponseCurves.to_dataset': ( 'response_curves.html#responsecurves.to_dataset',
+                                                                                                                  'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves._loss_config': ( 'response_curves.html#_loss_config',
+                                                                                                     'budget_optimizer/response_curves.py'),
+                                                  'budget_optimizer.response_curves._upper_hull': ( 'response_curves.html#_upper_hull',
+                                                                                                    'budget_optimizer/response_curves.py')},
+            'budget_optimizer.server': { 'budget_optimizer.server.Job': ('server.html#job', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.__init__': ('server.html#job.__init__', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.done': ('server.html#job.done', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.emit': ('server.html#job.emit', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.model_key': ( 'server.html#job.model_key',
+                                                                                    'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.stream': ('server.html#job.stream', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.summary': ('server.html#job.summary', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.Job.wait': ('server.html#job.wait', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler': ('server.html#jobscheduler', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler.__init__': ( 'server.html#jobscheduler.__init__',
+                                                                                            'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler._dispatch': ( 'server.html#jobscheduler._dispatch',
+                                                                                             'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler._run': ( 'server.html#jobscheduler._run',
+                                                                                        'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler.cancel': ( 'server.html#jobscheduler.cancel',
+                                                                                          'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler.get': ( 'server.html#jobscheduler.get',
+                                                                                       'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler.info': ( 'server.html#jobscheduler.info',
+                                                                                        'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.JobScheduler.submit': ( 'server.html#jobscheduler.submit',
+                                                                                          'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.ModelPool': ('server.html#modelpool', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.ModelPool.__init__': ( 'server.html#modelpool.__init__',
+                                                                                         'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.ModelPool.__len__': ( 'server.html#modelpool.__len__',
+                                                                                        'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.ModelPool.fingerprint': ( 'server.html#modelpool.fingerprint',
+                                                                                            'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.ModelPool.get': ( 'server.html#modelpool.get',
+                                                                                    'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.ModelPool.info': ( 'server.html#modelpool.info',
+                                                                                     'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.OptimizationServer': ( 'server.html#optimizationserver',
+                                                                                         'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.OptimizationServer.__init__': ( 'server.html#optimizationserver.__init__',
+                                                                                                  'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.OptimizationServer.start': ( 'server.html#optimizationserver.start',
+                                                                                               'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.OptimizationServer.stop': ( 'server.html#optimizationserver.stop',
+                                                                                              'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.OptimizationServer.url': ( 'server.html#optimizationserver.url',
+                                                                                             'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler': ('server.html#_jobhandler', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler._job': ( 'server.html#_jobhandler._job',
+                                                                                       'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler._send_json': ( 'server.html#_jobhandler._send_json',
+                                                                                             'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler._stream': ( 'server.html#_jobhandler._stream',
+                                                                                          'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler.do_DELETE': ( 'server.html#_jobhandler.do_delete',
+                                                                                            'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler.do_GET': ( 'server.html#_jobhandler.do_get',
+                                                                                         'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler.do_POST': ( 'server.html#_jobhandler.do_post',
+                                                                                          'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler.log_message': ( 'server.html#_jobhandler.log_message',
+                                                                                              'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._JobHandler.scheduler': ( 'server.html#_jobhandler.scheduler',
+                                                                                            'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._apply_overrides': ( 'server.html#_apply_overrides',
+                                                                                       'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._optimize_args': ( 'server.html#_optimize_args',
+                                                                                     'budget_optimizer/server.py'),
+                                         'budget_optimizer.server._to_json': ('server.html#_to_json', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.job_events': ('server.html#job_events', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.run_job': ('server.html#run_job', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.serve_cli': ('server.html#serve_cli', 'budget_optimizer/server.py'),
+                                         'budget_optimizer.server.submit_job': ('server.html#submit_job', 'budget_optimizer/server.py')},
+            'budget_optimizer.surrogate': { 'budget_optimizer.surrogate.SurrogateBudgetOptimizer': ( 'surrogate.html#surrogatebudgetoptimizer',
+                                                                                                     'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateBudgetOptimizer._real_losses': ( 'surrogate.html#surrogatebudgetoptimizer._real_losses',
+                                                                                                                  'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateBudgetOptimizer.optimize': ( 'surrogate.html#surrogatebudgetoptimizer.optimize',
+                                                                                                              'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel': ( 'surrogate.html#surrogatemodel',
+                                                                                           'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.__init__': ( 'surrogate.html#surrogatemodel.__init__',
+                                                                                                    'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel._emulate': ( 'surrogate.html#surrogatemodel._emulate',
+                                                                                                    'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel._inputs': ( 'surrogate.html#surrogatemodel._inputs',
+                                                                                                   'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.add': ( 'surrogate.html#surrogatemodel.add',
+                                                                                               'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.contributions': ( 'surrogate.html#surrogatemodel.contributions',
+                                                                                                         'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.default_path': ( 'surrogate.html#surrogatemodel.default_path',
+                                                                                                        'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.evaluate': ( 'surrogate.html#surrogatemodel.evaluate',
+                                                                                                    'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.fit': ( 'surrogate.html#surrogatemodel.fit',
+                                                                                               'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.instrument': ( 'surrogate.html#surrogatemodel.instrument',
+                                                                                                      'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.load': ( 'surrogate.html#surrogatemodel.load',
+                                                                                                'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.predict': ( 'surrogate.html#surrogatemodel.predict',
+                                                                                                   'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.predict_batch': ( 'surrogate.html#surrogatemodel.predict_batch',
+                                                                                                         'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.save': ( 'surrogate.html#surrogatemodel.save',
+                                                                                                'budget_optimizer/surrogate.py'),
+                                            'budget_optimizer.surrogate.SurrogateModel.uninstrument': ( 'surrogate.html#surrogatemodel.uninstrument',
+                                                                                                        'budget_optimizer/surrogate.py')},
+            'budget_optimizer.utils.instrumentation': { 'budget_optimizer.utils.instrumentation.Instrumentation': ( 'utils/instrumentation.html#instrumentation',
+                                                                                                                    'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.__enter__': ( 'utils/instrumentation.html#instrumentation.__enter__',
+                                                                                                                              'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.__exit__': ( 'utils/instrumentation.html#instrumentation.__exit__',
+                                                                                                                             'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.__init__': ( 'utils/instrumentation.html#instrumentation.__init__',
+                                                                                                                             'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation._keep_profile': ( 'utils/instrumentation.html#instrumentation._keep_profile',
+                                                                                                                                  'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation._start_profiler': ( 'utils/instrumentation.html#instrumentation._start_profiler',
+                                                                                                                                    'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.close': ( 'utils/instrumentation.html#instrumentation.close',
+                                                                                                                          'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.drain': ( 'utils/instrumentation.html#instrumentation.drain',
+                                                                                                                          'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.evaluation': ( 'utils/instrumentation.html#instrumentation.evaluation',
+                                                                                                                               'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.merge': ( 'utils/instrumentation.html#instrumentation.merge',
+                                                                                                                          'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.reset': ( 'utils/instrumentation.html#instrumentation.reset',
+                                                                                                                          'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.slowest_profiles': ( 'utils/instrumentation.html#instrumentation.slowest_profiles',
+                                                                                                                                     'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.stage': ( 'utils/instrumentation.html#instrumentation.stage',
+                                                                                                                          'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Instrumentation.summary': ( 'utils/instrumentation.html#instrumentation.summary',
+                                                                                                                            'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.LogExporter': ( 'utils/instrumentation.html#logexporter',
+                                                                                                                'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.LogExporter.__init__': ( 'utils/instrumentation.html#logexporter.__init__',
+                                                                                                                         'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.LogExporter.on_evaluation': ( 'utils/instrumentation.html#logexporter.on_evaluation',
+                                                                                                                              'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.LogExporter.on_stage': ( 'utils/instrumentation.html#logexporter.on_stage',
+                                                                                                                         'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.NullInstrumentation': ( 'utils/instrumentation.html#nullinstrumentation',
+                                                                                                                        'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.NullInstrumentation.evaluation': ( 'utils/instrumentation.html#nullinstrumentation.evaluation',
+                                                                                                                                   'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.NullInstrumentation.stage': ( 'utils/instrumentation.html#nullinstrumentation.stage',
+                                                                                                                              'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Observer': ( 'utils/instrumentation.html#observer',
+                                                                                                             'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Observer.on_evaluation': ( 'utils/instrumentation.html#observer.on_evaluation',
+                                                                                                                           'budget_optimizer/utils/instrumentation.py'),
+                                                        'budget_optimizer.utils.instrumentation.Observer.on_stage': ( 'utils/instrumentation.html#observer.on_stage',
+                                                                                                                      'budget_optimizer/utils/instrumentation.py')},
+            'budget_optimizer.utils.job_store': { 'budget_optimizer.utils.job_store.ResultStore': ( 'utils/job_store.html#resultstore',
+                                                                                                    'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.__contains__': ( 'utils/job_store.html#resultstore.__contains__',
+                                                                                                                 'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.__init__': ( 'utils/job_store.html#resultstore.__init__',
+                                                                                                             'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.__len__': ( 'utils/job_store.html#resultstore.__len__',
+                                                                                                            'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.clear': ( 'utils/job_store.html#resultstore.clear',
+                                                                                                          'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.close': ( 'utils/job_store.html#resultstore.close',
+                                                                                                          'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.get': ( 'utils/job_store.html#resultstore.get',
+                                                                                                        'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.ResultStore.put': ( 'utils/job_store.html#resultstore.put',
+                                                                                                        'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store._json_default': ( 'utils/job_store.html#_json_default',
+                                                                                                      'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.file_digest': ( 'utils/job_store.html#file_digest',
+                                                                                                    'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.job_fingerprint': ( 'utils/job_store.html#job_fingerprint',
+                                                                                                        'budget_optimizer/utils/job_store.py'),
+                                                  'budget_optimizer.utils.job_store.job_seed': ( 'utils/job_store.html#job_seed',
+                                                                                                 'budget_optimizer/utils/job_store.py')},
             'budget_optimizer.utils.model_classes': { 'budget_optimizer.utils.model_classes.BaseBudgetModel': ( 'utils/model_classes.html#basebudgetmodel',
                                                                                                                 'budget_optimizer/utils/model_classes.py'),
                                                       'budget_optimizer.utils.model_classes.BaseBudgetModel.__init__': ( 'utils/model_classes.html#basebudgetmodel.__init__',
                                                                                                                          'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.__reduce__': ( 'utils/model_classes.html#basebudgetmodel.__reduce__',
+                                                                                                                           'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._base_data': ( 'utils/model_classes.html#basebudgetmodel._base_data',
+                                                                                                                           'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._bind_config': ( 'utils/model_classes.html#basebudgetmodel._bind_config',
+                                                                                                                             'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._cache_key': ( 'utils/model_classes.html#basebudgetmodel._cache_key',
+                                                                                                                           'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._cached': ( 'utils/model_classes.html#basebudgetmodel._cached',
+                                                                                                                        'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._config_module': ( 'utils/model_classes.html#basebudgetmodel._config_module',
+                                                                                                                               'budget_optimizer/utils/model_classes.py'),
                                                       'budget_optimizer.utils.model_classes.BaseBudgetModel._get_budget_to_data': ( 'utils/model_classes.html#basebudgetmodel._get_budget_to_data',
                                                                                                                                     'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._get_budget_to_data_batch': ( 'utils/model_classes.html#basebudgetmodel._get_budget_to_data_batch',
+                                                                                                                                          'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._get_budget_to_multipliers': ( 'utils/model_classes.html#basebudgetmodel._get_budget_to_multipliers',
+                                                                                                                                           'budget_optimizer/utils/model_classes.py'),
                                                       'budget_optimizer.utils.model_classes.BaseBudgetModel._get_model_loader': ( 'utils/model_classes.html#basebudgetmodel._get_model_loader',
                                                                                                                                   'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._get_predict_jac': ( 'utils/model_classes.html#basebudgetmodel._get_predict_jac',
+                                                                                                                                 'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._input_data': ( 'utils/model_classes.html#basebudgetmodel._input_data',
+                                                                                                                            'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._load_model': ( 'utils/model_classes.html#basebudgetmodel._load_model',
+                                                                                                                            'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._model_output': ( 'utils/model_classes.html#basebudgetmodel._model_output',
+                                                                                                                              'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._model_predict': ( 'utils/model_classes.html#basebudgetmodel._model_predict',
+                                                                                                                               'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._predict': ( 'utils/model_classes.html#basebudgetmodel._predict',
+                                                                                                                         'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._predict_batch': ( 'utils/model_classes.html#basebudgetmodel._predict_batch',
+                                                                                                                               'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._progressive_predict': ( 'utils/model_classes.html#basebudgetmodel._progressive_predict',
+                                                                                                                                     'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel._window_indexers': ( 'utils/model_classes.html#basebudgetmodel._window_indexers',
+                                                                                                                                 'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.budget_data': ( 'utils/model_classes.html#basebudgetmodel.budget_data',
+                                                                                                                            'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.cache_info': ( 'utils/model_classes.html#basebudgetmodel.cache_info',
+                                                                                                                           'budget_optimizer/utils/model_classes.py'),
                                                       'budget_optimizer.utils.model_classes.BaseBudgetModel.contributions': ( 'utils/model_classes.html#basebudgetmodel.contributions',
                                                                                                                               'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.contributions_batch': ( 'utils/model_classes.html#basebudgetmodel.contributions_batch',
+                                                                                                                                    'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.disable_cache': ( 'utils/model_classes.html#basebudgetmodel.disable_cache',
+                                                                                                                              'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.draw_dim': ( 'utils/model_classes.html#basebudgetmodel.draw_dim',
+                                                                                                                         'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.enable_cache': ( 'utils/model_classes.html#basebudgetmodel.enable_cache',
+                                                                                                                             'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.has_batch': ( 'utils/model_classes.html#basebudgetmodel.has_batch',
+                                                                                                                          'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.has_jac': ( 'utils/model_classes.html#basebudgetmodel.has_jac',
+                                                                                                                        'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.instrument': ( 'utils/model_classes.html#basebudgetmodel.instrument',
+                                                                                                                           'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.posterior_draws': ( 'utils/model_classes.html#basebudgetmodel.posterior_draws',
+                                                                                                                                'budget_optimizer/utils/model_classes.py'),
                                                       'budget_optimizer.utils.model_classes.BaseBudgetModel.predict': ( 'utils/model_classes.html#basebudgetmodel.predict',
-                                                                                                                        'budget_optimizer/utils/model_classes.py')},
+                                                                                                                        'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.predict_batch': ( 'utils/model_classes.html#basebudgetmodel.predict_batch',
+                                                                                                                              'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.predict_iter': ( 'utils/model_classes.html#basebudgetmodel.predict_iter',
+                                                                                                                             'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.predict_jac': ( 'utils/model_classes.html#basebudgetmodel.predict_jac',
+                                                                                                                            'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.reload_config': ( 'utils/model_classes.html#basebudgetmodel.reload_config',
+                                                                                                                              'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.share_memory': ( 'utils/model_classes.html#basebudgetmodel.share_memory',
+                                                                                                                             'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.uninstrument': ( 'utils/model_classes.html#basebudgetmodel.uninstrument',
+                                                                                                                             'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.unshare_memory': ( 'utils/model_classes.html#basebudgetmodel.unshare_memory',
+                                                                                                                               'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes.BaseBudgetModel.use_draws': ( 'utils/model_classes.html#basebudgetmodel.use_draws',
+                                                                                                                          'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes._load_budget_model': ( 'utils/model_classes.html#_load_budget_model',
+                                                                                                                   'budget_optimizer/utils/model_classes.py'),
+                                                      'budget_optimizer.utils.model_classes._window_key': ( 'utils/model_classes.html#_window_key',
+                                                                                                            'budget_optimizer/utils/model_classes.py')},
             'budget_optimizer.utils.model_helpers': { 'budget_optimizer.utils.model_helpers.AbstractModel': ( 'utils/model_helpers.html#abstractmodel',
                                                                                                               'budget_optimizer/utils/model_helpers.py'),
                                                       'budget_optimizer.utils.model_helpers.AbstractModel.__repr__': ( 'utils/model_helpers.html#abstractmodel.__repr__',
@@ -53,17 +514,155 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                             'budget_optimizer/utils/model_helpers.py'),
                                                       'budget_optimizer.utils.model_helpers.AbstractModel.predict': ( 'utils/model_helpers.html#abstractmodel.predict',
                                                                                                                       'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry': ( 'utils/model_helpers.html#configregistry',
+                                                                                                               'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry.__init__': ( 'utils/model_helpers.html#configregistry.__init__',
+                                                                                                                        'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry._load': ( 'utils/model_helpers.html#configregistry._load',
+                                                                                                                     'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry._stamp': ( 'utils/model_helpers.html#configregistry._stamp',
+                                                                                                                      'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry.load_module': ( 'utils/model_helpers.html#configregistry.load_module',
+                                                                                                                           'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry.load_yaml': ( 'utils/model_helpers.html#configregistry.load_yaml',
+                                                                                                                         'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry.reload': ( 'utils/model_helpers.html#configregistry.reload',
+                                                                                                                      'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ConfigRegistry.report': ( 'utils/model_helpers.html#configregistry.report',
+                                                                                                                      'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset': ( 'utils/model_helpers.html#scaleddataset',
+                                                                                                              'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.__getitem__': ( 'utils/model_helpers.html#scaleddataset.__getitem__',
+                                                                                                                          'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.__init__': ( 'utils/model_helpers.html#scaleddataset.__init__',
+                                                                                                                       'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.__iter__': ( 'utils/model_helpers.html#scaleddataset.__iter__',
+                                                                                                                       'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.__len__': ( 'utils/model_helpers.html#scaleddataset.__len__',
+                                                                                                                      'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.__repr__': ( 'utils/model_helpers.html#scaleddataset.__repr__',
+                                                                                                                       'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.coords': ( 'utils/model_helpers.html#scaleddataset.coords',
+                                                                                                                     'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.data_vars': ( 'utils/model_helpers.html#scaleddataset.data_vars',
+                                                                                                                        'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.sizes': ( 'utils/model_helpers.html#scaleddataset.sizes',
+                                                                                                                    'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.ScaledDataset.to_dataset': ( 'utils/model_helpers.html#scaleddataset.to_dataset',
+                                                                                                                         'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers._LazyModule': ( 'utils/model_helpers.html#_lazymodule',
+                                                                                                            'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers._LazyModule.__getattr__': ( 'utils/model_helpers.html#_lazymodule.__getattr__',
+                                                                                                                        'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.budget_multipliers': ( 'utils/model_helpers.html#budget_multipliers',
+                                                                                                                   'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.lazy_import': ( 'utils/model_helpers.html#lazy_import',
+                                                                                                            'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.load_config_module': ( 'utils/model_helpers.html#load_config_module',
+                                                                                                                   'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.load_config_yaml': ( 'utils/model_helpers.html#load_config_yaml',
+                                                                                                                 'budget_optimizer/utils/model_helpers.py'),
                                                       'budget_optimizer.utils.model_helpers.load_module': ( 'utils/model_helpers.html#load_module',
                                                                                                             'budget_optimizer/utils/model_helpers.py'),
                                                       'budget_optimizer.utils.model_helpers.load_yaml': ( 'utils/model_helpers.html#load_yaml',
-                                                                                                          'budget_optimizer/utils/model_helpers.py')},
+                                                                                                          'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.open_mmap_dataset': ( 'utils/model_helpers.html#open_mmap_dataset',
+                                                                                                                  'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.open_model_dataset': ( 'utils/model_helpers.html#open_model_dataset',
+                                                                                                                   'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.save_mmap_dataset': ( 'utils/model_helpers.html#save_mmap_dataset',
+                                                                                                                  'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.stack_budgets': ( 'utils/model_helpers.html#stack_budgets',
+                                                                                                              'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.to_scalar': ( 'utils/model_helpers.html#to_scalar',
+                                                                                                          'budget_optimizer/utils/model_helpers.py'),
+                                                      'budget_optimizer.utils.model_helpers.unstack_budgets': ( 'utils/model_helpers.html#unstack_budgets',
+                                                                                                                'budget_optimizer/utils/model_helpers.py')},
+            'budget_optimizer.utils.prediction_cache': { 'budget_optimizer.utils.prediction_cache.PredictionCache': ( 'utils/prediction_cache.html#predictioncache',
+                                                                                                                      'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.__init__': ( 'utils/prediction_cache.html#predictioncache.__init__',
+                                                                                                                               'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.__len__': ( 'utils/prediction_cache.html#predictioncache.__len__',
+                                                                                                                              'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache._get': ( 'utils/prediction_cache.html#predictioncache._get',
+                                                                                                                           'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache._insert': ( 'utils/prediction_cache.html#predictioncache._insert',
+                                                                                                                              'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache._put': ( 'utils/prediction_cache.html#predictioncache._put',
+                                                                                                                           'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.clear': ( 'utils/prediction_cache.html#predictioncache.clear',
+                                                                                                                            'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.get': ( 'utils/prediction_cache.html#predictioncache.get',
+                                                                                                                          'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.info': ( 'utils/prediction_cache.html#predictioncache.info',
+                                                                                                                           'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.key': ( 'utils/prediction_cache.html#predictioncache.key',
+                                                                                                                          'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.put': ( 'utils/prediction_cache.html#predictioncache.put',
+                                                                                                                          'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.PredictionCache.set_namespace': ( 'utils/prediction_cache.html#predictioncache.set_namespace',
+                                                                                                                                    'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.SqlitePredictionCache': ( 'utils/prediction_cache.html#sqlitepredictioncache',
+                                                                                                                            'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.SqlitePredictionCache.__init__': ( 'utils/prediction_cache.html#sqlitepredictioncache.__init__',
+                                                                                                                                     'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.SqlitePredictionCache._get': ( 'utils/prediction_cache.html#sqlitepredictioncache._get',
+                                                                                                                                 'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.SqlitePredictionCache._put': ( 'utils/prediction_cache.html#sqlitepredictioncache._put',
+                                                                                                                                 'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.SqlitePredictionCache.clear': ( 'utils/prediction_cache.html#sqlitepredictioncache.clear',
+                                                                                                                                  'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.SqlitePredictionCache.close': ( 'utils/prediction_cache.html#sqlitepredictioncache.close',
+                                                                                                                                  'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache._artifact_files': ( 'utils/prediction_cache.html#_artifact_files',
+                                                                                                                      'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.artifact_fingerprint': ( 'utils/prediction_cache.html#artifact_fingerprint',
+                                                                                                                           'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.artifact_stats': ( 'utils/prediction_cache.html#artifact_stats',
+                                                                                                                     'budget_optimizer/utils/prediction_cache.py'),
+                                                         'budget_optimizer.utils.prediction_cache.budget_key': ( 'utils/prediction_cache.html#budget_key',
+                                                                                                                 'budget_optimizer/utils/prediction_cache.py')},
             'budget_optimizer.utils.search_space_helper': { 'budget_optimizer.utils.search_space_helper.ConstrainedSearchSpace': ( 'utils/search_space_helpers.html#constrainedsearchspace',
                                                                                                                                    'budget_optimizer/utils/search_space_helper.py'),
                                                             'budget_optimizer.utils.search_space_helper.ConstrainedSearchSpace.__call__': ( 'utils/search_space_helpers.html#constrainedsearchspace.__call__',
                                                                                                                                             'budget_optimizer/utils/search_space_helper.py'),
                                                             'budget_optimizer.utils.search_space_helper.ConstrainedSearchSpace.__post_init__': ( 'utils/search_space_helpers.html#constrainedsearchspace.__post_init__',
                                                                                                                                                  'budget_optimizer/utils/search_space_helper.py'),
+                                                            'budget_optimizer.utils.search_space_helper.ConstrainedSearchSpace._center': ( 'utils/search_space_helpers.html#constrainedsearchspace._center',
+                                                                                                                                           'budget_optimizer/utils/search_space_helper.py'),
+                                                            'budget_optimizer.utils.search_space_helper.ConstrainedSearchSpace.is_feasible': ( 'utils/search_space_helpers.html#constrainedsearchspace.is_feasible',
+                                                                                                                                               'budget_optimizer/utils/search_space_helper.py'),
+                                                            'budget_optimizer.utils.search_space_helper.ConstrainedSearchSpace.sample': ( 'utils/search_space_helpers.html#constrainedsearchspace.sample',
+                                                                                                                                          'budget_optimizer/utils/search_space_helper.py'),
                                                             'budget_optimizer.utils.search_space_helper.Trial': ( 'utils/search_space_helpers.html#trial',
                                                                                                                   'budget_optimizer/utils/search_space_helper.py'),
                                                             'budget_optimizer.utils.search_space_helper.Trial.suggest_float': ( 'utils/search_space_helpers.html#trial.suggest_float',
-                                                                                                                                'budget_optimizer/utils/search_space_helper.py')}}}
+                                                                                                                                'budget_optimizer/utils/search_space_helper.py'),
+                                                            'budget_optimizer.utils.search_space_helper.project_budgets': ( 'utils/search_space_helpers.html#project_budgets',
+                                                                                                                            'budget_optimizer/utils/search_space_helper.py')},
+            'budget_optimizer.utils.shared_memory': { 'budget_optimizer.utils.shared_memory.SharedMemoryPublisher': ( 'utils/shared_memory.html#sharedmemorypublisher',
+                                                                                                                      'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory.SharedMemoryPublisher.__init__': ( 'utils/shared_memory.html#sharedmemorypublisher.__init__',
+                                                                                                                               'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory.SharedMemoryPublisher._publish': ( 'utils/shared_memory.html#sharedmemorypublisher._publish',
+                                                                                                                               'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory.SharedMemoryPublisher.close': ( 'utils/shared_memory.html#sharedmemorypublisher.close',
+                                                                                                                            'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory.SharedMemoryPublisher.dumps': ( 'utils/shared_memory.html#sharedmemorypublisher.dumps',
+                                                                                                                            'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory.SharedMemoryPublisher.nbytes': ( 'utils/shared_memory.html#sharedmemorypublisher.nbytes',
+                                                                                                                             'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._SharedPickler': ( 'utils/shared_memory.html#_sharedpickler',
+                                                                                                               'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._SharedPickler.__init__': ( 'utils/shared_memory.html#_sharedpickler.__init__',
+                                                                                                                        'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._SharedPickler.reducer_override': ( 'utils/shared_memory.html#_sharedpickler.reducer_override',
+                                                                                                                                'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._attach_array': ( 'utils/shared_memory.html#_attach_array',
+                                                                                                              'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._config_attribute': ( 'utils/shared_memory.html#_config_attribute',
+                                                                                                                  'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._lookup': ( 'utils/shared_memory.html#_lookup',
+                                                                                                        'budget_optimizer/utils/shared_memory.py'),
+                                                      'budget_optimizer.utils.shared_memory._release': ( 'utils/shared_memory.html#_release',
+                                                                                                         'budget_optimizer/utils/shared_memory.py')}}}
@@ -0,0 +1,409 @@
+"""Reproducible throughput and memory benchmarks for models and optimizers"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_bench.ipynb.
+
+# %% auto 0
+__all__ = ['SyntheticModel', 'Scenario', 'generate_synthetic_model', 'synthetic_initial_budget', 'load_synthetic_model',
+           'synthetic_budget_to_data', 'synthetic_budget_to_multipliers', 'bench_model', 'bench_optimizer',
+           'bench_import', 'run_benchmarks', 'compare_to_baseline', 'bench_cli']
+
+# %% ../nbs/01_bench.ipynb 4
+import json
+import sys
+import time
+import subprocess
+import platform
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+from fastcore.script import call_parse, Param
+
+import budget_optimizer
+from .optimizer import ScipyBudgetOptimizer, OptunaBudgetOptimizer, PopulationBudgetOptimizer
+from .utils.model_classes import BaseBudgetModel
+from budget_optimizer.utils.model_helpers import (
+  AbstractModel,
+  BudgetType,
+  budget_multipliers,
+  load_config_yaml
+)
+
+# %% ../nbs/01_bench.ipynb 6
+class SyntheticModel(AbstractModel):
+  """Saturating media-mix model with a configurable number of channels, periods and geos"""
+  def __init__(
+    self, 
+    data: xr.Dataset, # Spend per channel over (geo, time)
+    beta: dict[str, float], # Maximum contribution of each channel per geo and period
+    half_saturation: dict[str, float], # Spend at which each channel reaches half its maximum contribution
+    intercept: float = 10., # Baseline prediction
+  ):
+    self.data = data
+    self.beta = beta
+    self.half_saturation = half_saturation
+    self.intercept = intercept
+  
+  def _contribution(self, x, channel: str) -> xr.DataArray:
+    spend = x[channel]
+    return self.beta[channel]*spend**2/(spend**2 + self.half_saturation[channel]**2)
+  
+  def predict(self, x: xr.Dataset) -> xr.DataArray:
+    prediction = self.intercept
+    for channel in self.beta:
+      prediction = prediction + self._contribution(x, channel)
+    return prediction.rename("prediction")
+  
+  def contributions(self, x: xr.Dataset) -> xr.Dataset:
+    return xr.Dataset({channel: self._contribution(x, channel) for channel in self.beta})
+
+# %% ../nbs/01_bench.ipynb 7
+_MODEL_CONFIG = '''\
+from budget_optimizer.bench import (
+  load_synthetic_model as model_loader,
+  synthetic_budget_to_data as budget_to_data,
+  synthetic_budget_to_multipliers as budget_to_multipliers
+)
+
+REUSE_BUFFERS = True
+LOOKBACK = 0
+'''
+
+_OPTIMIZER_CONFIG = '''\
+import numpy as np
+from pathlib import Path
+from budget_optimizer.utils.model_helpers import load_config_yaml
+
+CONFIG = load_config_yaml(Path(__file__).parent / "optimizer_config.yaml")
+
+def loss_fn(x, **kwargs):
+    return -np.sum(x)
+
+def optimizer_array_to_budget(array):
+    return {key: array[i] for i, key in enumerate(CONFIG["initial_budget"])}
+'''
+
+# %% ../nbs/01_bench.ipynb 8
+@dataclass
+class Scenario:
+  """Size and seed of a synthetic benchmark model"""
+  n_channels: int = 10 # Number of media channels
+  n_time: int = 156 # Number of periods
+  n_geo: int = 1 # Number of geos
+  seed: int = 0 # Seed used to generate the data and response curves
+  
+  @property
+  def name(self) -> str:
+    return f"c{self.n_channels}_t{self.n_time}_g{self.n_geo}_s{self.seed}"
+  
+  def write(
+    self, 
+    path: str|Path # Directory to write the model and optimizer config files to
+  ) -> Path: # Directory of the scenario
+    "Write the scenario as a model directory that is also an optimizer config directory"
+    path = Path(path)/self.name
+    path.mkdir(parents=True, exist_ok=True)
+    (path/"scenario.json").write_text(json.dumps(asdict(self)))
+    (path/"model_config.py").write_text(_MODEL_CONFIG)
+    (path/"optimizer_config.py").write_text(_OPTIMIZER_CONFIG)
+    initial_budget = synthetic_initial_budget(generate_synthetic_model(self))
+    (path/"optimizer_config.yaml").write_text(json.dumps(
+      {"initial_budget": initial_budget, "loss_fn_kwargs": {}}, indent=2))
+    return path
+  
+  def bounds(
+    self, 
+    path: str|Path, # Directory the scenario was written to
+    spread: float = .2 # Relative distance of the bounds from the initial budget
+  ) -> dict[str, tuple[float, float]]: # Bounds per channel
+    "Bounds around the initial budget"
+    initial_budget = load_config_yaml(Path(path)/"optimizer_config.yaml")["initial_budget"]
+    return {key: ((1 - spread)*value, (1 + spread)*value) for key, value in initial_budget.items()}
+
+# %% ../nbs/01_bench.ipynb 9
+def generate_synthetic_model(scenario: Scenario) -> SyntheticModel:
+  "Generate the data and response curves of a scenario"
+  rng = np.random.default_rng(scenario.seed)
+  channels = [f"channel_{i}" for i in range(scenario.n_channels)]
+  coords = {"geo": np.arange(scenario.n_geo), "time": np.arange(scenario.n_time)}
+  scale = rng.lognormal(2, .5, size=scenario.n_channels)
+  data = xr.Dataset({
+    channel: (("geo", "time"), rng.lognormal(np.log(s), .3, size=(scenario.n_geo, scenario.n_time)))
+    for channel, s in zip(channels, scale)}, coords=coords)
+  beta = dict(zip(channels, rng.uniform(.5, 2., size=scenario.n_channels)))
+  half_saturation = dict(zip(channels, scale*rng.uniform(.5, 2., size=scenario.n_channels)))
+  return SyntheticModel(data, beta, half_saturation)
+
+def synthetic_initial_budget(model: SyntheticModel) -> dict[str, float]:
+  "Total spend of each channel in the synthetic data"
+  return {channel: float(model.data[channel].sum()) for channel in model.data.data_vars}
+
+# %% ../nbs/01_bench.ipynb 10
+def load_synthetic_model(path: str|Path) -> SyntheticModel:
+  "`model_loader` of a written scenario"
+  model = generate_synthetic_model(Scenario(**json.loads((Path(path)/"scenario.json").read_text())))
+  model.initial_budget = synthetic_initial_budget(model)
+  return model
+
+def synthetic_budget_to_data(budget: BudgetType, model: SyntheticModel) -> xr.Dataset:
+  "`budget_to_data` of a written scenario"
+  data = model.data.copy()
+  for key, value in budget.items():
+    data[key] = value/model.initial_budget[key]*data[key]
+  return data
+
+def synthetic_budget_to_multipliers(budget: BudgetType, model: SyntheticModel) -> dict:
+  "`budget_to_multipliers` of a written scenario"
+  return budget_multipliers(budget, model.initial_budget)
+
+# %% ../nbs/01_bench.ipynb 14
+def _timed(fn, *args):
+  start = time.perf_counter()
+  result = fn(*args)
+  return result, time.perf_counter() - start
+
+def _random_budgets(
+  bounds: dict[str, tuple[float, float]], # Bounds per channel
+  n: int, # Number of budgets
+  seed: int # Seed for the draws
+) -> list[dict[str, float]]:
+  rng = np.random.default_rng(seed)
+  lower, upper = np.array(list(bounds.values())).T
+  return [dict(zip(bounds, row)) for row in rng.uniform(lower, upper, size=(n, len(bounds)))]
+
+# %% ../nbs/01_bench.ipynb 15
+def bench_model(
+  model: BaseBudgetModel, # Model to benchmark
+  optimizer, # Optimizer providing the loss function
+  bounds: dict[str, tuple[float, float]], # Bounds the random budgets are drawn from
+  n_evals: int = 50, # Number of evaluations
+  batch_size: int = 25, # Number of budgets per batched call
+  seed: int = 0, # Seed for the random budgets
+) -> dict:
+  "Throughput, per-stage timings and peak memory of a model evaluation"
+  budgets = _random_budgets(bounds, n_evals, seed)
+  kwargs = optimizer._config["loss_fn_kwargs"]
+  stages = {"budget_to_data": 0., "predict": 0., "loss_fn": 0.}
+  start = time.perf_counter()
+  for budget in budgets:
+    data, seconds = _timed(model._input_data, budget)
+    stages["budget_to_data"] += seconds
+    prediction, seconds = _timed(model._model.predict, data)
+    stages["predict"] += seconds
+    _, seconds = _timed(lambda: float(optimizer._loss_fn(prediction, **kwargs)))
+    stages["loss_fn"] += seconds
+  total = time.perf_counter() - start
+  _, batch_seconds = _timed(
+    lambda: [optimizer._budget_losses(budgets[i:i + batch_size]) for i in range(0, n_evals, batch_size)])
+  tracemalloc.start()
+  optimizer._budget_losses(budgets[:1])
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return {
+    "evals_per_sec": n_evals/total,
+    "batch_evals_per_sec": n_evals/batch_seconds,
+    "stage_seconds": {stage: seconds/n_evals for stage, seconds in stages.items()},
+    "peak_memory_bytes": peak}
+
+# %% ../nbs/01_bench.ipynb 16
+class _LossRecorder:
+  "Wrap an evaluation method of an optimizer to record the time and loss of every budget it evaluates"
+  def __init__(
+    self, 
+    fn, # Method returning the loss, or the losses, of the evaluated budgets
+    sign: float = 1. # -1 for methods returning the objective of a maximized study
+  ):
+    self.fn = fn
+    self.sign = sign
+    self.start = time.perf_counter()
+    self.history: list[tuple[float, float]] = []
+  
+  def __call__(self, *args, **kwargs):
+    result = self.fn(*args, **kwargs)
+    seconds = time.perf_counter() - self.start
+    self.history.extend((seconds, self.sign*float(loss)) for loss in np.atleast_1d(result))
+    return result
+  
+  def time_to_target(
+    self, 
+    target_loss: float|None, # Loss to reach
+    rtol: float = 1e-3 # Relative tolerance on `target_loss`
+  ) -> float|None: # Seconds until a loss within `rtol` of the target was evaluated, None if never
+    if target_loss is None:
+      return None
+    threshold = target_loss + rtol*abs(target_loss)
+    return next((t for t, loss in self.history if loss <= threshold), None)
+
+# %% ../nbs/01_bench.ipynb 17
+def _run_optimizer(
+  name: str, # "scipy", "optuna" or "population"
+  model: BaseBudgetModel, # Model to optimize
+  config_path: str|Path, # Path to the optimizer config files
+  bounds: dict[str, tuple[float, float]], # Bounds per channel
+  total: float, # Total budget
+  n_trials: int = 100, # Number of trials of the optuna optimizer, also bounds the population evaluations
+  seed: int = 0, # Seed of the optuna sampler and the population
+) -> tuple[dict, _LossRecorder]:
+  "Run an optimizer, recording the losses of the iterates, trials or population members it evaluates"
+  if name == "scipy":
+    import scipy.optimize as opt
+    optimizer = ScipyBudgetOptimizer(model, config_path)
+    run = lambda: optimizer.optimize(
+      list(bounds.values()), opt.LinearConstraint(np.ones((1, len(bounds))), total, total),
+      init_pos=np.array([sum(b)/2 for b in bounds.values()]))
+  elif name == "optuna":
+    import optuna
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    optimizer = OptunaBudgetOptimizer(model, config_path, storage=None, sampler_kwargs={"seed": seed})
+    run = lambda: optimizer.optimize(bounds, (total, total), n_trials=n_trials, timeout=None)
+  elif name == "population":
+    optimizer = PopulationBudgetOptimizer(model, config_path)
+    popsize = max(8, 4*len(bounds))
+    run = lambda: optimizer.optimize(
+      list(bounds.values()), (total, total), popsize=popsize, seed=seed, 
+      max_generations=max(1, n_trials//popsize)) # about as many evaluations as the optuna trials
+  else:
+    raise ValueError(f"Unknown optimizer {name}")
+  # not the finite-difference steps of scipy, which can leave the feasible set
+  method, sign = {"scipy": ("_optimizer_fn", 1.), "optuna": ("_opt_fn", -1.), "population": ("_batch_loss", 1.)}[name]
+  recorder = _LossRecorder(getattr(optimizer, method), sign)
+  setattr(optimizer, method, recorder)
+  _, seconds = _timed(run)
+  losses = [loss for _, loss in recorder.history]
+  return {
+    "seconds": seconds,
+    "evaluations": len(losses),
+    "evals_per_sec": len(losses)/seconds,
+    "best_loss": min(losses),
+    "loss": float(optimizer._prediction_loss(optimizer.optimal_prediction))}, recorder
+
+def bench_optimizer(
+  name: str, # "scipy", "optuna" or "population"
+  model: BaseBudgetModel, # Model to optimize
+  config_path: str|Path, # Path to the optimizer config files
+  bounds: dict[str, tuple[float, float]], # Bounds per channel
+  total: float, # Total budget
+  target_loss: float|None = None, # Loss to reach for `time_to_target`, the final loss of the optimizer if None
+  target_rtol: float = 1e-3, # Relative tolerance on `target_loss`
+  n_trials: int = 100, # Number of trials of the optuna optimizer, also bounds the population evaluations
+  seed: int = 0, # Seed of the optuna sampler and the population
+) -> dict:
+  "Wall time, evaluation count, best and final loss and time to get within `target_rtol` of `target_loss` of an optimizer"
+  result, recorder = _run_optimizer(name, model, config_path, bounds, total, n_trials, seed)
+  target_loss = result["loss"] if target_loss is None else target_loss
+  return dict(result, time_to_target=recorder.time_to_target(target_loss, target_rtol))
+
+# %% ../nbs/01_bench.ipynb 19
+_HEAVY_MODULES = ("scipy.optimize", "scipy.interpolate", "optuna", "matplotlib") # backends loaded lazily
+
+def bench_import(
+  module: str = "budget_optimizer.optimizer", # Module to import
+  repeat: int = 3, # Number of fresh interpreters, the median time is reported
+) -> dict:
+  "Import time of a module and the heavy backends it executes"
+  code = "\n".join([
+    "import json, sys, time",
+    "start = time.perf_counter()",
+    f"import {module}",
+    "seconds = time.perf_counter() - start",
+    f"loaded = [name for name in {_HEAVY_MODULES!r} if any(m.startswith(name + '.') for m in sys.modules)]",
+    "print(json.dumps({'seconds': seconds, 'loaded': loaded}))"])
+  runs = [
+    json.loads(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+    for _ in range(repeat)]
+  return {"seconds": float(np.median([run["seconds"] for run in runs])), "loaded": runs[0]["loaded"]}
+
+# %% ../nbs/01_bench.ipynb 21
+def run_benchmarks(
+  scenarios: list[Scenario], # Scenarios to benchmark
+  path: str|Path, # Directory the scenarios are written to
+  optimizers: tuple[str, ...] = ("scipy", "optuna"), # Optimizers to benchmark
+  n_evals: int = 50, # Number of model evaluations
+  n_trials: int = 100, # Number of trials of the optuna optimizer
+  target_rtol: float = 1e-3, # Relative tolerance on the best final loss for `time_to_target`
+) -> dict: # JSON serializable results
+  "Benchmark models and optimizers on every scenario"
+  results = {
+    "version": budget_optimizer.__version__, 
+    "python": platform.python_version(), 
+    "import": bench_import(),
+    "scenarios": {}}
+  for scenario in scenarios:
+    scenario_path = scenario.write(path)
+    model = BaseBudgetModel(scenario.name, "prediction", scenario_path)
+    bounds = scenario.bounds(scenario_path)
+    total = sum(sum(bound)/2 for bound in bounds.values())
+    result = {
+      "scenario": asdict(scenario),
+      "model": bench_model(model, ScipyBudgetOptimizer(model, scenario_path), bounds, n_evals),
+      "optimizers": {}}
+    runs = {name: _run_optimizer(name, model, scenario_path, bounds, total, n_trials) for name in optimizers}
+    # the best feasible solution of any optimizer is the target all of them are timed against
+    result["target_loss"] = min(run["loss"] for run, _ in runs.values())
+    for name, (run, recorder) in runs.items():
+      result["optimizers"][name] = dict(run, time_to_target=recorder.time_to_target(result["target_loss"], target_rtol))
+    results["scenarios"][scenario.name] = result
+  return results
+
+# %% ../nbs/01_bench.ipynb 25
+_HIGHER_IS_BETTER = ("evals_per_sec", "batch_evals_per_sec")
+_LOWER_IS_BETTER = ("seconds", "time_to_target", "peak_memory_bytes", "budget_to_data", "predict", "loss_fn")
+
+def _flatten(results: dict, prefix: str = "") -> dict[str, float]:
+  flat = {}
+  for key, value in results.items():
+    if isinstance(value, dict):
+      flat.update(_flatten(value, f"{prefix}{key}."))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+      flat[f"{prefix}{key}"] = value
+  return flat
+
+# %% ../nbs/01_bench.ipynb 26
+def compare_to_baseline(
+  results: dict, # Results of `run_benchmarks`
+  baseline: dict, # Stored results of a known-good version
+  tolerance: float = .2, # Allowed relative change in the wrong direction
+) -> list[dict]: # One entry per regressed metric
+  "Find the metrics that regressed against a baseline"
+  current, reference = _flatten(results), _flatten(baseline)
+  regressions = []
+  for key, value in current.items():
+    metric, base = key.rsplit(".", 1)[-1], reference.get(key)
+    if not base:
+      continue
+    change = (value - base)/abs(base)
+    if (metric in _HIGHER_IS_BETTER and change < -tolerance) or (metric in _LOWER_IS_BETTER and change > tolerance):
+      regressions.append({"metric": key, "baseline": base, "current": value, "change": change})
+  return regressions
+
+# %% ../nbs/01_bench.ipynb 30
+@call_parse
+def bench_cli(
+  channels: Param("Comma separated numbers of channels", str) = "5,20",
+  periods: Param("Number of periods", int) = 156,
+  geos: Param("Number of geos", int) = 1,
+  seed: Param("Seed of the synthetic scenarios", int) = 0,
+  optimizers: Param("Comma separated optimizers to benchmark", str) = "scipy,optuna",
+  n_evals: Param("Number of model evaluations", int) = 50,
+  n_trials: Param("Number of trials of the optuna optimizer", int) = 100,
+  path: Param("Directory the scenarios are written to", str) = "bench_scenarios",
+  out: Param("Write the results to this JSON file", str) = None,
+  baseline: Param("Compare the results to this JSON file", str) = None,
+  tolerance: Param("Allowed relative regression", float) = .2,
+):
+  "Benchmark models and optimizers on synthetic scenarios"
+  scenarios = [Scenario(int(n), periods, geos, seed) for n in channels.split(",")]
+  results = run_benchmarks(scenarios, path, tuple(optimizers.split(",")), n_evals, n_trials)
+  output = json.dumps(results, indent=2)
+  if out is None:
+    print(output)
+  else:
+    Path(out).write_text(output)
+  if baseline is not None:
+    regressions = compare_to_baseline(results, json.loads(Path(baseline).read_text()), tolerance)
+    for regression in regressions:
+      print(f"REGRESSION {regression['metric']}: {regression['baseline']:.4g} -> {regression['current']:.4g}", file=sys.stderr)
+    if regressions:
+      sys.exit(1)
@@ -2,30 +2,47 @@
 
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_optimizer.ipynb.
 
+# %% ../nbs/00_optimizer.ipynb 5
+from __future__ import annotations
+
 # %% auto 0
-__all__ = ['BaseOptimizer', 'ScipyBudgetOptimizer', 'OptunaBudgetOptimizer']
+__all__ = ['BaseOptimizer', 'ScipyBudgetOptimizer', 'PopulationBudgetOptimizer', 'optuna_storage', 'OptunaBudgetOptimizer',
+           'Incumbent', 'OptimizationCancelled', 'OptimizationProgress']
 
-# %% ../nbs/00_optimizer.ipynb 5
+# %% ../nbs/00_optimizer.ipynb 6
 import numpy as np
 import xarray as xr
 import pandas as pd
-import scipy.optimize as opt
-import optuna
 
 from .utils.model_classes import BaseBudgetModel
 from budget_optimizer.utils.model_helpers import (
-  load_module,
-  load_yaml,
+  load_config_module,
+  load_config_yaml,
   BudgetType, 
-  AbstractModel
+  AbstractModel,
+  CANDIDATE_DIM,
+  to_scalar,
+  lazy_import
 )
-from .utils.search_space_helper import ConstrainedSearchSpace
+from .utils.search_space_helper import ConstrainedSearchSpace, project_budgets
+from .utils.instrumentation import Instrumentation, NULL_INSTRUMENTATION
 from pathlib import Path
+from itertools import repeat
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from collections.abc import Iterator
+import threading
+import time
 
-# %% ../nbs/00_optimizer.ipynb 6
+# %% ../nbs/00_optimizer.ipynb 7
+opt = lazy_import("scipy.optimize") # loaded by the first optimizer that solves
+optuna = lazy_import("optuna") # loaded by `OptunaBudgetOptimizer` only
+
+# %% ../nbs/00_optimizer.ipynb 8
 class BaseOptimizer(ABC):
-    """Optimizer wrapper for the pyswarms package"""
+    """Base class of the optimizers, evaluating the loss of budgets with a model"""
     _CONFIG_YAML = 'optimizer_config.yaml'
     _MODULE_FILE = "optimizer_config.py"
     
@@ -41,34 +58,417 @@ class BaseOptimizer(ABC):
         self.optimal_prediction: xr.DataArray = None
         self.optimal_contribution: xr.Dataset = None
         self.sol = None
+        self._instrumentation = NULL_INSTRUMENTATION
+        self.mp_context = None # multiprocessing context of the worker pools, the platform default if None
+        self.risk_aversion: float = 0. # weight of the standard deviation of the per-draw losses of posterior predictions
+        self.risk_quantile: float|None = None # optimize this quantile of the per-draw losses instead
+        self.progress: OptimizationProgress|None = None # progress of the running `optimize_iter`
+        self.timed_out = False # the last run stopped at its timeout before finishing
+        self._last_evaluation: tuple[np.ndarray|None, float|None] = (None, None) # reused by one-sided differences
         self._config = self._load_config()
-        self._loss_fn = self._load_loss_fn()
-        self._optimizer_array_to_budget = self._load_optimizer_array_to_budget()
+        self._bind_config()
         
-    def _load_config(self):
-        config = load_yaml(self._config_path / self._CONFIG_YAML)
+    def _load_config(self, reload: bool = False):
+        config = load_config_yaml(self._config_path / self._CONFIG_YAML, reload)
         return config
     
-    def reload_config(self):
-        self._config = self._load_config()
+    def _config_module(self, reload: bool = False):
+        """The config module, executed once per process and shared through `CONFIG_REGISTRY`"""
+        return load_config_module(self._config_path / self._MODULE_FILE, reload)
+    
+    def _process_pool(
+        self, 
+        max_workers: int, # Number of worker processes
+        optimizer_cls: type|None = None, # Optimizer class built in each worker
+        cache_path: str|Path|None = None # Prediction cache file shared by the workers
+        ) -> ProcessPoolExecutor:
+        """Worker pool building one optimizer per process, from shared memory if `model.share_memory()` was called"""
+        return ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=self.mp_context, initializer=_init_worker,
+            initargs=(self.model, self._config_path, self._config, optimizer_cls, cache_path, self._worker_state()))
+    
+    def _worker_state(self) -> dict:
+        """Settings of this optimizer and its model that are not pickled with the model, applied in every worker"""
+        instrumentation = self._instrumentation
+        return {
+            "risk_aversion": self.risk_aversion, "risk_quantile": self.risk_quantile,
+            "n_draws": getattr(self.model, "n_draws", None), "draw_seed": getattr(self.model, "_draw_seed", 0),
+            "track_allocations": instrumentation.track_allocations if instrumentation.enabled else None}
+    
+    def _map_workers(self, pool: ProcessPoolExecutor, report, fn, *iterables) -> list:
+        """`pool.map` of a worker function, calling `report` on each result as it completes and cancelling the calls not started if it raises"""
+        futures = [pool.submit(_worker_call, fn, *args) for args in zip(*iterables)]
+        results = {}
+        try:
+            for future in as_completed(futures):
+                results[future] = self._from_worker(future.result())
+                report(results[future])
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return [results[future] for future in futures]
+    
+    def _from_worker(self, output: tuple):
+        """Result of `_worker_call`, merging the statistics of the worker into the instrumentation of this optimizer"""
+        result, drained = output
+        if drained is not None and self._instrumentation.enabled:
+            self._instrumentation.merge(drained)
+        return result
+    
+    def _bind_config(self):
+        """Bind the functions defined in the config module"""
+        self._loss_fn = self._load_loss_fn()
+        self._optimizer_array_to_budget = self._load_optimizer_array_to_budget()
+        self._loss_fn_grad = self._load_optional("loss_fn_grad")
+        self._hessp = self._load_optional("hessp")
+        self._loss_window = self._load_optional("loss_window")
+        self._draw_loss_fn = self._load_optional("draw_loss_fn")
+    
+    def reload_config(
+        self,
+        reload_modules: bool = False # Also execute the config module again and rebind its functions
+        ):
+        """Read the configuration files again"""
+        self._config = self._load_config(reload=True)
+        if reload_modules:
+            self._config_module(reload=True)
+            self._bind_config()
         return self
     
     def _load_loss_fn(self):
         """Load the loss function from the config file"""
-        module = load_module(self._MODULE_FILE.replace(".py", ""), self._config_path / self._MODULE_FILE)
+        module = self._config_module()
         return module.loss_fn
     
     def _load_optimizer_array_to_budget(self):
         """Convert the optimizer array to a budget"""
-        module = load_module(self._MODULE_FILE.replace(".py", ""), self._config_path / self._MODULE_FILE)
+        module = self._config_module()
         return module.optimizer_array_to_budget
     
+    def _load_optional(self, name: str):
+        """Load an optional function from the config file, None if it is not defined"""
+        module = self._config_module()
+        return getattr(module, name, None)
+    
+    def instrument(
+        self,
+        instrumentation: Instrumentation|None = None # Instrumentation to report to, a new one if None
+        ) -> Instrumentation:
+        """Time the stages of every evaluation of the optimizer and its model"""
+        self._instrumentation = self.model.instrument(instrumentation)
+        return self._instrumentation
+    
+    def uninstrument(self):
+        """Stop reporting to the instrumentation"""
+        self._instrumentation = NULL_INSTRUMENTATION
+        self.model.uninstrument()
+        return self
+    
+    def _array_channels(self, n_dims: int) -> list[str]:
+        """Channels of the budgets built from optimizer arrays of length `n_dims`, in array order"""
+        return list(self._optimizer_array_to_budget(np.zeros(n_dims)).keys())
+    
+    def _window(self) -> dict[str, slice]|None:
+        """Coordinates of the prediction the loss depends on, None if `loss_window` is not defined"""
+        if self._loss_window is None:
+            return None
+        return self._loss_window(**self._config['loss_fn_kwargs'])
+    
     def _optimizer_fn(self, x: np.ndarray):
         """Optimizer step"""
+        instrumentation = self._instrumentation
+        with instrumentation.evaluation():
+            with instrumentation.stage("array_to_budget"):
+                budget = self._optimizer_array_to_budget(x)
+            prediction = self.model.predict(budget, window=self._window())
+            with instrumentation.stage("loss_fn"):
+                loss = self._prediction_loss(prediction)
+        self._last_evaluation = (np.array(x, dtype=float), loss)
+        self._observe([budget], [loss])
+        return loss
+    
+    def _batch_loss(self, xs: np.ndarray) -> np.ndarray:
+        """Loss of every row of `xs`, predicted in a single batched model call"""
+        budgets = [self._optimizer_array_to_budget(x) for x in xs]
+        losses = self._budget_losses(budgets)
+        self._observe(budgets, losses)
+        return losses
+    
+    def _budget_losses(self, budgets: list[BudgetType]) -> np.ndarray:
+        """Loss of every budget, predicted in a single batched model call"""
+        instrumentation = self._instrumentation
+        with instrumentation.evaluation():
+            predictions = self.model.predict_batch(budgets, window=self._window())
+            with instrumentation.stage("loss_fn"):
+                return np.array([
+                    self._prediction_loss(predictions.isel({CANDIDATE_DIM: i}, drop=True))
+                    for i in range(len(budgets))])
+    
+    def _uses_draw_losses(self) -> bool:
+        """Whether losses are statistics of the per-draw losses of posterior predictions"""
+        return getattr(self.model, "draw_dim", None) is not None and (
+            self.risk_aversion != 0 or self.risk_quantile is not None or self.model.n_draws is not None)
+    
+    def _draw_losses(self, prediction: xr.DataArray) -> np.ndarray:
+        """Loss of each posterior draw of a prediction, in one call if the config defines `draw_loss_fn`"""
+        dim = self.model.draw_dim
+        if self._draw_loss_fn is not None:
+            return np.asarray(self._draw_loss_fn(prediction, dim, **self._config['loss_fn_kwargs']), dtype=float)
+        return np.array([
+            to_scalar(self._loss_fn(prediction.isel({dim: i}), **self._config['loss_fn_kwargs'])) 
+            for i in range(prediction.sizes[dim])])
+    
+    def _prediction_loss(self, prediction: xr.DataArray) -> float:
+        """Loss of a prediction, the mean plus `risk_aversion` standard deviations or the `risk_quantile` of its per-draw losses"""
+        if not self._uses_draw_losses() or self.model.draw_dim not in prediction.dims:
+            return to_scalar(self._loss_fn(prediction, **self._config['loss_fn_kwargs']))
+        losses = self._draw_losses(prediction)
+        if self.risk_quantile is not None:
+            return float(np.quantile(losses, self.risk_quantile))
+        return float(losses.mean() + self.risk_aversion*losses.std(ddof=1))
+    
+    def _warm_kwargs(self, kwargs: dict) -> dict:
+        """Arguments of `optimize` starting from the last solution, used between rounds of `optimize_posterior`"""
+        return kwargs
+    
+    def _observe(self, budgets: list[BudgetType], losses: np.ndarray, evaluations: int|None = None):
+        """Report evaluated budgets to the running `optimize_iter`"""
+        if self.progress is not None:
+            self.progress.update(budgets, losses, evaluations)
+    
+    def _observe_solutions(self, solutions: opt.OptimizeResult|list[opt.OptimizeResult]):
+        """Report local solves of a worker process with the number of evaluations they took"""
+        solutions = solutions if isinstance(solutions, list) else [solutions]
+        self._observe(
+            [self._optimizer_array_to_budget(sol.x) for sol in solutions], [sol.fun for sol in solutions], 
+            sum(sol.nfev for sol in solutions))
+    
+    def _run_progress(self, progress: OptimizationProgress, method: str, args: tuple, kwargs: dict):
+        try:
+            getattr(self, method)(*args, **kwargs)
+        except OptimizationCancelled:
+            progress.stopped = True
+        except Exception as e:
+            progress.error = e
+        finally:
+            progress.finish()
+    
+    def optimize_iter(
+        self,
+        *args, # Arguments of `method`
+        method: str = "optimize", # Optimization method to run, e.g. "optimize_multistart" or "optimize_posterior"
+        progress: OptimizationProgress|None = None, # Progress to report to, lets another thread cancel the run
+        **kwargs # Keyword arguments of `method`
+        ) -> Iterator[Incumbent]:
+        """Run `method` in a background thread and yield every new incumbent, closing the iterator cancels the run"""
+        progress = OptimizationProgress() if progress is None else progress
+        self.progress = progress
+        thread = threading.Thread(target=self._run_progress, args=(progress, method, args, kwargs), daemon=True)
+        thread.start()
+        incumbent = None
+        try:
+            while True:
+                if (new := progress.wait(incumbent)) is not incumbent:
+                    incumbent = new
+                    yield incumbent
+                elif progress.finished:
+                    break
+        finally:
+            if not progress.finished:
+                progress.cancel()
+            thread.join()
+            self.progress = None
+            if progress.stopped and progress.incumbent is not None: # stopped early, the incumbent is the solution
+                self.optimal_budget = progress.incumbent.budget
+                self.optimal_prediction = self.model.predict(self.optimal_budget)
+        if progress.error is not None:
+            raise progress.error
+    
+    def optimize_posterior(
+        self,
+        *args, # Arguments of `optimize`
+        n_draws: int = 16, # Number of posterior draws of the first round
+        max_draws: int|None = None, # Largest number of draws, all of them if None
+        growth: float = 2., # Factor by which the draws grow between rounds
+        rtol: float = 1e-2, # Stop when no channel moved by more than this fraction of the total budget
+        z: float = 2., # Number of standard errors under which two optima are statistically tied
+        seed: int = 0, # Seed of the draw subsets
+        **kwargs # Keyword arguments of `optimize`
+        ):
+        """Optimize on a growing common-random-numbers subset of posterior draws and predict the optimum with the full posterior"""
+        total = self.model.posterior_draws
+        if total is None:
+            raise ValueError("The model does not declare POSTERIOR_DRAWS")
+        max_draws = total if max_draws is None else min(max_draws, total)
+        n, previous, self.draw_history = min(n_draws, max_draws), None, []
+        try:
+            while True:
+                self.model.use_draws(n, seed)
+                self.optimize(*args, **kwargs)
+                budget = dict(self.optimal_budget)
+                prediction = self.model.predict(budget, window=self._window())
+                losses = self._draw_losses(prediction)
+                record = {"n_draws": n, "loss": self._prediction_loss(prediction),
+                          "std_error": losses.std(ddof=1)/np.sqrt(n), "moved": np.nan, "tied": False}
+                if previous is not None:
+                    x, x_previous = np.array(list(budget.values())), np.array([previous[name] for name in budget])
+                    record["moved"] = np.abs(x - x_previous).max()/np.abs(x).sum()
+                    differences = self._draw_losses(self.model.predict(previous, window=self._window())) - losses
+                    record["tied"] = bool(np.abs(differences.mean()) <= z*differences.std(ddof=1)/np.sqrt(n))
+                self.draw_history.append(record)
+                if n >= max_draws or record["moved"] <= rtol:
+                    break
+                # optima that are tied on the current draws but far apart need many more draws to be told apart
+                n = min(int(np.ceil(n*growth**(2 if record["tied"] else 1))), max_draws)
+                previous, kwargs = budget, self._warm_kwargs(kwargs)
+        finally:
+            self.model.use_draws()
+        self.optimal_prediction = self.model.predict(self.optimal_budget)
+        return self
+    
+    @property
+    def has_analytic_jac(self) -> bool:
+        "Whether both `loss_fn_grad` and the model's `predict_jac` are available"
+        return self._loss_fn_grad is not None and self.model.has_jac and not self._uses_draw_losses()
+    
+    def _optimizer_jac(
+        self, 
+        x: np.ndarray, # Point at which to differentiate
+        bounds: list[tuple[float, float]]|None = None # Bounds the finite differences stay inside
+        ) -> np.ndarray:
+        """Gradient of the loss with respect to the optimizer array"""
+        if not self.has_analytic_jac:
+            return self._finite_difference_jac(x, bounds)
         budget = self._optimizer_array_to_budget(x)
         prediction = self.model.predict(budget)
-        loss = self._loss_fn(prediction, **self._config['loss_fn_kwargs'])
-        return loss
+        loss_grad = self._loss_fn_grad(prediction, **self._config['loss_fn_kwargs'])
+        prediction_jac = self.model.predict_jac(budget)
+        grad = (loss_grad*prediction_jac).sum([dim for dim in prediction_jac.dims if dim != "channel"])
+        return np.array([float(grad.sel(channel=name)) for name in budget.keys()])
+    
+    def _finite_difference_jac(
+        self, 
+        x: np.ndarray, # Point at which to differentiate
+        bounds: list[tuple[float, float]]|None = None, # Bounds the perturbed points stay inside
+        rel_step: float = 1e-6 # Step relative to the magnitude of `x`
+        ) -> np.ndarray:
+        """
+        Finite-difference gradient evaluated in one batched call, central if the model batches its predictions
+        and one-sided towards the inside of the bounds at active bounds or otherwise
+        """
+        x = np.asarray(x, dtype=float)
+        n = len(x)
+        steps = rel_step*np.maximum(1., np.abs(x))
+        lows, highs = (np.full(n, -np.inf), np.full(n, np.inf)) if bounds is None else np.array(bounds, dtype=float).T
+        forward = x + steps <= highs
+        central = forward & (x - steps >= lows) & getattr(self.model, "has_batch", True)
+        signs = np.where(forward, 1., -1.)
+        last_x, f_x = self._last_evaluation
+        f_x = f_x if last_x is not None and np.array_equal(last_x, x) else None # loss at x, already evaluated by `fun`
+        points = [x + np.diag(signs*steps), x - np.diag(steps)[central]]
+        if f_x is None and not central.all():
+            points.append(x[None])
+        budgets = [self._optimizer_array_to_budget(point) for point in np.concatenate(points)]
+        losses = self._budget_losses(budgets)
+        self._observe([], [], len(budgets)) # count the evaluations, the perturbed points can violate the constraints
+        ahead, behind = losses[:n], losses[n:n + central.sum()]
+        f_x = losses[-1] if f_x is None and not central.all() else f_x
+        grad = np.empty(n)
+        grad[central] = (ahead[central] - behind)/(2*steps[central])
+        grad[~central] = signs[~central]*(ahead[~central] - f_x)/steps[~central]
+        return grad
+    
+    def _optimizer_hessp(self, x: np.ndarray, p: np.ndarray) -> np.ndarray:
+        """Hessian of the loss times `p`"""
+        return self._hessp(x, p, self.model, **self._config['loss_fn_kwargs'])
+    
+    def _set_solution(self, sol: opt.OptimizeResult):
+        """Store the solution and the model outputs at the optimal budget"""
+        self.sol = sol
+        self.optimal_budget = self._optimizer_array_to_budget(self.sol.x)
+        self.optimal_prediction = self.model.predict(self.optimal_budget) # The optimizer minimizes the cost, so we need to negate it
+        self.optimal_contribution = self.model.contributions(self.optimal_budget)
+    
+    def _solve_total(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        total: float, # Total budget
+        init_pos: np.ndarray, # Starting point
+        **kwargs # Arguments of the solver
+        ) -> opt.OptimizeResult:
+        """Optimize at one total budget, used by `frontier`"""
+        raise NotImplementedError(f"{type(self).__name__} does not support frontier")
+    
+    def _continuation(
+        self,
+        totals: np.ndarray, # Increasing total budgets
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        init_pos: np.ndarray, # Starting point of the first total
+        **kwargs # Arguments of `_solve_total`
+        ) -> list[opt.OptimizeResult]:
+        """Solve each total starting from the solution of the previous one, rescaled to the new total"""
+        lows, highs = np.array(bounds, dtype=float).T
+        x, solutions = np.asarray(init_pos, dtype=float), []
+        for total in totals:
+            x0 = project_budgets(x*total/max(x.sum(), 1e-12), lows, highs, (total, total))[0]
+            sol = self._solve_total(bounds, total, x0, **kwargs)
+            sol.init_pos = x0
+            solutions.append(sol)
+            x = sol.x if sol.success else x0
+        return solutions
+    
+    def frontier(
+        self,
+        totals: list[float]|np.ndarray, # Total budgets to optimize
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        init_pos: np.ndarray|None = None, # Starting point of the smallest total, defaults to the middle of the bounds
+        n_workers: int = 1, # Number of worker processes, each solving a contiguous chunk of totals
+        cache_path: str|Path|None = None, # Sqlite prediction cache shared by this process and the workers
+        channel_roi: bool = True, # Also compute the marginal ROI of each channel at each total
+        **kwargs # Arguments of the solver at each total
+        ) -> xr.Dataset: # Optimal budget, loss, prediction and marginal ROI per total
+        """Optimal allocations over a grid of total budgets, warm starting each total from its neighbour"""
+        totals = np.sort(np.asarray(totals, dtype=float))
+        lows, highs = np.array(bounds, dtype=float).T
+        init_pos = (lows + highs)/2 if init_pos is None else np.asarray(init_pos, dtype=float)
+        previous_cache = getattr(self.model, "_cache", None)
+        if cache_path is not None:
+            self.model.enable_cache(path=cache_path)
+        try:
+            chunks = [chunk for chunk in np.array_split(totals, n_workers) if len(chunk)]
+            if len(chunks) == 1:
+                solutions = self._continuation(totals, bounds, init_pos, **kwargs)
+            else:
+                with self._process_pool(len(chunks), type(self), cache_path) as pool:
+                    solutions = [
+                        sol for chunk in self._map_workers(
+                            pool, self._observe_solutions, _worker_frontier, chunks, repeat(bounds), repeat(init_pos), repeat(kwargs)) 
+                        for sol in chunk]
+            channels = self._array_channels(len(bounds))
+            budgets = np.array([sol.x for sol in solutions])
+            losses = np.array([float(sol.fun) for sol in solutions])
+            predictions = self.model.predict_batch(budgets, channels, window=self._window())
+            frontier = xr.Dataset(
+                {
+                    "budget": (("total", "channel"), budgets),
+                    "loss": ("total", losses),
+                    "success": ("total", np.array([bool(sol.success) for sol in solutions])),
+                    "prediction": predictions.rename({CANDIDATE_DIM: "total"}),
+                    # change of the objective per unit of extra total budget
+                    "marginal_roi": ("total", np.gradient(-losses, totals) if len(totals) > 1 else np.full(1, np.nan)),
+                },
+                coords={"total": totals, "channel": channels})
+            if channel_roi:
+                frontier["channel_marginal_roi"] = (("total", "channel"), -np.array([self._optimizer_jac(x, bounds) for x in budgets]))
+            return frontier
+        finally:
+            if cache_path is not None: # the model keeps the cache it had before
+                self.model._cache.close()
+                if previous_cache is None:
+                    self.model.disable_cache()
+                else:
+                    self.model.enable_cache(cache=previous_cache)
     
     @abstractmethod
     def optimize(
@@ -80,51 +480,323 @@ class BaseOptimizer(ABC):
         """Optimize the model"""
         raise NotImplementedError("This method should be implemented in the child class")
 
-# %% ../nbs/00_optimizer.ipynb 7
+# %% ../nbs/00_optimizer.ipynb 9
 class ScipyBudgetOptimizer(BaseOptimizer):
-    """Optimizer wrapper for the pyswarms package"""
+    """Optimizer wrapper for scipy's trust-constr local solver"""
     
-    def optimize(
-        self, 
+    def _minimize(
+        self,
+        init_pos: np.ndarray, # Initial position of the optimizer
         bounds: list[tuple[float, float]], # Bounds for the optimizer
         constraints: None|opt.LinearConstraint, # Constraints for the optimizer
-        init_pos: np.ndarray, # Initial position of the optimizer
-        ):
-        """Optimize the model"""
+        use_jac: bool = True, # Use the analytic gradient if configured, otherwise batched finite differences
+        ) -> opt.OptimizeResult:
+        """Run a single local trust-constr solve"""
         import warnings
         warnings.filterwarnings("ignore")
-        self.sol = opt.minimize(
+        return opt.minimize(
             self._optimizer_fn, init_pos,
             method='trust-constr', 
+            jac=partial(self._optimizer_jac, bounds=bounds) if use_jac else None,
+            hessp=self._optimizer_hessp if use_jac and self._hessp is not None else None,
             bounds=bounds, 
             constraints=constraints
             )
-        if not self.sol.success:
-            raise Exception(f"Optimization failed: {self.sol.message}")
-        
-        self.optimal_budget = self._optimizer_array_to_budget(self.sol.x)
-        self.optimal_prediction = self.model.predict(self.optimal_budget) # The optimizer minimizes the cost, so we need to negate it
-        self.optimal_contribution = self.model.contributions(self.optimal_budget)
+    
+    def _solve_total(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        total: float, # Total budget
+        init_pos: np.ndarray, # Starting point
+        use_jac: bool = True, # Use the analytic gradient if configured, otherwise batched finite differences
+        ) -> opt.OptimizeResult:
+        """Optimize at one total budget, used by `frontier`"""
+        return self._minimize(
+            init_pos, bounds, opt.LinearConstraint(np.ones((1, len(bounds))), total, total), use_jac)
+    
+
+    def optimize(
+        self, 
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: None|opt.LinearConstraint, # Constraints for the optimizer
+        init_pos: np.ndarray|None = None, # Initial position of the optimizer, defaults to `warm_start`
+        use_jac: bool = True, # Use the analytic gradient if configured, otherwise batched finite differences
+        ):
+        """Optimize the model"""
+        if init_pos is None:
+            init_pos = self.warm_start(bounds, constraints)
+        sol = self._minimize(init_pos, bounds, constraints, use_jac)
+        if not sol.success:
+            raise Exception(f"Optimization failed: {sol.message}")
+        self._set_solution(sol)
+        return self
+    
+    def feasible_starts(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: None|opt.LinearConstraint, # Constraints for the optimizer
+        n_starts: int, # Number of starting points
+        seed: int|None = None # Seed for the random draws
+        ) -> np.ndarray: # Starting points, one per row
+        """Draw random starting points inside the bounds and project them onto the constraints"""
+        rng = np.random.default_rng(seed)
+        lower, upper = np.array(bounds, dtype=float).T
+        starts = rng.uniform(lower, upper, size=(n_starts, len(bounds)))
+        return self.project(starts, bounds, constraints)
+    
+    def project(
+        self,
+        points: np.ndarray, # Points, one per row
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: None|opt.LinearConstraint, # Constraints for the optimizer
+        ) -> np.ndarray: # Closest feasible points
+        """Project points onto the bounds and the constraints"""
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        lower, upper = np.array(bounds, dtype=float).T
+        if constraints is None:
+            return np.clip(points, lower, upper)
+        A = np.atleast_2d(constraints.A)
+        if A.shape[0] == 1 and np.all(A == 1):
+            # a single constraint on the total has an exact projection
+            return project_budgets(
+                points, lower, upper, (np.min(constraints.lb), np.max(constraints.ub)))
+        return np.array([
+            opt.minimize(
+                lambda y, x=x: np.sum((y - x)**2), x, 
+                jac=lambda y, x=x: 2*(y - x),
+                method="SLSQP", bounds=bounds, constraints=constraints).x 
+            for x in points])
+    
+    def warm_start(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: None|opt.LinearConstraint, # Constraints for the optimizer
+        budget: BudgetType|None = None, # Budget to start from, defaults to the last optimal budget
+        ) -> np.ndarray: # Starting point
+        """Project a previous budget into the feasible region of new bounds and constraints"""
+        budget = self.optimal_budget if budget is None else budget
+        if budget is None:
+            raise ValueError("No previous optimal budget to warm start from, pass init_pos or budget")
+        x = np.array([budget[name] for name in self._array_channels(len(bounds))], dtype=float)
+        return self.project(x, bounds, constraints)[0]
+    
+    def _warm_kwargs(self, kwargs: dict) -> dict:
+        """Drop `init_pos` so the next solve starts from `warm_start`"""
+        return {name: value for name, value in kwargs.items() if name != "init_pos"}
+    
+    def optimize_multistart(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: None|opt.LinearConstraint, # Constraints for the optimizer
+        n_starts: int = 8, # Number of local solves
+        n_workers: int|None = None, # Number of worker processes, defaults to the number of cores, 1 runs in this process
+        init_pos: np.ndarray|None = None, # Optional starting point added to the random ones
+        seed: int|None = None, # Seed for the random starting points
+        use_jac: bool = True, # Use the analytic gradient if configured, otherwise batched finite differences
+        ):
+        """Run local solves from many feasible starting points in parallel and keep the best"""
+        starts = self.feasible_starts(bounds, constraints, n_starts, seed)
+        if init_pos is not None:
+            starts = np.vstack([np.asarray(init_pos, dtype=float), starts[:-1]])
+        if n_workers == 1:
+            results = [_local_result(self._minimize(x0, bounds, constraints, use_jac), x0) for x0 in starts]
+        else:
+            with self._process_pool(n_workers) as pool:
+                results = self._map_workers(
+                    pool, self._observe_solutions, _worker_solve, starts, 
+                    repeat(bounds), repeat(constraints), repeat(use_jac))
+        self.local_optima = sorted(results, key=lambda r: (not r.success, r.fun))
+        if not self.local_optima[0].success:
+            raise Exception(f"Optimization failed from every start: {self.local_optima[0].message}")
+        self._set_solution(self.local_optima[0])
+        return self
+
+# %% ../nbs/00_optimizer.ipynb 10
+_WORKER_OPTIMIZER: BaseOptimizer|None = None
+
+def _init_worker(
+    model: BaseBudgetModel, # Model, reloaded from its artifact when unpickled
+    config_path: Path, # Path to the configuration files
+    config: dict, # Optimizer configuration of the parent process
+    optimizer_cls: type|None = None, # Optimizer class to build, defaults to `ScipyBudgetOptimizer`
+    cache_path: str|Path|None = None, # Sqlite prediction cache shared with the other processes
+    state: dict|None = None # Settings of the parent optimizer returned by `_worker_state`
+    ):
+    "Build the optimizer used by a worker process once"
+    global _WORKER_OPTIMIZER
+    state = state or {}
+    if cache_path is not None:
+        model.enable_cache(path=cache_path)
+    if state.get("n_draws") is not None:
+        model.use_draws(state["n_draws"], state["draw_seed"])
+    _WORKER_OPTIMIZER = (optimizer_cls or ScipyBudgetOptimizer)(model, config_path)
+    _WORKER_OPTIMIZER._config = config
+    _WORKER_OPTIMIZER.risk_aversion = state.get("risk_aversion", 0.)
+    _WORKER_OPTIMIZER.risk_quantile = state.get("risk_quantile")
+    if state.get("track_allocations") is not None:
+        _WORKER_OPTIMIZER.instrument(Instrumentation(track_allocations=state["track_allocations"]))
+
+def _worker_call(fn, *args):
+    "Run a worker function, returning its result and the statistics instrumented in this process since the last call"
+    result = fn(*args)
+    instrumentation = _WORKER_OPTIMIZER._instrumentation
+    return result, instrumentation.drain() if instrumentation.enabled else None
+
+def _local_result(sol: opt.OptimizeResult, init_pos: np.ndarray) -> opt.OptimizeResult:
+    "Keep the picklable summary of a local solve"
+    return opt.OptimizeResult(
+        x=sol.x, fun=float(sol.fun), success=sol.success, message=sol.message,
+        nit=sol.nit, nfev=sol.nfev, init_pos=init_pos)
+
+def _worker_solve(
+    init_pos: np.ndarray, # Initial position of the optimizer
+    bounds: list[tuple[float, float]], # Bounds for the optimizer
+    constraints: None|opt.LinearConstraint, # Constraints for the optimizer
+    use_jac: bool # Use the analytic gradient if configured
+    ) -> opt.OptimizeResult:
+    "Local solve run in a worker process"
+    return _local_result(_WORKER_OPTIMIZER._minimize(init_pos, bounds, constraints, use_jac), init_pos)
+
+def _worker_budget_losses(
+    budgets: list[BudgetType] # Budgets to evaluate
+    ) -> np.ndarray:
+    "Losses of a batch of budgets evaluated in a worker process"
+    return _WORKER_OPTIMIZER._budget_losses(budgets)
+
+def _worker_frontier(
+    totals: np.ndarray, # Consecutive total budgets
+    bounds: list[tuple[float, float]], # Bounds for the optimizer
+    init_pos: np.ndarray, # Starting point of the first total
+    kwargs: dict # Arguments of `_solve_total`
+    ) -> list[opt.OptimizeResult]:
+    "Continuation over a chunk of the frontier run in a worker process"
+    return [
+        _local_result(sol, sol.init_pos) 
+        for sol in _WORKER_OPTIMIZER._continuation(totals, bounds, init_pos, **kwargs)]
+
+# %% ../nbs/00_optimizer.ipynb 34
+class PopulationBudgetOptimizer(BaseOptimizer):
+    """Differential evolution with constraint projection and batched evaluation of each generation"""
+    
+    def _evaluate(
+        self, 
+        population: np.ndarray, # Members of the population, one per row
+        pool: ProcessPoolExecutor|None, # Worker processes, None evaluates in this process
+        n_workers: int = 1 # Number of processes in `pool`, the population is split in as many chunks
+        ) -> np.ndarray:
+        """Loss of every member of the population, in one batched call or split across the pool"""
+        if pool is None:
+            return self._batch_loss(population)
+        budgets = [self._optimizer_array_to_budget(x) for x in population]
+        chunks = np.array_split(np.arange(len(budgets)), n_workers)
+        losses = np.concatenate([self._from_worker(output) for output in pool.map(
+            _worker_call, repeat(_worker_budget_losses), [[budgets[i] for i in chunk] for chunk in chunks if len(chunk)])])
+        self._observe(budgets, losses)
+        return losses
+    
+    def _solve_total(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        total: float, # Total budget
+        init_pos: np.ndarray, # Starting point, kept in the initial population
+        **kwargs # Arguments of `optimize`
+        ) -> opt.OptimizeResult:
+        """Optimize at one total budget, used by `frontier`"""
+        return self.optimize(bounds, (total, total), init_pos=init_pos, **kwargs).sol
+    
+    def _warm_kwargs(self, kwargs: dict) -> dict:
+        """Start the next population from the last solution"""
+        return dict(kwargs, init_pos=self.sol.x)
+    
+    def optimize(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: tuple[float, float]|None = None, # Bounds of the sum of the optimizer array
+        popsize: int|None = None, # Population size, defaults to 4 per dimension with a minimum of 8
+        max_generations: int = 100, # Maximum number of generations
+        mutation: float = .7, # Differential weight
+        crossover: float = .9, # Crossover probability
+        init_pos: np.ndarray|None = None, # Optional member of the initial population
+        seed: int|None = None, # Seed of the random generator
+        n_workers: int = 1, # Number of worker processes evaluating each generation, 1 evaluates in this process
+        target_loss: float|None = None, # Stop once the best loss is at or below this value
+        tol: float = 1e-8, # Stop once the spread of the population losses is below this value
+        ):
+        """Optimize the model"""
+        rng = np.random.default_rng(seed)
+        lows, highs = np.array(bounds, dtype=float).T
+        constraints = (-np.inf, np.inf) if constraints is None else constraints
+        n_dims = len(lows)
+        popsize = max(8, 4*n_dims) if popsize is None else popsize
+        space = ConstrainedSearchSpace({i: bound for i, bound in enumerate(bounds)}, constraints)
+        population = space.sample(popsize, seed=rng)[:, np.argsort(space.names)]
+        if init_pos is not None:
+            population[0] = project_budgets(init_pos, lows, highs, constraints)[0]
+        pool = None if n_workers == 1 else self._process_pool(n_workers)
+        try:
+            losses = self._evaluate(population, pool, n_workers)
+            n_evaluations, generation, message = popsize, 0, "Maximum number of generations reached"
+            for generation in range(1, max_generations + 1):
+                # rand/1/bin: mutate with three other members and cross over with the current one
+                others = np.array([rng.choice(np.delete(np.arange(popsize), i), 3, replace=False) for i in range(popsize)])
+                mutants = population[others[:, 0]] + mutation*(population[others[:, 1]] - population[others[:, 2]])
+                crossed = rng.random((popsize, n_dims)) < crossover
+                crossed[np.arange(popsize), rng.integers(n_dims, size=popsize)] = True
+                trials = project_budgets(np.where(crossed, mutants, population), lows, highs, constraints)
+                trial_losses = self._evaluate(trials, pool, n_workers)
+                n_evaluations += popsize
+                improved = trial_losses <= losses
+                population[improved], losses[improved] = trials[improved], trial_losses[improved]
+                if target_loss is not None and losses.min() <= target_loss:
+                    message = "Target loss reached"
+                    break
+                if np.ptp(losses) < tol:
+                    message = "Population converged"
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        best = np.argmin(losses)
+        self.population, self.population_losses = population, losses
+        self._set_solution(opt.OptimizeResult(
+            x=population[best], fun=losses[best], success=True, message=message,
+            nit=generation, nfev=n_evaluations))
         return self
 
-# %% ../nbs/00_optimizer.ipynb 15
+# %% ../nbs/00_optimizer.ipynb 38
 from typing import Literal
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-# %% ../nbs/00_optimizer.ipynb 16
+# %% ../nbs/00_optimizer.ipynb 39
+def optuna_storage(
+    storage: str|optuna.storages.BaseStorage|None # RDB url, "memory", "journal:<path>" or an Optuna storage
+    ) -> str|optuna.storages.BaseStorage|None:
+    "Optuna storage for a storage specification"
+    if storage == "memory":
+        return optuna.storages.InMemoryStorage()
+    if isinstance(storage, str) and storage.startswith("journal:"):
+        from optuna.storages.journal import JournalStorage, JournalFileBackend
+        return JournalStorage(JournalFileBackend(storage.removeprefix("journal:")))
+    return storage
+
+# %% ../nbs/00_optimizer.ipynb 40
 class OptunaBudgetOptimizer(BaseOptimizer):
     def __init__(
         self, 
         model: BaseBudgetModel, # The model to optimize
         config_path: str|Path, # Path to the configuration files
         objective_name: str = "loss", # Name of the objective
-        storage: str = "sqlite:///db.sqlite3", # Storage for the optimization defaults to local sqlite
+        storage: str|optuna.storages.BaseStorage|None = "sqlite:///db.sqlite3", # RDB url, "memory", "journal:<path>" or an Optuna storage
         direction: Literal["maximize", "minimize"] = "maximize", # Direction of the optimization
-        sampler: optuna.samplers.BaseSampler = optuna.samplers.TPESampler, # Sampler for the optimization
-        pruner: optuna.pruners.BasePruner|None = None, # Pruner for the optimization
+        sampler: type[optuna.samplers.BaseSampler]|None = None, # Sampler for the optimization, defaults to `TPESampler`
+        pruner: type[optuna.pruners.BasePruner]|None = None, # Pruner for the optimization, trials are scored with `model.predict_iter`
         tol: float = 1e-3, # Tolerance for the constraints
         percent_out_tolerance: float = 0.1, # Percentage of the budget trials that can be outside the constraints
         sampler_kwargs: dict|None = None, # Additional arguments for the sampler
         pruner_kwargs: dict|None = None, # Additional arguments for the pruner
+        record_user_attrs: bool = True, # Store the budget and total as user attributes of every trial
+        snapshot_path: str|Path|None = None, # Periodically export the trials to this `.npz` or `.parquet` file
+        snapshot_every: int = 1000, # Number of finished trials between snapshots
         ):
         super().__init__(model, config_path)
         self.objective_name = objective_name
@@ -132,28 +804,238 @@ class OptunaBudgetOptimizer(BaseOptimizer):
         self._direction = direction
         self.__tol = tol
         self.__percent_out_tolerance = percent_out_tolerance
-        self.__sampler = sampler(**sampler_kwargs)
-        self.__pruner = pruner(**pruner_kwargs) if not pruner is None else None
-        self.__storage = storage
+        sampler = optuna.samplers.TPESampler if sampler is None else sampler
+        self.__make_sampler = partial(sampler, **(sampler_kwargs or {}))
+        self.__sampler = self.__make_sampler()
+        self.__pruner = pruner(**(pruner_kwargs or {})) if not pruner is None else None
+        self.__storage = optuna_storage(storage)
+        self.__record_user_attrs = record_user_attrs
+        self.__snapshot_path = snapshot_path
+        self.__snapshot_every = snapshot_every
+        self.__n_finished = 0
+        self.__snapshot_lock = threading.Lock()
         
     #def _constraints(self, trial):
     #    return trial.user_attrs["constraint"]
     
     
     def _opt_fn(self, trial):
-        budget = self.search_space(trial)
-        #budget = self._optimizer_array_to_budget([budget[name] for name in ])
-        total_budget = sum(v for v in budget.values())
-        
-        trial.set_user_attr("budget", budget)
-        trial.set_user_attr("total_budget", total_budget)
-        prediction = self.model.predict(budget)
-        
-        
-        loss = -self._loss_fn(prediction, **self._config['loss_fn_kwargs'])
+        instrumentation = self._instrumentation
+        with instrumentation.evaluation():
+            with instrumentation.stage("search_space"):
+                budget = self.search_space(trial)
+            #budget = self._optimizer_array_to_budget([budget[name] for name in ])
+            if self.__record_user_attrs:
+                trial.set_user_attr("budget", budget)
+                trial.set_user_attr("total_budget", sum(v for v in budget.values()))
+            if self.__pruner is not None:
+                loss = self._progressive_loss(trial, budget)
+            else:
+                prediction = self.model.predict(budget, window=self._window())
+                with instrumentation.stage("loss_fn"):
+                    loss = -self._prediction_loss(prediction)
+        self._observe([budget], [-loss])
         return loss
-        
-        
+    
+    def _progressive_loss(self, trial: optuna.trial.Trial, budget: BudgetType) -> float:
+        """Report the loss of every partial prediction of `predict_iter` and stop the trial if the pruner says so"""
+        for step, prediction in enumerate(self.model.predict_iter(budget, window=self._window())):
+            with self._instrumentation.stage("loss_fn"):
+                loss = -self._prediction_loss(prediction)
+            trial.report(loss, step)
+            if trial.should_prune():
+                raise optuna.TrialPruned(f"Pruned at step {step}")
+        return loss
+    
+    def _ask(self) -> tuple[optuna.trial.Trial, BudgetType]:
+        """Ask the study for a trial and sample its budget"""
+        trial = self.study.ask()
+        budget = self.search_space(trial)
+        if self.__record_user_attrs:
+            trial.set_user_attr("budget", budget)
+            trial.set_user_attr("total_budget", sum(v for v in budget.values()))
+        return trial, budget
+    
+    def _on_trial_finished(self, study=None, trial=None):
+        """Write a snapshot of the trials every `snapshot_every` finished trials"""
+        if self.__snapshot_path is None:
+            return
+        with self.__snapshot_lock:
+            self.__n_finished += 1
+            if self.__n_finished % self.__snapshot_every == 0:
+                self.export_trials(self.__snapshot_path)
+    
+    def _previous_budgets(
+        self, 
+        warm_start: optuna.Study|list[BudgetType], # Previous study or budgets
+        n_warm_trials: int # Number of best trials taken from a previous study
+        ) -> list[BudgetType]:
+        """Budgets of the best completed trials of a study, or the given budgets"""
+        if not isinstance(warm_start, optuna.Study):
+            return list(warm_start)
+        trials = warm_start.get_trials(deepcopy=False, states=(optuna.trial.TrialState.COMPLETE,))
+        trials = sorted(
+            trials, key=lambda trial: trial.value, 
+            reverse=warm_start.direction == optuna.study.StudyDirection.MAXIMIZE)
+        return [trial.params for trial in trials[:n_warm_trials]]
+    
+    def _warm_kwargs(self, kwargs: dict) -> dict:
+        """Seed a new study with the trials of the last one"""
+        name = kwargs.get("study_name", "optimizer")
+        return dict(kwargs, warm_start=self.study, study_name=f"{name}-{len(self.study.trials)}")
+    
+    def seed_study(
+        self,
+        warm_start: optuna.Study|list[BudgetType], # Previous study or budgets
+        n_warm_trials: int = 10, # Number of best trials taken from a previous study
+        ) -> int: # Number of trials added
+        """Project previous budgets into the current search space, score them in one batched call and add them to the study"""
+        bounds = self.search_space.bounds
+        channels = list(self._channels)
+        lows, highs = np.array([bounds[name] for name in channels], dtype=float).T
+        budgets = np.array([
+            [budget.get(name, (low + high)/2) for name, low, high in zip(channels, lows, highs)]
+            for budget in self._previous_budgets(warm_start, n_warm_trials)], dtype=float)
+        if not len(budgets):
+            return 0
+        budgets = np.unique(project_budgets(budgets, lows, highs, self.search_space.constraint), axis=0)
+        budgets = [dict(zip(channels, map(float, row))) for row in budgets]
+        losses = self._budget_losses(budgets)
+        self._observe(budgets, losses)
+        distributions = {
+            name: optuna.distributions.FloatDistribution(low, high) 
+            for name, low, high in zip(channels, lows, highs)}
+        self.study.add_trials([
+            optuna.trial.create_trial(
+                params=budget, distributions=distributions, value=-float(loss),
+                user_attrs={"budget": budget, "total_budget": sum(budget.values()), "warm_start": True} 
+                if self.__record_user_attrs else {"warm_start": True})
+            for budget, loss in zip(budgets, losses)])
+        return len(budgets)
+    
+    def trial_arrays(self) -> dict[str, np.ndarray]:
+        """Budgets, totals, objectives and states of all trials as columns, read from the storage in one call"""
+        trials = self.study.get_trials(deepcopy=False)
+        channels = list(self._channels)
+        budgets = np.array(
+            [[trial.params.get(name, np.nan) for name in channels] for trial in trials], 
+            dtype=float).reshape(len(trials), len(channels))
+        return {
+            "channel": np.array(channels),
+            "number": np.array([trial.number for trial in trials], dtype=int),
+            "budget": budgets,
+            "total_budget": budgets.sum(axis=1),
+            self.objective_name: np.array(
+                [np.nan if trial.value is None else trial.value for trial in trials], dtype=float),
+            "state": np.array([trial.state.name for trial in trials]),
+        }
+    
+    def summary(self) -> pd.DataFrame:
+        """Number of trials and mean number of reported steps per trial state"""
+        trials = self.study.get_trials(deepcopy=False)
+        frame = pd.DataFrame({
+            "state": [trial.state.name for trial in trials], 
+            "steps": [len(trial.intermediate_values) for trial in trials]}, columns=["state", "steps"])
+        summary = frame.groupby("state").steps.agg(["count", "mean"]).rename(
+            columns={"count": "trials", "mean": "mean_steps"})
+        summary["fraction"] = summary.trials/max(len(trials), 1)
+        return summary
+    
+    def export_trials(
+        self,
+        path: str|Path # `.npz` or `.parquet` file, parquet needs `pyarrow` or `fastparquet`
+        ) -> Path:
+        """Export the budgets and objectives of all trials to a columnar file"""
+        path = Path(path)
+        arrays = self.trial_arrays()
+        if path.suffix == ".parquet":
+            frame = pd.DataFrame(arrays.pop("budget"), columns=arrays.pop("channel"))
+            for name, column in arrays.items():
+                frame[name] = column
+            frame.to_parquet(path)
+        elif path.suffix == ".npz":
+            np.savez(path, **arrays)
+        else:
+            raise ValueError(f"Unknown trial export format {path.suffix!r}, use .npz or .parquet")
+        return path
+    
+    def load_snapshot(
+        self,
+        path: str|Path # `.npz` or `.parquet` file written by `export_trials` or `snapshot_path`
+        ) -> int: # Number of trials added
+        """Add the completed trials of a snapshot that fit the current search space to the study, with their recorded objective"""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            frame = pd.read_parquet(path)
+            channels = [name for name in frame.columns if name not in ("number", "total_budget", self.objective_name, "state")]
+            arrays = {
+                "channel": np.array(channels), "budget": frame[channels].to_numpy(dtype=float), 
+                self.objective_name: frame[self.objective_name].to_numpy(), "state": frame["state"].to_numpy()}
+        elif path.suffix == ".npz":
+            arrays = dict(np.load(path))
+        else:
+            raise ValueError(f"Unknown trial export format {path.suffix!r}, use .npz or .parquet")
+        channels = list(arrays["channel"])
+        budgets = arrays["budget"][:, [channels.index(name) for name in self.search_space.names]]
+        keep = (arrays["state"] == "COMPLETE") & self.search_space.is_feasible(budgets)
+        bounds = self.search_space.bounds
+        distributions = {name: optuna.distributions.FloatDistribution(*bounds[name]) for name in self.search_space.names}
+        self.study.add_trials([
+            optuna.trial.create_trial(
+                params=dict(zip(self.search_space.names, map(float, budget))), distributions=distributions, value=float(value),
+                user_attrs={"resumed": True})
+            for budget, value in zip(budgets[keep], arrays[self.objective_name][keep])])
+        return int(keep.sum())
+    
+    def _optimize_ask_tell(
+        self,
+        n_trials: int, # Max number of trials to run
+        timeout: int|None, # Timeout for the optimization
+        n_jobs: int, # Number of batches evaluated concurrently
+        batch_size: int, # Number of trials evaluated per batched model call
+        backend: Literal["thread", "process"], # Run the batches in threads sharing this model or in worker processes
+        ordered: bool = False # Tell the batches in the order they were asked, so seeded runs are reproducible
+        ):
+        """Run the study through ask/tell, evaluating batches of trials concurrently"""
+        if backend == "process":
+            pool = self._process_pool(n_jobs)
+            evaluate = partial(_worker_call, _worker_budget_losses)
+        else:
+            pool = ThreadPoolExecutor(max_workers=n_jobs)
+            evaluate = self._budget_losses
+        start, n_asked, pending = time.monotonic(), 0, {}
+        with pool:
+            while True:
+                while (
+                    len(pending) < n_jobs and n_asked < n_trials 
+                    and (timeout is None or time.monotonic() - start < timeout)):
+                    batch = [self._ask() for _ in range(min(batch_size, n_trials - n_asked))]
+                    n_asked += len(batch)
+                    pending[pool.submit(evaluate, [budget for _, budget in batch])] = batch
+                if not pending:
+                    break
+                if ordered:
+                    done = [next(iter(pending))]
+                    wait(done)
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = pending.pop(future)
+                    try:
+                        losses = future.result()
+                        if backend == "process":
+                            losses = self._from_worker(losses)
+                    except Exception: # fail every unfinished trial and raise the error of the model, like `study.optimize`
+                        for future in pending:
+                            future.cancel()
+                        for trial, _ in batch + [item for unfinished in pending.values() for item in unfinished]:
+                            self.study.tell(trial, state=optuna.trial.TrialState.FAIL)
+                        raise
+                    for (trial, _), loss in zip(batch, losses):
+                        self.study.tell(trial, -float(loss))
+                        self._on_trial_finished()
+                    self._observe([budget for _, budget in batch], losses)
+
 
     def optimize(
         self, 
@@ -163,10 +1045,19 @@ class OptunaBudgetOptimizer(BaseOptimizer):
         n_trials: int = 100, # Max number of trials to run
         study_name: str = "optimizer", # Name of the study
         load_if_exists: bool = False, # Load the study if it exists
-        n_jobs: int = 1 # Number of jobs to run in parallel
+        n_jobs: int = 1, # Number of jobs to run in parallel
+        backend: Literal["thread", "process"] = "thread", # Evaluate trials in threads or in worker processes owning their own model
+        batch_size: int = 1, # Number of trials asked at once and evaluated in one batched model call
+        warm_start: optuna.Study|list[BudgetType]|None = None, # Seed the study with the best trials of a previous study or with budgets
+        n_warm_trials: int = 10, # Number of best trials taken from a previous study
+        resume: str|Path|None = None, # Add the completed trials of this snapshot to the study before sampling
+        seed: int|None = None, # Seed of the sampler, parallel trials are then told in order so the run is reproducible
     ):
         """Optimize the model"""
-            
+        if seed is not None:
+            self.__sampler = self.__make_sampler(seed=seed)
+        elif self.study is not None: # samplers keep per-study state
+            self.__sampler = self.__make_sampler()
         self.study = optuna.create_study(
             storage=self.__storage,  # Specify the storage URL here.
             study_name=study_name,
@@ -180,13 +1071,104 @@ class OptunaBudgetOptimizer(BaseOptimizer):
         if constraints is None:
             constraints = (-np.inf, np.inf)
         self.search_space = ConstrainedSearchSpace(bounds, constraints)
-        self.study.optimize(
-            self._opt_fn, 
-            n_trials=n_trials, 
-            timeout=timeout,
-            n_jobs=n_jobs)
+        self._channels = list(bounds)
+        if warm_start is not None:
+            self.seed_study(warm_start, n_warm_trials)
+        if resume is not None:
+            self.load_snapshot(resume)
+        n_seeded = len(self.study.trials)
+        if backend == "thread" and batch_size == 1 and (n_jobs == 1 or seed is None):
+            self.study.optimize(
+                self._opt_fn, 
+                n_trials=n_trials, 
+                timeout=timeout,
+                n_jobs=n_jobs,
+                callbacks=[self._on_trial_finished])
+        else:
+            self._optimize_ask_tell(n_trials, timeout, n_jobs, batch_size, backend, ordered=seed is not None)
+        self.timed_out = timeout is not None and len(self.study.trials) - n_seeded < n_trials
+        if self.__snapshot_path is not None:
+            self.export_trials(self.__snapshot_path)
         
         self.sol = self.study.best_trial
         self.optimal_budget = self.sol.params
         self.optimal_prediction = self.model.predict(self.optimal_budget)
+        return self
         
+
+# %% ../nbs/00_optimizer.ipynb 83
+@dataclass
+class Incumbent:
+    """Best budget evaluated so far by a running optimization"""
+    budget: BudgetType # Best budget
+    loss: float # Loss of the budget
+    evaluations: int # Number of evaluations done when it was found
+    seconds: float # Seconds since the start of the optimization when it was found
+    
+    @property
+    def throughput(self) -> float:
+        """Evaluations per second"""
+        return self.evaluations/max(self.seconds, 1e-12)
+
+class OptimizationCancelled(Exception):
+    """Raised at the next evaluation of an optimization whose progress was cancelled"""
+
+class OptimizationProgress:
+    """Incumbent of a running optimization, updated by every evaluation and readable from any thread"""
+    def __init__(self):
+        self.incumbent: Incumbent|None = None
+        self.evaluations = 0
+        self.finished = False # the optimization returned, raised or was stopped
+        self.stopped = False # it was stopped by `cancel` before finishing
+        self.error: Exception|None = None
+        self._start = time.perf_counter()
+        self._cancelled = threading.Event()
+        self._condition = threading.Condition()
+    
+    def start(self):
+        """Restart the clock the seconds of the incumbents are measured from, e.g. when a queued job starts running"""
+        self._start = time.perf_counter()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def cancel(self):
+        """Ask the optimization to stop at its next evaluation"""
+        self._cancelled.set()
+        with self._condition:
+            self._condition.notify_all()
+    
+    def update(
+        self, 
+        budgets: list[BudgetType], # Evaluated budgets
+        losses: np.ndarray, # Their losses
+        evaluations: int|None = None # Evaluations they took, e.g. the local solves of a worker process, one per budget if None
+        ):
+        """Count the evaluations and keep the best budget, raise `OptimizationCancelled` once cancelled"""
+        if self.cancelled:
+            raise OptimizationCancelled()
+        with self._condition:
+            self.evaluations += 0 if evaluations is None else evaluations - len(budgets)
+            for budget, loss in zip(budgets, losses):
+                self.evaluations += 1
+                if self.incumbent is None or loss < self.incumbent.loss:
+                    self.incumbent = Incumbent(
+                        {name: float(value) for name, value in budget.items()}, float(loss), 
+                        self.evaluations, time.perf_counter() - self._start)
+            self._condition.notify_all()
+    
+    def finish(self):
+        with self._condition:
+            self.finished = True
+            self._condition.notify_all()
+    
+    def wait(
+        self, 
+        incumbent: Incumbent|None, # Last incumbent seen
+        timeout: float|None = None # Maximum number of seconds to wait
+        ) -> Incumbent|None: # The current incumbent
+        """Wait until the incumbent differs from `incumbent` or the optimization finished"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.incumbent is not incumbent or self.finished, timeout)
+            return self.incumbent
@@ -0,0 +1,165 @@
+"""Precomputed response and marginal ROI curves per channel for near-instant allocations"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_response_curves.ipynb.
+
+# %% ../nbs/04_response_curves.ipynb 4
+from __future__ import annotations
+
+# %% auto 0
+__all__ = ['ResponseCurves']
+
+# %% ../nbs/04_response_curves.ipynb 5
+import json
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+from .optimizer import BaseOptimizer
+from .utils.model_helpers import BudgetType
+from .utils.prediction_cache import artifact_fingerprint
+
+# %% ../nbs/04_response_curves.ipynb 7
+def _upper_hull(
+    x: np.ndarray, # Increasing spends
+    y: np.ndarray # Response at each spend
+    ) -> tuple[np.ndarray, np.ndarray]: # Vertices of the smallest concave curve above the points
+    "Upper concave envelope of a curve"
+    hull = []
+    for point in zip(x, y):
+        while len(hull) >= 2 and (
+            (hull[-1][0] - hull[-2][0])*(point[1] - hull[-2][1]) 
+            - (hull[-1][1] - hull[-2][1])*(point[0] - hull[-2][0])) >= 0:
+            hull.pop()
+        hull.append(point)
+    return np.array([p[0] for p in hull]), np.array([p[1] for p in hull])
+
+# %% ../nbs/04_response_curves.ipynb 9
+class ResponseCurves:
+    """
+    Response and marginal ROI of every channel over a grid of spends, 
+    each channel varied alone around a reference budget
+    """
+    _SUFFIX = ".curves.npz"
+    
+    def __init__(
+        self,
+        channels: list[str], # Channels of the curves
+        spend: np.ndarray, # Grid of spends, one row per channel
+        response: np.ndarray, # Change of the objective from the first spend of the grid, one row per channel
+        reference: np.ndarray, # Spend of the other channels while a channel varies
+        ):
+        self.channels = list(channels)
+        self.spend = np.asarray(spend, dtype=float)
+        self.response = np.asarray(response, dtype=float)
+        self.reference = np.asarray(reference, dtype=float)
+    
+    @classmethod
+    def compute(
+        cls,
+        optimizer: BaseOptimizer, # Optimizer whose loss defines the objective
+        bounds: dict[str, tuple[float, float]], # Spend range of every channel
+        n_points: int = 51, # Number of spends per channel
+        reference: BudgetType|None = None, # Budget the channels vary around, defaults to the middle of the bounds
+        batch_size: int = 1024 # Number of budgets per batched model call
+        ) -> ResponseCurves:
+        """Evaluate the curves of every channel in batched model calls"""
+        channels = list(bounds)
+        lows, highs = np.array([bounds[name] for name in channels], dtype=float).T
+        reference = (lows + highs)/2 if reference is None else np.array([reference[name] for name in channels], dtype=float)
+        spend = np.linspace(lows, highs, n_points).T
+        budgets = np.tile(reference, (len(channels), n_points, 1))
+        for i in range(len(channels)):
+            budgets[i, :, i] = spend[i]
+        budgets = budgets.reshape(-1, len(channels))
+        losses = np.concatenate([
+            optimizer._budget_losses([dict(zip(channels, map(float, row))) for row in chunk])
+            for chunk in np.array_split(budgets, -(-len(budgets)//batch_size))])
+        losses = losses.reshape(len(channels), n_points)
+        return cls(channels, spend, losses[:, :1] - losses, reference)
+    
+    @property
+    def marginal_roi(self) -> np.ndarray:
+        """Change of the objective per extra unit of spend of each channel, on the grid"""
+        return np.array([np.gradient(response, spend) for spend, response in zip(self.spend, self.response)])
+    
+    def to_dataset(self) -> xr.Dataset:
+        """Spend, response and marginal ROI per channel and grid point"""
+        return xr.Dataset(
+            {
+                "spend": (("channel", "point"), self.spend),
+                "response": (("channel", "point"), self.response),
+                "marginal_roi": (("channel", "point"), self.marginal_roi),
+                "reference": ("channel", self.reference),
+            },
+            coords={"channel": self.channels})
+    
+    def allocate(
+        self,
+        constraints: float|tuple[float, float], # Total budget, or bounds of the total budget
+        bounds: dict[str, tuple[float, float]]|None = None, # Spend range of every channel, defaults to the grid
+        ) -> BudgetType: # Allocation of the total
+        """Water-fill the total budget into the channels with the highest marginal ROI"""
+        total_low, total_high = (constraints, constraints) if np.isscalar(constraints) else constraints
+        bounds = {} if bounds is None else bounds
+        lows, highs = np.array([
+            bounds.get(name, (spend[0], spend[-1])) for name, spend in zip(self.channels, self.spend)], dtype=float).T
+        if (lows < self.spend[:, 0] - 1e-12).any() or (highs > self.spend[:, -1] + 1e-12).any():
+            raise ValueError("Bounds outside the spends of the curves, compute them over wider bounds")
+        if total_low > highs.sum() or total_high < lows.sum():
+            raise ValueError(f"No allocation of the bounds has a total between {total_low} and {total_high}")
+        # the envelope of each curve is concave, so its segments come in decreasing order of marginal ROI and 
+        # filling the segments of all channels in that order is the optimal allocation on the envelopes
+        channel, width, slope = [], [], []
+        for i, (spend, response) in enumerate(zip(self.spend, self.response)):
+            x = np.unique(np.concatenate([[lows[i], highs[i]], spend[(spend > lows[i]) & (spend < highs[i])]]))
+            hx, hy = _upper_hull(x, np.interp(x, spend, response))
+            channel.append(np.full(len(hx) - 1, i))
+            width.append(np.diff(hx))
+            slope.append(np.diff(hy)/np.diff(hx))
+        channel, width, slope = np.concatenate(channel), np.concatenate(width), np.concatenate(slope)
+        order = np.argsort(-slope, kind="stable")
+        channel, width, slope = channel[order], width[order], slope[order]
+        # spend at least the lower total, then keep spending while it pays off
+        amount = np.clip(width[slope > 0].sum(), total_low - lows.sum(), total_high - lows.sum())
+        spent = np.clip(amount - (np.cumsum(width) - width), 0, width)
+        allocation = lows + np.bincount(channel, weights=spent, minlength=len(self.channels))
+        return {name: float(value) for name, value in zip(self.channels, allocation)}
+    
+    @staticmethod
+    def default_path(model_path: Path) -> Path:
+        "Path of the saved curves, next to the model artifact"
+        model_path = Path(model_path)
+        return model_path.with_name(model_path.name + ResponseCurves._SUFFIX)
+    
+    def save(
+        self,
+        optimizer: BaseOptimizer, # Optimizer the curves were computed with
+        path: str|Path|None = None # File to save to, defaults to `default_path`
+        ) -> Path:
+        """Save the curves with the fingerprint of the model artifact and the loss configuration"""
+        path = Path(path) if path is not None else self.default_path(optimizer.model.model_path)
+        np.savez(
+            path, channels=np.array(self.channels), spend=self.spend, response=self.response, reference=self.reference,
+            fingerprint=np.array(artifact_fingerprint(optimizer.model.model_path)), 
+            loss_fn_kwargs=np.array(_loss_config(optimizer)))
+        return path
+    
+    @classmethod
+    def load(
+        cls,
+        optimizer: BaseOptimizer, # Optimizer whose loss defines the objective
+        path: str|Path|None = None # Saved curves, defaults to the file next to the model artifact
+        ) -> ResponseCurves|None: # None if there are no curves for the current model artifact and loss configuration
+        """Load saved curves, ignoring them if the model artifact or the loss configuration changed"""
+        path = Path(path) if path is not None else cls.default_path(optimizer.model.model_path)
+        if not path.exists():
+            return None
+        with np.load(path) as saved:
+            if (str(saved["fingerprint"]) != artifact_fingerprint(optimizer.model.model_path) 
+                or str(saved["loss_fn_kwargs"]) != _loss_config(optimizer)):
+                return None
+            return cls(list(saved["channels"]), saved["spend"], saved["response"], saved["reference"])
+
+def _loss_config(optimizer: BaseOptimizer) -> str:
+    return json.dumps(optimizer._config.get("loss_fn_kwargs", {}), sort_keys=True, default=str)
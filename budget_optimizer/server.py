@@ -0,0 +1,515 @@
+"""Long-lived local optimization server keeping models warm between jobs"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_server.ipynb.
+
+# %% ../nbs/03_server.ipynb 4
+from __future__ import annotations
+
+# %% auto 0
+__all__ = ['OPTIMIZERS', 'ModelPool', 'Job', 'run_job', 'JobScheduler', 'OptimizationServer', 'submit_job', 'job_events',
+           'serve_cli']
+
+# %% ../nbs/03_server.ipynb 5
+import json
+import inspect
+import time
+import uuid
+import threading
+import urllib.request
+from collections import OrderedDict
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+from fastcore.script import call_parse, Param, bool_arg
+
+from dataclasses import asdict
+
+from budget_optimizer.optimizer import (
+    ScipyBudgetOptimizer, 
+    OptunaBudgetOptimizer, 
+    PopulationBudgetOptimizer, 
+    OptimizationProgress, 
+    OptimizationCancelled
+)
+from .utils.model_classes import BaseBudgetModel
+from .utils.job_store import ResultStore, job_fingerprint, job_seed
+from .utils.prediction_cache import artifact_fingerprint, artifact_stats
+from .utils.model_helpers import lazy_import
+
+# %% ../nbs/03_server.ipynb 6
+opt = lazy_import("scipy.optimize")
+
+# %% ../nbs/03_server.ipynb 8
+class ModelPool:
+    """
+    Warm models keyed by their `model_path`, each loaded once and kept until it is the least recently used
+    of more than `max_models` models.
+    """
+    def __init__(
+        self, 
+        max_models: int = 8, # Number of models kept warm
+        share_memory: bool = False # Publish the model data to shared memory so process pools of the jobs attach to it
+        ):
+        self.max_models = max_models
+        self.share_memory = share_memory
+        self._models: OrderedDict[str, BaseBudgetModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self._path_locks: dict[str, threading.Lock] = {}
+        self.loads: dict[str, int] = {}
+        self.hits: dict[str, int] = {}
+        self._fingerprints: dict[str, tuple[tuple, str]] = {} # artifact stats and fingerprint of every model path
+    
+    def get(
+        self, 
+        model_path: str|Path, # Path to the model artifacts
+        model_name: str = "model", # Name of the model, only used when it is loaded
+        model_kpi: str = "kpi" # KPI of the model, only used when it is loaded
+        ) -> BaseBudgetModel:
+        """The warm model of `model_path`, loaded on first use"""
+        key = str(Path(model_path).resolve())
+        with self._lock:
+            path_lock = self._path_locks.setdefault(key, threading.Lock())
+        with path_lock: # concurrent requests for the same model wait for a single load
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    self.hits[key] = self.hits.get(key, 0) + 1
+                    return self._models[key]
+            model = BaseBudgetModel(model_name, model_kpi, key)
+            if self.share_memory:
+                model.share_memory()
+            with self._lock:
+                self._models[key] = model
+                self.loads[key] = self.loads.get(key, 0) + 1
+                while len(self._models) > self.max_models:
+                    evicted_key, evicted = self._models.popitem(last=False)
+                    evicted.unshare_memory()
+                    self._fingerprints.pop(evicted_key, None)
+        return model
+    
+    def fingerprint(
+        self, 
+        model_path: str|Path # Path to the model artifacts
+        ) -> str:
+        """`artifact_fingerprint` of `model_path`, hashed again only when the size or modification time of a file changed"""
+        key = str(Path(model_path).resolve())
+        stats = artifact_stats(key)
+        with self._lock:
+            cached = self._fingerprints.get(key)
+        if cached is not None and cached[0] == stats:
+            return cached[1]
+        fingerprint = artifact_fingerprint(key)
+        with self._lock:
+            self._fingerprints[key] = (stats, fingerprint)
+        return fingerprint
+    
+    def info(self) -> list[dict]:
+        """Path, name, loads and hits of every warm model, least recently used first"""
+        with self._lock:
+            return [
+                {"model_path": key, "model_name": model.model_name, 
+                 "loads": self.loads[key], "hits": self.hits.get(key, 0)}
+                for key, model in self._models.items()]
+    
+    def __len__(self):
+        return len(self._models)
+
+# %% ../nbs/03_server.ipynb 12
+OPTIMIZERS = {
+    "scipy": ScipyBudgetOptimizer,
+    "population": PopulationBudgetOptimizer,
+    "optuna": OptunaBudgetOptimizer,
+}
+
+_TERMINAL_EVENTS = ("result", "error", "cancelled")
+
+# %% ../nbs/03_server.ipynb 13
+class Job:
+    """An optimization job and the events it emitted, which can be streamed while it runs"""
+    def __init__(
+        self, 
+        spec: dict # The job as submitted
+        ):
+        self.id = uuid.uuid4().hex
+        self.spec = spec
+        self.status = "queued"
+        self.result: dict|None = None
+        self.events: list[dict] = []
+        self.progress = OptimizationProgress() # incumbent of the running optimizer, cancelling it stops the job
+        self._condition = threading.Condition()
+    
+    @property
+    def model_key(self) -> str:
+        return str(Path(self.spec["model_path"]).resolve())
+    
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+    
+    def emit(self, event: str, **fields):
+        """Record an event and wake up the streams waiting for it"""
+        with self._condition:
+            self.events.append({"event": event, "job": self.id, "time": time.time(), **fields})
+            self._condition.notify_all()
+    
+    def stream(
+        self, 
+        timeout: float|None = None # Stop waiting for the next event after this many seconds
+        ) -> Iterator[dict]:
+        """Every event of the job, including those emitted before the call, until it finishes"""
+        seen = 0
+        while True:
+            with self._condition:
+                if seen == len(self.events) and not self._condition.wait_for(lambda: seen < len(self.events), timeout):
+                    return
+                events = self.events[seen:]
+            seen += len(events)
+            yield from events
+            if events[-1]["event"] in _TERMINAL_EVENTS:
+                return
+    
+    def wait(
+        self, 
+        timeout: float|None = None # Maximum number of seconds to wait
+        ) -> dict|None: # The result, None if the job failed or did not finish in time
+        """Wait for the job to finish"""
+        with self._condition:
+            self._condition.wait_for(lambda: self.done, timeout)
+        return self.result
+    
+    def summary(self) -> dict:
+        """Id, status, result and last event of the job"""
+        return {"id": self.id, "status": self.status, "result": self.result, 
+                "last_event": self.events[-1] if self.events else None}
+
+# %% ../nbs/03_server.ipynb 14
+def _to_json(value):
+    """Replace the numpy scalars and arrays of `value` by Python numbers and lists"""
+    if isinstance(value, dict):
+        return {str(key): _to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+def _apply_overrides(
+    config: dict, # Configuration of the optimizer
+    overrides: dict # Keys to replace, dictionaries are updated instead of replaced
+    ):
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(config.get(key), dict):
+            config[key] = {**config[key], **value}
+        else:
+            config[key] = value
+
+def _optimize_args(
+    optimizer: str, # Name of the optimizer
+    bounds: dict[str, tuple[float, float]], # Bounds per channel
+    constraints: tuple[float, float]|None # Bounds of the total budget
+    ) -> tuple:
+    """Bounds and constraints in the form expected by `optimize` of each optimizer"""
+    if optimizer == "optuna":
+        return bounds, constraints
+    bounds = list(bounds.values())
+    if optimizer == "scipy" and constraints is not None:
+        constraints = opt.LinearConstraint(np.ones((1, len(bounds))), *constraints)
+    return bounds, constraints
+
+# %% ../nbs/03_server.ipynb 15
+def run_job(
+    job: Job, # The job to run
+    pool: ModelPool, # Warm models
+    progress_every: float = 1., # Minimum number of seconds between progress events
+    store: ResultStore|None = None # Results of previous jobs, returned instead of optimizing again
+    ) -> dict:
+    """Optimize the warm model of a job and record its result"""
+    spec = job.spec
+    start = time.perf_counter()
+    job.progress.start() # the time spent in the queue is not part of the throughput
+    name = spec.get("optimizer", "scipy")
+    fingerprint = job_fingerprint(
+        spec["model_path"], spec["config_path"], artifact=pool.fingerprint(spec["model_path"]), optimizer=name, 
+        **{key: spec.get(key) for key in ("bounds", "constraints", "config", "method", "options", "optimizer_options")})
+    if store is not None and (cached := store.get(fingerprint)) is not None:
+        return dict(cached, cached=True, seconds=time.perf_counter() - start)
+    model = pool.get(spec["model_path"], spec.get("model_name", "model"), spec.get("model_kpi", "kpi"))
+    optimizer_options = dict(spec.get("optimizer_options", {}))
+    if name == "optuna":
+        optimizer_options.setdefault("storage", "memory")
+    optimizer = OPTIMIZERS[name](model, spec["config_path"], **optimizer_options)
+    _apply_overrides(optimizer._config, spec.get("config", {}))
+    constraints = spec.get("constraints")
+    bounds, constraints = _optimize_args(
+        name, {key: tuple(value) for key, value in spec["bounds"].items()}, 
+        None if constraints is None else tuple(constraints))
+    method = spec.get("method", "optimize")
+    options = dict(spec.get("options", {}))
+    if "seed" in inspect.signature(getattr(optimizer, method)).parameters:
+        options.setdefault("seed", job_seed(fingerprint))
+    if name == "scipy" and method == "optimize" and options.get("init_pos") is None: # a fresh optimizer has no solution to warm start from
+        options["init_pos"] = optimizer.project(np.mean(bounds, axis=1), bounds, constraints)[0]
+    last_event = -np.inf
+    for incumbent in optimizer.optimize_iter(bounds, constraints, method=method, progress=job.progress, **options):
+        if time.perf_counter() - last_event >= progress_every:
+            last_event = time.perf_counter()
+            job.emit("progress", **_to_json(asdict(incumbent)), throughput=incumbent.throughput)
+    if optimizer.optimal_budget is None: # cancelled before the first evaluation
+        raise OptimizationCancelled()
+    result = _to_json({
+        "optimal_budget": {key: float(value) for key, value in optimizer.optimal_budget.items()},
+        "loss": float(optimizer._prediction_loss(optimizer.optimal_prediction)),
+        "evaluations": job.progress.evaluations,
+        "cancelled": job.progress.stopped,
+        "timed_out": optimizer.timed_out,
+        "fingerprint": fingerprint,
+        "cached": False,
+        "seconds": time.perf_counter() - start,
+    })
+    if store is not None and not (result["cancelled"] or result["timed_out"]): # only complete runs are reproducible
+        store.put(fingerprint, result)
+    return result
+
+# %% ../nbs/03_server.ipynb 17
+class JobScheduler:
+    """Queue of optimization jobs run against the warm models of a `ModelPool` with concurrency limits"""
+    def __init__(
+        self, 
+        pool: ModelPool|None = None, # Warm models, a new pool if None
+        max_jobs: int = 2, # Maximum number of jobs running at once
+        max_jobs_per_model: int = 1, # Maximum number of jobs running at once on the same model
+        progress_every: float = 1., # Minimum number of seconds between progress events of a job
+        store: ResultStore|None = None # Results of previous jobs, repeated jobs return them at once
+        ):
+        self.pool = ModelPool() if pool is None else pool
+        self.store = store
+        self.max_jobs = max_jobs
+        self.max_jobs_per_model = max_jobs_per_model
+        self.progress_every = progress_every
+        self.jobs: dict[str, Job] = {}
+        self._pending: list[Job] = []
+        self._running: dict[str, int] = {}
+        self._lock = threading.Lock()
+    
+    def submit(
+        self, 
+        spec: dict # The job, see above
+        ) -> Job:
+        """Queue a job and start it as soon as the concurrency limits allow"""
+        for key in ("model_path", "config_path", "bounds"):
+            if key not in spec:
+                raise ValueError(f"Job is missing {key!r}")
+        if spec.get("optimizer", "scipy") not in OPTIMIZERS:
+            raise ValueError(f"Unknown optimizer {spec['optimizer']!r}, expected one of {list(OPTIMIZERS)}")
+        job = Job(spec)
+        with self._lock:
+            self.jobs[job.id] = job
+            self._pending.append(job)
+        job.emit("queued")
+        self._dispatch()
+        return job
+    
+    def get(self, job_id: str) -> Job:
+        return self.jobs[job_id]
+    
+    def cancel(
+        self, 
+        job_id: str # Id of a queued or running job
+        ) -> bool: # Whether the job was cancelled, finished jobs are not
+        """Remove a job from the queue or stop it at the next evaluation of its optimizer"""
+        with self._lock:
+            job = self.jobs[job_id]
+            if job.status == "running":
+                job.progress.cancel()
+                return True
+            if job not in self._pending:
+                return False
+            self._pending.remove(job)
+            job.status = "cancelled"
+        job.emit("cancelled")
+        return True
+    
+    def _dispatch(self):
+        """Start the queued jobs allowed by the concurrency limits, in order of submission"""
+        with self._lock:
+            for job in list(self._pending):
+                if sum(self._running.values()) >= self.max_jobs:
+                    break
+                if self._running.get(job.model_key, 0) >= self.max_jobs_per_model:
+                    continue
+                self._pending.remove(job)
+                self._running[job.model_key] = self._running.get(job.model_key, 0) + 1
+                job.status = "running"
+                threading.Thread(target=self._run, args=(job,), daemon=True).start()
+    
+    def _run(self, job: Job):
+        job.emit("started")
+        try:
+            result = run_job(job, self.pool, self.progress_every, self.store)
+        except OptimizationCancelled:
+            job.status = "cancelled"
+            job.emit("cancelled")
+        except Exception as e:
+            job.status = "failed"
+            job.emit("error", error=f"{type(e).__name__}: {e}")
+        else:
+            job.result = result
+            job.status = "cancelled" if result["cancelled"] else "done"
+            job.emit("cancelled" if result["cancelled"] else "result", **result)
+        finally:
+            with self._lock:
+                self._running[job.model_key] -= 1
+            self._dispatch()
+    
+    def info(self) -> dict:
+        """Number of jobs per status and the warm models"""
+        statuses = [job.status for job in list(self.jobs.values())]
+        return {"jobs": {status: statuses.count(status) for status in set(statuses)}, "models": self.pool.info()}
+
+# %% ../nbs/03_server.ipynb 28
+class _JobHandler(BaseHTTPRequestHandler):
+    """Routes the requests of an `OptimizationServer` to its scheduler"""
+    protocol_version = "HTTP/1.0"
+    
+    @property
+    def scheduler(self) -> JobScheduler:
+        return self.server.scheduler
+    
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+    
+    def _send_json(self, body, status: int = 200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _job(self, parts: list[str]) -> Job|None:
+        job = self.scheduler.jobs.get(parts[1]) if len(parts) > 1 else None
+        if job is None:
+            self._send_json({"error": "Unknown job"}, 404)
+        return job
+    
+    def _stream(self, job: Job):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for event in job.stream():
+            self.wfile.write(json.dumps(event).encode() + b"\n")
+            self.wfile.flush()
+    
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        if parts == ["health"]:
+            return self._send_json(self.scheduler.info()["jobs"])
+        if parts == ["models"]:
+            return self._send_json(self.scheduler.pool.info())
+        if parts[0] != "jobs" or len(parts) > 3 or (len(parts) == 3 and parts[2] != "events"):
+            return self._send_json({"error": "Not found"}, 404)
+        if len(parts) == 1:
+            return self._send_json([job.summary() for job in list(self.scheduler.jobs.values())])
+        if (job := self._job(parts)) is None:
+            return
+        if len(parts) == 3:
+            return self._stream(job)
+        self._send_json(job.summary())
+    
+    def do_POST(self):
+        if self.path.strip("/") != "jobs":
+            return self._send_json({"error": "Not found"}, 404)
+        try:
+            spec = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            job = self.scheduler.submit(spec)
+        except (ValueError, TypeError) as e:
+            return self._send_json({"error": str(e)}, 400)
+        self._send_json({"id": job.id, "status": job.status}, 202)
+    
+    def do_DELETE(self):
+        parts = self.path.strip("/").split("/")
+        if parts[0] != "jobs" or len(parts) != 2:
+            return self._send_json({"error": "Not found"}, 404)
+        if (job := self._job(parts)) is None:
+            return
+        self._send_json({"id": job.id, "cancelled": self.scheduler.cancel(job.id)})
+
+# %% ../nbs/03_server.ipynb 29
+class OptimizationServer(ThreadingHTTPServer):
+    """HTTP server queueing optimization jobs on a `JobScheduler` and streaming their events"""
+    daemon_threads = True
+    
+    def __init__(
+        self, 
+        scheduler: JobScheduler|None = None, # Scheduler of the jobs, a new one if None
+        host: str = "127.0.0.1", # Interface to listen on, only the local machine by default
+        port: int = 8765, # Port to listen on, 0 picks a free port
+        verbose: bool = False # Log every request to stderr
+        ):
+        self.scheduler = JobScheduler() if scheduler is None else scheduler
+        self.verbose = verbose
+        super().__init__((host, port), _JobHandler)
+    
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> OptimizationServer:
+        """Serve in a background thread"""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+    
+    def stop(self):
+        """Stop serving and close the socket, running jobs finish in the background"""
+        self.shutdown()
+        self.server_close()
+
+# %% ../nbs/03_server.ipynb 31
+def submit_job(
+    url: str, # Url of the server
+    spec: dict # The job
+    ) -> str: # Id of the queued job
+    """Queue a job on a running server"""
+    request = urllib.request.Request(
+        f"{url}/jobs", data=json.dumps(spec).encode(), headers={"Content-Type": "application/json"}, method="POST")
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())["id"]
+
+def job_events(
+    url: str, # Url of the server
+    job_id: str # Id of the job
+    ) -> Iterator[dict]:
+    """Events of a job as they are emitted, until it finishes"""
+    with urllib.request.urlopen(f"{url}/jobs/{job_id}/events") as response:
+        for line in response:
+            yield json.loads(line)
+
+# %% ../nbs/03_server.ipynb 34
+@call_parse
+def serve_cli(
+    host: Param("Interface to listen on", str) = "127.0.0.1",
+    port: Param("Port to listen on", int) = 8765,
+    max_jobs: Param("Maximum number of jobs running at once", int) = 2,
+    max_jobs_per_model: Param("Maximum number of jobs running at once on the same model", int) = 1,
+    max_models: Param("Number of models kept warm", int) = 8,
+    share_memory: Param("Publish model data to shared memory for the process pools of jobs", bool_arg) = False,
+    progress_every: Param("Minimum number of seconds between progress events", float) = 1.,
+    store: Param("Sqlite file of stored results, repeated jobs are answered from it", str) = None,
+    verbose: Param("Log every request", bool_arg) = False,
+):
+    "Serve optimization jobs over HTTP, keeping models warm between jobs"
+    scheduler = JobScheduler(
+        ModelPool(max_models, share_memory), max_jobs, max_jobs_per_model, progress_every, 
+        None if store is None else ResultStore(store))
+    server = OptimizationServer(scheduler, host, port, verbose)
+    print(f"Serving optimization jobs on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
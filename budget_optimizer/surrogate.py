@@ -0,0 +1,273 @@
+"""Optimize expensive models on a cheap emulator of their predictions"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_surrogate.ipynb.
+
+# %% ../nbs/02_surrogate.ipynb 4
+from __future__ import annotations
+
+# %% auto 0
+__all__ = ['SurrogateModel', 'SurrogateBudgetOptimizer']
+
+# %% ../nbs/02_surrogate.ipynb 5
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from .optimizer import BaseOptimizer, PopulationBudgetOptimizer
+from .utils.model_classes import BaseBudgetModel
+from .utils.model_helpers import BudgetType, CANDIDATE_DIM, stack_budgets, to_scalar, lazy_import
+from .utils.prediction_cache import artifact_fingerprint
+from .utils.search_space_helper import ConstrainedSearchSpace
+from .utils.instrumentation import Instrumentation, NULL_INSTRUMENTATION
+
+# %% ../nbs/02_surrogate.ipynb 6
+opt = lazy_import("scipy.optimize")
+interpolate = lazy_import("scipy.interpolate")
+
+# %% ../nbs/02_surrogate.ipynb 8
+class SurrogateModel:
+    """
+    Radial basis function emulator of the predictions of a `BaseBudgetModel`
+    """
+    _SUFFIX = ".surrogate.npz"
+    
+    def __init__(
+        self,
+        model: BaseBudgetModel, # Model to emulate
+        channels: list[str], # Channels of the budgets, in the order of the emulator inputs
+        kernel: str = "thin_plate_spline", # Kernel of `scipy.interpolate.RBFInterpolator`
+        smoothing: float = 0., # Smoothing of the interpolation, 0 interpolates exactly
+        ):
+        self.model = model
+        self.model_name, self.model_kpi, self.model_path = model.model_name, model.model_kpi, model.model_path
+        self.channels = list(channels)
+        self.kernel = kernel
+        self.smoothing = smoothing
+        self.budgets = np.empty((0, len(self.channels)))
+        self.predictions: np.ndarray|None = None
+        self.template: xr.DataArray|None = None
+        self._interpolator: interpolate.RBFInterpolator|None = None
+        self._instrumentation = NULL_INSTRUMENTATION
+    
+    def add(
+        self,
+        budgets: np.ndarray, # Evaluated budgets, one per row in the order of `channels`
+        predictions: xr.DataArray # Predictions of the real model with a leading `candidate` dimension
+        ) -> "SurrogateModel":
+        """
+        Add evaluations of the real model to the training data
+        """
+        predictions = predictions.transpose(CANDIDATE_DIM, ...)
+        self.template = predictions.isel({CANDIDATE_DIM: 0}, drop=True)
+        values = predictions.values.reshape(len(budgets), -1)
+        self.budgets = np.vstack([self.budgets, budgets])
+        self.predictions = values if self.predictions is None else np.vstack([self.predictions, values])
+        self._interpolator = None
+        return self
+    
+    def evaluate(
+        self,
+        budgets: np.ndarray # Budgets, one per row in the order of `channels`
+        ) -> xr.DataArray: # Real predictions with a leading `candidate` dimension
+        """
+        Evaluate budgets with the real model in one batched call and add them to the training data
+        """
+        budgets = np.atleast_2d(budgets)
+        predictions = self.model.predict_batch(budgets, self.channels)
+        self.add(budgets, predictions)
+        return predictions
+    
+    def _inputs(self, budgets: np.ndarray) -> np.ndarray:
+        "Budgets scaled to the training range, dropping the last channel when the total is fixed"
+        scaled = (budgets - self._low)/self._scale
+        return scaled[:, :-1] if self._fixed_total else scaled
+    
+    def fit(self) -> "SurrogateModel":
+        """
+        Fit the interpolator to the training data
+        """
+        budgets, index = np.unique(self.budgets.round(12), axis=0, return_index=True)
+        self._low = budgets.min(axis=0)
+        self._scale = np.where(np.ptp(budgets, axis=0) > 0, np.ptp(budgets, axis=0), 1.)
+        totals = budgets.sum(axis=1)
+        # budgets with a fixed total lie on a hyperplane, which makes the polynomial terms singular
+        self._fixed_total = len(self.channels) > 1 and np.ptp(totals) <= 1e-9*max(1., np.abs(totals).max())
+        self._interpolator = interpolate.RBFInterpolator(
+            self._inputs(budgets), self.predictions[index], 
+            kernel=self.kernel, smoothing=self.smoothing)
+        return self
+    
+    def _emulate(self, budgets: np.ndarray) -> np.ndarray:
+        if self._interpolator is None:
+            self.fit()
+        with self._instrumentation.stage("emulate"):
+            return self._interpolator(self._inputs(np.atleast_2d(budgets)))
+    
+    def predict(
+        self,
+        budget: BudgetType, # Budget
+        window: dict[str, slice]|None = None # Only return these coordinates
+        ) -> xr.DataArray: # Emulated prediction
+        """
+        Emulate the prediction of the real model
+        """
+        values = self._emulate(np.array([budget[name] for name in self.channels]))
+        prediction = self.template.copy(data=values.reshape(self.template.shape))
+        return prediction if window is None else prediction.sel(window)
+    
+    def predict_batch(
+        self,
+        budgets: xr.Dataset|np.ndarray|list[BudgetType], # Budgets stacked along `candidate`, a 2-D array or a list of budgets
+        channels: list[str]|None = None, # Channel names for the columns of a 2-D array
+        window: dict[str, slice]|None = None # Only return these coordinates
+        ) -> xr.DataArray: # Emulated predictions with a `candidate` dimension
+        """
+        Emulate the predictions of the real model for many budgets at once
+        """
+        budgets = stack_budgets(budgets, channels)
+        values = self._emulate(np.stack([budgets[name].values for name in self.channels], axis=1))
+        prediction = xr.DataArray(
+            values.reshape(-1, *self.template.shape), 
+            dims=(CANDIDATE_DIM, *self.template.dims), 
+            coords=self.template.coords, name=self.template.name)
+        return prediction if window is None else prediction.sel(window)
+    
+    def contributions(
+        self, 
+        budget: BudgetType # Budget
+        ) -> xr.Dataset: # Contributions of the real model
+        """
+        Contributions of the real model, they are not emulated
+        """
+        return self.model.contributions(budget)
+    
+    has_jac = False
+    has_batch = True
+    
+    def instrument(self, instrumentation: Instrumentation|None = None) -> Instrumentation:
+        "Time the emulator evaluations"
+        self._instrumentation = instrumentation or Instrumentation()
+        return self._instrumentation
+    
+    def uninstrument(self) -> "SurrogateModel":
+        "Stop reporting to the instrumentation"
+        self._instrumentation = NULL_INSTRUMENTATION
+        return self
+    
+    def default_path(self) -> Path:
+        "Path of the saved emulator, next to the model artifact"
+        return self.model_path.with_name(self.model_path.name + self._SUFFIX)
+    
+    def save(
+        self,
+        path: str|Path|None = None # File to save to, defaults to `default_path`
+        ) -> Path:
+        """
+        Save the training data with the fingerprint of the model artifact
+        """
+        path = Path(path) if path is not None else self.default_path()
+        np.savez(
+            path, budgets=self.budgets, predictions=self.predictions, channels=np.array(self.channels),
+            dims=np.array(self.template.dims), shape=np.array(self.template.shape), 
+            name=np.array(self.template.name or ""), 
+            fingerprint=np.array(artifact_fingerprint(self.model_path)),
+            **{f"coord_{dim}": self.template[dim].values for dim in self.template.dims if dim in self.template.coords})
+        return path
+    
+    @classmethod
+    def load(
+        cls,
+        model: BaseBudgetModel, # Model the emulator was fitted on
+        path: str|Path|None = None, # Saved emulator, defaults to the file next to the model artifact
+        **kwargs # Arguments of the emulator
+        ) -> "SurrogateModel|None": # None if there is no emulator for the current model artifact
+        """
+        Load a saved emulator, ignoring it if the model artifact changed since it was saved
+        """
+        path = Path(path) if path is not None else model.model_path.with_name(model.model_path.name + cls._SUFFIX)
+        if not path.exists():
+            return None
+        with np.load(path) as saved:
+            if str(saved["fingerprint"]) != artifact_fingerprint(model.model_path):
+                return None
+            surrogate = cls(model, list(saved["channels"]), **kwargs)
+            dims = list(saved["dims"])
+            coords = {dim: saved[f"coord_{dim}"] for dim in dims if f"coord_{dim}" in saved}
+            predictions = xr.DataArray(
+                saved["predictions"].reshape(-1, *saved["shape"]), 
+                dims=(CANDIDATE_DIM, *dims), coords=coords, name=str(saved["name"]) or None)
+            surrogate.add(saved["budgets"], predictions)
+        return surrogate
+
+# %% ../nbs/02_surrogate.ipynb 10
+class SurrogateBudgetOptimizer(BaseOptimizer):
+    """Optimize on an emulator of the model, checking promising candidates against the real model"""
+    
+
+    def _real_losses(self, predictions: xr.DataArray) -> np.ndarray:
+        return np.array([
+            self._prediction_loss(predictions.isel({CANDIDATE_DIM: i}, drop=True))
+            for i in range(predictions.sizes[CANDIDATE_DIM])])
+    
+    def optimize(
+        self,
+        bounds: list[tuple[float, float]], # Bounds for the optimizer
+        constraints: tuple[float, float]|None = None, # Bounds of the sum of the optimizer array
+        n_samples: int|None = None, # Size of the initial design, defaults to 10 per dimension plus 10
+        top_k: int = 4, # Candidates checked against the real model per round
+        max_rounds: int = 10, # Maximum number of refits
+        rtol: float = 1e-3, # Stop once the relative loss error of the emulator at the best candidate is below this value
+        seed: int|None = None, # Seed of the design and of the population optimizer
+        reuse: bool = True, # Start from the emulator saved at `path`
+        save: bool = False, # Save the emulator to `path`
+        path: str|Path|None = None, # Emulator file, defaults to `SurrogateModel.default_path` next to the model artifact
+        **kwargs # Arguments of `PopulationBudgetOptimizer.optimize`
+        ):
+        """Optimize the model"""
+        rng = np.random.default_rng(seed)
+        lows, highs = np.array(bounds, dtype=float).T
+        constraints = (-np.inf, np.inf) if constraints is None else constraints
+        channels = self._array_channels(len(bounds))
+        surrogate = SurrogateModel.load(self.model, path) if reuse else None
+        if surrogate is None or surrogate.channels != channels:
+            surrogate = SurrogateModel(self.model, channels)
+        space = ConstrainedSearchSpace({i: bound for i, bound in enumerate(bounds)}, constraints)
+        n_samples = 10*len(bounds) + 10 if n_samples is None else n_samples
+        known = surrogate.budgets[space.is_feasible(surrogate.budgets[:, space.names])]
+        n_evaluations = max(0, n_samples - len(known))
+        if n_evaluations:
+            surrogate.evaluate(space.sample(n_evaluations, seed=rng)[:, np.argsort(space.names)])
+        inner = PopulationBudgetOptimizer(surrogate, self._config_path)
+        inner._config = self._config
+        best_x, best_loss, errors = None, np.inf, []
+        for iteration in range(1, max_rounds + 1):
+            surrogate.fit()
+            inner.optimize(bounds, constraints, seed=rng, **kwargs)
+            order = np.argsort(inner.population_losses)
+            candidates = np.unique(inner.population[order[:top_k]].round(12), axis=0)
+
+            emulated = self._real_losses(surrogate.predict_batch(candidates, channels))
+            predictions = surrogate.evaluate(candidates)
+            losses = self._real_losses(predictions)
+            self._observe([self._optimizer_array_to_budget(x) for x in candidates], losses)
+            n_evaluations += len(candidates)
+            best = np.argmin(losses)
+            if losses[best] < best_loss:
+                best_x, best_loss = candidates[best], losses[best]
+            relative_error = abs(emulated[best] - losses[best])/max(abs(losses[best]), 1e-12)
+            errors.append({
+                "round": iteration, "training_budgets": len(surrogate.budgets) - len(candidates),
+                "best_loss": best_loss, "relative_loss_error": relative_error,
+                "max_relative_loss_error": np.max(np.abs(emulated - losses)/np.maximum(np.abs(losses), 1e-12))})
+            if relative_error < rtol:
+                break
+        self.surrogate = surrogate
+        self.emulator_errors = pd.DataFrame(errors).set_index("round")
+        if save:
+            surrogate.save(path)
+        self._set_solution(opt.OptimizeResult(
+            x=best_x, fun=best_loss, success=True, nit=iteration, nfev=n_evaluations,
+            message="Emulator converged" if errors[-1]["relative_loss_error"] < rtol else "Maximum number of rounds reached"))
+        return self
@@ -0,0 +1,217 @@
+"""Per-stage timers, call counters and allocation tracking for the optimization hot path"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/utils/04_instrumentation.ipynb.
+
+# %% auto 0
+__all__ = ['NULL_INSTRUMENTATION', 'Observer', 'LogExporter', 'Instrumentation', 'NullInstrumentation']
+
+# %% ../../nbs/utils/04_instrumentation.ipynb 3
+import io
+import json
+import time
+import heapq
+import logging
+import pstats
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from collections import defaultdict
+
+import pandas as pd
+
+# %% ../../nbs/utils/04_instrumentation.ipynb 5
+class Observer:
+    "Receives instrumentation events, override the methods you need"
+    def on_stage(
+        self, 
+        stage: str, # Name of the stage
+        seconds: float, # Wall time spent in the stage
+        allocated: int|None # Net bytes allocated during the stage, None if allocations are not tracked
+        ):
+        pass
+    
+    def on_evaluation(
+        self, 
+        seconds: float # Wall time of the evaluation
+        ):
+        pass
+
+# %% ../../nbs/utils/04_instrumentation.ipynb 6
+class LogExporter(Observer):
+    "Write every event as a JSON record to a logger"
+    def __init__(
+        self, 
+        logger: logging.Logger|None = None, # Logger to write to, defaults to `budget_optimizer.instrumentation`
+        level: int = logging.INFO # Level of the records
+        ):
+        self.logger = logger or logging.getLogger("budget_optimizer.instrumentation")
+        self.level = level
+    
+    def on_stage(self, stage, seconds, allocated):
+        self.logger.log(self.level, json.dumps(
+            {"event": "stage", "stage": stage, "seconds": seconds, "allocated": allocated}))
+    
+    def on_evaluation(self, seconds):
+        self.logger.log(self.level, json.dumps({"event": "evaluation", "seconds": seconds}))
+
+# %% ../../nbs/utils/04_instrumentation.ipynb 8
+class Instrumentation:
+    """
+    Per-stage timers, call counters and allocation tracking reported to observers
+    """
+    enabled = True
+    
+    def __init__(
+        self,
+        observers: list[Observer]|None = None, # Observers notified of every event
+        track_allocations: bool = False, # Track net allocations per stage with tracemalloc
+        profile_slowest: int = 0, # Keep a profile of the N slowest evaluations
+        profiler: str = "cprofile", # "cprofile" or "pyinstrument"
+        ):
+        self.observers = list(observers or [])
+        self.track_allocations = track_allocations
+        self.profile_slowest = profile_slowest
+        self.profiler = profiler
+        self.stats = defaultdict(lambda: {"calls": 0, "seconds": 0., "allocated": 0})
+        self.evaluations = 0
+        self.evaluation_seconds = 0.
+        self._slowest: list[tuple[float, int, str]] = []
+        self._lock = threading.Lock()
+        self._started_tracing = track_allocations and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+    
+    def close(self):
+        "Stop tracing allocations if this instrumentation started it, the statistics stay readable"
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    @contextmanager
+    def stage(
+        self, 
+        name: str # Name of the stage
+        ):
+        "Time a stage of an evaluation"
+        allocated = tracemalloc.get_traced_memory()[0] if self.track_allocations else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            if allocated is not None:
+                allocated = max(0, tracemalloc.get_traced_memory()[0] - allocated)
+            with self._lock:
+                stats = self.stats[name]
+                stats["calls"] += 1
+                stats["seconds"] += seconds
+                stats["allocated"] += allocated or 0
+            for observer in self.observers:
+                observer.on_stage(name, seconds, allocated)
+    
+    @contextmanager
+    def evaluation(self):
+        "Time a whole evaluation, profiling it if the slowest evaluations are kept"
+        profiler = self._start_profiler() if self.profile_slowest else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                self.evaluations += 1
+                self.evaluation_seconds += seconds
+                if profiler is not None:
+                    self._keep_profile(seconds, profiler)
+            for observer in self.observers:
+                observer.on_evaluation(seconds)
+    
+    def _start_profiler(self):
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+            profiler = Profiler()
+        else:
+            profiler = cProfile.Profile()
+        profiler.start() if self.profiler == "pyinstrument" else profiler.enable()
+        return profiler
+    
+    def _keep_profile(self, seconds: float, profiler):
+        if len(self._slowest) >= self.profile_slowest and seconds <= self._slowest[0][0]:
+            (profiler.stop() if self.profiler == "pyinstrument" else profiler.disable())
+            return
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+            report = profiler.output_text()
+        else:
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(20)
+            report = stream.getvalue()
+        heapq.heappush(self._slowest, (seconds, self.evaluations, report))
+        if len(self._slowest) > self.profile_slowest:
+            heapq.heappop(self._slowest)
+    
+    def slowest_profiles(self) -> list[tuple[float, str]]:
+        "Wall time and profile report of the slowest evaluations, slowest first"
+        return [(seconds, report) for seconds, _, report in sorted(self._slowest, reverse=True)]
+    
+    def summary(self) -> pd.DataFrame:
+        "Calls, time and allocations per stage"
+        table = pd.DataFrame.from_dict(dict(self.stats), orient="index", columns=["calls", "seconds", "allocated"])
+        table["mean_seconds"] = table.seconds/table.calls
+        if self.evaluation_seconds:
+            table["share"] = table.seconds/self.evaluation_seconds
+        if not self.track_allocations:
+            table = table.drop(columns="allocated")
+        return table.sort_values("seconds", ascending=False)
+    
+    def drain(self) -> dict:
+        "Picklable copy of the collected statistics, forgotten here, used to send the statistics of a worker process"
+        with self._lock:
+            drained = {"stats": {name: dict(stats) for name, stats in self.stats.items()},
+                       "evaluations": self.evaluations, "evaluation_seconds": self.evaluation_seconds}
+            self.stats.clear()
+            self.evaluations, self.evaluation_seconds = 0, 0.
+        return drained
+    
+    def merge(
+        self, 
+        drained: dict # Statistics returned by `drain`
+        ):
+        "Add the statistics drained from another instrumentation"
+        with self._lock:
+            for name, stats in drained["stats"].items():
+                for key, value in stats.items():
+                    self.stats[name][key] += value
+            self.evaluations += drained["evaluations"]
+            self.evaluation_seconds += drained["evaluation_seconds"]
+        return self
+    
+    def reset(self):
+        "Forget the collected statistics and profiles"
+        with self._lock:
+            self.stats.clear()
+            self.evaluations = 0
+            self.evaluation_seconds = 0.
+            self._slowest = []
+
+# %% ../../nbs/utils/04_instrumentation.ipynb 9
+class NullInstrumentation:
+    "Disabled instrumentation, every hook is a shared no-op context"
+    enabled = False
+    _context = nullcontext()
+    
+    def stage(self, name: str):
+        return self._context
+    
+    def evaluation(self):
+        return self._context
+
+NULL_INSTRUMENTATION = NullInstrumentation() # default of every model and optimizer
@@ -0,0 +1,121 @@
+"""Fingerprint optimization jobs, derive their seeds and keep their results"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/utils/06_job_store.ipynb.
+
+# %% auto 0
+__all__ = ['JOB_CONFIG_FILES', 'file_digest', 'job_fingerprint', 'job_seed', 'ResultStore']
+
+# %% ../../nbs/utils/06_job_store.ipynb 3
+import json
+import sqlite3
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .prediction_cache import artifact_fingerprint
+
+# %% ../../nbs/utils/06_job_store.ipynb 5
+JOB_CONFIG_FILES = {
+    "model_path": ("model_config.py",), 
+    "config_path": ("optimizer_config.py", "optimizer_config.yaml"),
+}
+
+def _json_default(value: Any):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Cannot fingerprint {type(value).__name__} settings, use JSON values")
+
+def file_digest(
+  path: str|Path, # File to hash
+) -> str: # Hash of the content, empty if the file does not exist
+    "Hash of the content of a file."
+    path = Path(path)
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else ""
+
+# %% ../../nbs/utils/06_job_store.ipynb 6
+def job_fingerprint(
+  model_path: str|Path, # Path to the model artifact directory
+  config_path: str|Path, # Directory of the optimizer configuration files
+  artifact: str|None = None, # Fingerprint of the model artifact if already known, computed from `model_path` if None
+  **settings: Any, # Bounds, constraints and optimizer settings, JSON values or numpy arrays
+) -> str: # Hash identifying the job
+    "Fingerprint everything that determines the result of an optimization job."
+    digest = hashlib.sha256((artifact_fingerprint(model_path) if artifact is None else artifact).encode())
+    directories = {"model_path": Path(model_path), "config_path": Path(config_path)}
+    for key, names in JOB_CONFIG_FILES.items():
+        for name in names:
+            digest.update(f"{name}:{file_digest(directories[key]/name)};".encode())
+    digest.update(json.dumps(settings, sort_keys=True, default=_json_default).encode())
+    return digest.hexdigest()
+
+# %% ../../nbs/utils/06_job_store.ipynb 10
+def job_seed(
+  fingerprint: str, # Fingerprint of the job
+  worker: int|None = None, # Index of a worker of the job, the seed of the job itself if None
+) -> int: # Seed for numpy, scipy or optuna
+    "Seed derived from a job fingerprint."
+    sequence = np.random.SeedSequence(int(fingerprint[:32], 16))
+    if worker is not None:
+        sequence = sequence.spawn(worker + 1)[worker]
+    return int(sequence.generate_state(1)[0])
+
+# %% ../../nbs/utils/06_job_store.ipynb 13
+class ResultStore:
+    """
+    JSON results of optimization jobs keyed by their fingerprint, persisted to a sqlite file
+    """
+    def __init__(
+        self,
+        path: str|Path, # Path to the sqlite file
+        ):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "fingerprint TEXT PRIMARY KEY, result TEXT, created REAL)")
+        self._conn.commit()
+    
+    def get(
+        self, 
+        fingerprint: str # Fingerprint of the job
+        ) -> dict|None: # The stored result, None if the job never finished
+        "Result of a job run before"
+        with self._lock:
+            row = self._conn.execute("SELECT result FROM results WHERE fingerprint = ?", (fingerprint,)).fetchone()
+        return None if row is None else json.loads(row[0])
+    
+    def put(
+        self, 
+        fingerprint: str, # Fingerprint of the job
+        result: dict # JSON serializable result
+        ):
+        "Store the result of a job"
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)", 
+                (fingerprint, json.dumps(result, default=_json_default), time.time()))
+            self._conn.commit()
+    
+    def __contains__(self, fingerprint: str) -> bool:
+        return self.get(fingerprint) is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def clear(self):
+        "Drop all results"
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+    
+    def close(self):
+        "Close the connection to the sqlite file"
+        self._conn.close()
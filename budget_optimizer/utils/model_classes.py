@@ -8,21 +8,41 @@ __all__ = ['BaseBudgetModel']
 # %% ../../nbs/utils/00_model_classes.ipynb 5
 from abc import ABC, abstractmethod
 from pathlib import Path
-from collections.abc import Sequence
+from collections.abc import Sequence, Iterator
 from typing import (
   Callable, Generic, 
   TypeVar, Union, 
   Protocol, Dict,
   TypeAlias)
 import types
+import pickle
+import threading
 
+import numpy as np
 import xarray as xr
 
 from budget_optimizer.utils.model_helpers import (
   load_module,
+  load_config_module,
   AbstractModel,
-  BudgetType
+  BudgetType,
+  CANDIDATE_DIM,
+  stack_budgets,
+  unstack_budgets,
+  ScaledDataset
 )
+from budget_optimizer.utils.prediction_cache import (
+  PredictionCache,
+  SqlitePredictionCache,
+  CacheInfo,
+  artifact_fingerprint
+)
+from budget_optimizer.utils.instrumentation import (
+  Instrumentation,
+  NullInstrumentation,
+  NULL_INSTRUMENTATION
+)
+from .shared_memory import SharedMemoryPublisher
 
 # %% ../../nbs/utils/00_model_classes.ipynb 6
 class BaseBudgetModel(AbstractModel):
@@ -40,17 +60,124 @@ class BaseBudgetModel(AbstractModel):
         self.model_name: str = model_name
         self.model_kpi: str = model_kpi
         self.model_path: Path = model_path if isinstance(model_path, Path) else Path(model_path)
-        self._model: AbstractModel = self._get_model_loader()(model_path)
+        self._model: AbstractModel = self._load_model(model_path)
+        self._bind_config()
+        self._buffers = threading.local() # reusable scaled data buffers, one set per thread
+        self._cache: PredictionCache|None = None
+        self._fingerprint: str|None = None # fingerprint of the artifact, computed by `enable_cache`
+        self._instrumentation: Instrumentation|NullInstrumentation = NULL_INSTRUMENTATION
+        self._publisher: SharedMemoryPublisher|None = None
+        self._shared_payload: bytes|None = None
+    
+    def __reduce__(self):
+        """
+        Pickle by reference to the artifact, unpickling reloads the model with `model_loader` unless its memory is shared
+        """
+        args = (self.__class__, self.model_name, self.model_kpi, self.model_path)
+        if self._shared_payload is not None:
+            args += (self._shared_payload,)
+        return (_load_budget_model, args)
+    
+    def _load_model(
+        self, 
+        model_path: str|Path # Path to the model artifact
+        ) -> AbstractModel:
+        "Load the model with `model_loader`, or take the model attached from shared memory"
+        preloaded = self.__dict__.pop("_preloaded", None)
+        return preloaded if preloaded is not None else self._get_model_loader()(model_path)
+    
+    def share_memory(
+        self, 
+        min_bytes: int = 1 << 16 # Smaller arrays are pickled by value
+        ) -> "BaseBudgetModel":
+        """
+        Publish the loaded model's arrays in shared memory, processes unpickling this model attach read-only views instead of calling `model_loader`
+        """
+        self.unshare_memory()
+        config_path = self.model_path / self._FUNCTION_MODULE_NAME
+        self._publisher = SharedMemoryPublisher(min_bytes, {config_path: self._config_module()})
+        self._shared_payload = self._publisher.dumps(self._model)
+        return self
+    
+    def unshare_memory(self):
+        "Unlink the shared memory blocks, later pickles reload the model from its artifact"
+        if self._publisher is not None:
+            self._publisher.close()
+        self._publisher, self._shared_payload = None, None
+
+    def _config_module(self) -> types.ModuleType:
+        """
+        The model's `model_config.py`, executed once per process and shared through `CONFIG_REGISTRY`
+        """
+        return load_config_module(self.model_path / self._FUNCTION_MODULE_NAME)
+    
+    def _bind_config(self):
+        """
+        Bind the functions defined in `model_config.py`
+        """
         self._budget_to_data: xr.Dataset = self._get_budget_to_data()
+        self._budget_to_data_batch = self._get_budget_to_data_batch()
+        self._predict_jac = self._get_predict_jac()
+        self._budget_to_multipliers = self._get_budget_to_multipliers()
+        self._lookback: int|None = getattr(self._config_module(), "LOOKBACK", None)
+        self._predict_chunks: dict[str, int]|None = getattr(self._config_module(), "PREDICT_CHUNKS", None)
+        self._predict_steps: dict[str, int]|None = getattr(self._config_module(), "PREDICT_STEPS", None)
+        self._predict_iter = getattr(self._config_module(), "predict_iter", None)
+        self._posterior_draws: dict[str, int]|None = getattr(self._config_module(), "POSTERIOR_DRAWS", None)
+        self._select_draws = getattr(self._config_module(), "select_draws", None)
+        self.use_draws(getattr(self, "n_draws", None), getattr(self, "_draw_seed", 0))
+    
+    @property
+    def draw_dim(self) -> str|None:
+        "Dimension of the posterior draws in the predictions, declared by `POSTERIOR_DRAWS`"
+        return None if self._posterior_draws is None else next(iter(self._posterior_draws))
+    
+    @property
+    def posterior_draws(self) -> int|None:
+        "Number of posterior draws declared by `POSTERIOR_DRAWS`"
+        return None if self._posterior_draws is None else next(iter(self._posterior_draws.values()))
+    
+    def use_draws(
+        self,
+        n_draws: int|None = None, # Number of posterior draws to predict, all of them if None
+        seed: int = 0 # Seed of the order in which draws are added
+        ) -> "BaseBudgetModel":
+        """
+        Predict a fixed random subset of the posterior draws, the same for every budget, growing subsets keep the earlier draws
+        """
+        if n_draws is not None and self._posterior_draws is None:
+            raise ValueError(f"{self._FUNCTION_MODULE_NAME} does not declare POSTERIOR_DRAWS")
+        if n_draws is None or n_draws >= self.posterior_draws:
+            self.n_draws, self._draws, self._draw_model = None, None, None
+            return self
+        self.n_draws, self._draw_seed = n_draws, seed
+        self._draws = np.sort(np.random.default_rng(seed).permutation(self.posterior_draws)[:n_draws])
+        self._draw_model = None if self._select_draws is None else self._select_draws(self._model, self._draws)
+        return self
+    
+    def _model_output(self, data: xr.Dataset) -> xr.DataArray:
+        "Predict the data, restricted to the selected posterior draws"
+        if self._draws is None:
+            return self._model.predict(data)
+        if self._draw_model is not None:
+            return self._draw_model.predict(data)
+        return self._model.predict(data).isel({self.draw_dim: self._draws})
+    
+    def reload_config(self) -> "BaseBudgetModel":
+        """
+        Execute `model_config.py` again and rebind its functions, keeping the loaded model
+        """
+        load_config_module(self.model_path / self._FUNCTION_MODULE_NAME, reload=True)
+        self._bind_config()
+        if self._cache is not None: # predictions of the previous config are stale
+            self._fingerprint = artifact_fingerprint(self.model_path)
+        return self
 
     def _get_model_loader(self) -> Callable[str|Path, AbstractModel]:
         """
         Get the function to load the model from the path
         """
-        module = load_module(
-            self._FUNCTION_MODULE_NAME.replace(".py", ""),
-            self.model_path / self._FUNCTION_MODULE_NAME
-            )
+        module = self._config_module()
         return module.model_loader
     
     def _get_budget_to_data(self) -> Callable[BudgetType, xr.Dataset]:
@@ -58,23 +185,243 @@ class BaseBudgetModel(AbstractModel):
         Get the mapping from budget keys to data keys
         """
         
-        module = load_module(
-            self._FUNCTION_MODULE_NAME.replace(".py", ""), 
-            self.model_path / self._FUNCTION_MODULE_NAME
-            )
+        module = self._config_module()
         
         return module.budget_to_data
     
+    def _get_budget_to_data_batch(self) -> Callable[xr.Dataset, xr.Dataset]|None:
+        """
+        Get the optional vectorized mapping from stacked budgets to data
+        """
+        module = self._config_module()
+        return getattr(module, "budget_to_data_batch", None)
+    
+    def _get_budget_to_multipliers(self) -> Callable[BudgetType, dict]|None:
+        """
+        Get the optional mapping from a budget to per-channel multipliers of the model data
+        """
+        module = self._config_module()
+        self._reuse_buffers: bool = getattr(module, "REUSE_BUFFERS", False)
+        return getattr(module, "budget_to_multipliers", None)
+    
+    def _get_predict_jac(self) -> Callable[BudgetType, xr.DataArray]|None:
+        """
+        Get the optional derivative of the prediction with respect to each channel's spend
+        """
+        module = self._config_module()
+        return getattr(module, "predict_jac", None)
+    
+    @property
+    def has_jac(self) -> bool:
+        "Whether `model_config.py` provides `predict_jac`"
+        return self._predict_jac is not None
+    
+    @property
+    def has_batch(self) -> bool:
+        "Whether `predict_batch` predicts many budgets in one model call instead of one at a time"
+        return self._budget_to_multipliers is not None or self._budget_to_data_batch is not None
+    
+    def predict_jac(
+        self,
+        budget: BudgetType # Budget
+        ) -> xr.DataArray: # Derivative of the prediction with a `channel` dimension
+        """
+        Derivative of the predicted target variable with respect to the spend of each channel
+        """
+        if self._predict_jac is None:
+            raise NotImplementedError(f"{self._FUNCTION_MODULE_NAME} does not define predict_jac")
+        return self._predict_jac(budget, self._model)
+    
     def predict(
         self, 
-        budget: BudgetType # Budget
+        budget: BudgetType, # Budget
+        window: dict[str, slice]|None = None # Only predict these coordinates, e.g. `{"time": slice(start, end)}`
         ) -> xr.DataArray: # Predicted target variable
         """
         Predict the target variable from the input data
         """
-        data = self._budget_to_data(budget, self._model)
-        return self._model.predict(data)
+        window = window if _window_key(window) else None
+        if self._cache is None or not isinstance(budget, dict):
+            return self._predict(budget, window)
+        prediction = self._cached(budget, window)
+        if prediction is None:
+            prediction = self._predict(budget, window)
+            self._cache.put(self._cache_key(budget, window), prediction)
+        return prediction
     
+    def _cached(self, budget: BudgetType, window: dict[str, slice]|None) -> xr.DataArray|None:
+        "Cached prediction, sliced from the cached full prediction if the window itself is not cached"
+        prediction = self._cache.get(self._cache_key(budget, window))
+        if prediction is None and window is not None:
+            prediction = self._cache.get(self._cache_key(budget))
+            prediction = None if prediction is None else prediction.sel(window)
+        return prediction
+    
+    def _predict(self, budget: BudgetType, window: dict[str, slice]|None = None) -> xr.DataArray:
+        prediction = self._model_predict(budget, window)
+        return prediction if window is None else prediction.sel(window)
+    
+    def _model_predict(self, budget: BudgetType, window: dict[str, slice]|None) -> xr.DataArray:
+        """
+        Scale and predict the data, one chunk of `PREDICT_CHUNKS` at a time if it is declared
+        """
+        if self._predict_chunks is None or self._budget_to_multipliers is None:
+            with self._instrumentation.stage("budget_to_data"):
+                data = self._input_data(budget, window)
+            with self._instrumentation.stage("model_predict"):
+                return self._model_output(data)
+        dim, size = next(iter(self._predict_chunks.items()))
+        predictions = []
+        for start in range(0, self._base_data(window).sizes[dim], size):
+            with self._instrumentation.stage("budget_to_data"):
+                data = self._input_data(budget, window, {dim: slice(start, start + size)})
+            with self._instrumentation.stage("model_predict"):
+                predictions.append(self._model_output(data))
+        return xr.concat(predictions, dim=dim)
+    
+    def predict_iter(
+        self, 
+        budget: BudgetType, # Budget
+        window: dict[str, slice]|None = None # Only predict these coordinates, e.g. `{"time": slice(start, end)}`
+        ) -> Iterator[xr.DataArray]: # Predictions of growing parts of the data, the last one is complete
+        """
+        Predict progressively, one step of `PREDICT_STEPS` or of the `predict_iter` of `model_config.py` at a time
+        """
+        window = window if _window_key(window) else None
+        cached = self._cache is not None and isinstance(budget, dict)
+        prediction = self._cached(budget, window) if cached else None
+        if prediction is not None or (self._predict_iter is None and self._predict_steps is None):
+            yield self.predict(budget, window) if prediction is None else prediction
+            return
+        for prediction in self._progressive_predict(budget, window):
+            prediction = prediction if window is None else prediction.sel(window)
+            yield prediction
+        if cached:
+            self._cache.put(self._cache_key(budget, window), prediction)
+    
+    def _progressive_predict(self, budget: BudgetType, window: dict[str, slice]|None) -> Iterator[xr.DataArray]:
+        if self._predict_iter is not None:
+            yield from self._predict_iter(budget, self._model if self._draw_model is None else self._draw_model)
+            return
+        dim, size = next(iter(self._predict_steps.items()))
+        data = None
+        if self._budget_to_multipliers is None:
+            with self._instrumentation.stage("budget_to_data"):
+                data = self._input_data(budget, window)
+        predictions = []
+        for start in range(0, (self._base_data(window) if data is None else data).sizes[dim], size):
+            chunk = {dim: slice(start, start + size)}
+            with self._instrumentation.stage("budget_to_data"):
+                part = self._input_data(budget, window, chunk) if data is None else data.isel(chunk)
+            with self._instrumentation.stage("model_predict"):
+                predictions.append(self._model_output(part))
+            yield xr.concat(predictions, dim=dim)
+    
+    def _window_indexers(
+        self, 
+        data: xr.Dataset, # Full model data
+        window: dict[str, slice] # Coordinates to predict
+        ) -> dict[str, slice]: # Positions of the data needed to predict the window
+        """
+        Positions of the window in the data, extended backwards by `LOOKBACK` steps
+        """
+        indexers = {}
+        for dim, selection in window.items():
+            positions = data.indexes[dim].slice_indexer(selection.start, selection.stop)
+            indexers[dim] = slice(max(0, positions.start - self._lookback), positions.stop)
+        return indexers
+    
+    def instrument(
+        self,
+        instrumentation: Instrumentation|None = None # Instrumentation to report to, a new one if None
+        ) -> Instrumentation:
+        """
+        Time the stages of every prediction
+        """
+        self._instrumentation = instrumentation or Instrumentation()
+        return self._instrumentation
+    
+    def uninstrument(self) -> "BaseBudgetModel":
+        """
+        Stop reporting to the instrumentation
+        """
+        self._instrumentation = NULL_INSTRUMENTATION
+        return self
+    
+    def budget_data(
+        self,
+        budget: BudgetType, # Budget, or budgets stacked along `candidate`
+        window: dict[str, slice]|None = None, # Only the data needed to predict these coordinates, if `LOOKBACK` is declared
+        chunk: dict[str, slice]|None = None # Positions of the windowed data to keep
+        ) -> xr.Dataset|ScaledDataset: # Model input data
+        """
+        Model input data for a budget, a lazily scaled view if `model_config.py` defines `budget_to_multipliers`
+        """
+        return self._input_data(budget, window, chunk, reuse_buffers=False)
+    
+    def _input_data(
+        self,
+        budget: BudgetType, # Budget, or budgets stacked along `candidate`
+        window: dict[str, slice]|None = None, # Only the data needed to predict these coordinates
+        chunk: dict[str, slice]|None = None, # Positions of the windowed data to keep
+        reuse_buffers: bool = True # Scale into the buffers of this thread if `REUSE_BUFFERS` is set
+        ) -> xr.Dataset|ScaledDataset:
+        "Input data of the predict path, its scaled channels are overwritten by the next call if buffers are reused"
+        if self._lookback is None:
+            window = None
+        if self._budget_to_multipliers is None:
+            data = self._budget_to_data(budget, self._model)
+            data = data if window is None else data.isel(self._window_indexers(data, window))
+            return data if chunk is None else data.isel(chunk)
+        buffers = None
+        if reuse_buffers and self._reuse_buffers and not isinstance(budget, xr.Dataset):
+            buffers = self._buffers.__dict__.setdefault("arrays", {}).setdefault(_window_key(window), {})
+        data = self._base_data(window)
+        data = data if chunk is None else data.isel(chunk)
+        return ScaledDataset(data, self._budget_to_multipliers(budget, self._model), buffers)
+    
+    def _base_data(self, window: dict[str, slice]|None) -> xr.Dataset:
+        "Unscaled model data needed to predict the window"
+        if window is None or self._lookback is None:
+            return self._model.data
+        return self._model.data.isel(self._window_indexers(self._model.data, window))
+    
+    def _cache_key(self, budget: BudgetType, window: dict[str, slice]|None = None) -> tuple:
+        self._cache.set_namespace(self._fingerprint) # a cache shared by several models keeps the last one's predictions
+        draws = () if self._draws is None else ((self.n_draws, self._draw_seed),)
+        return self._cache.key(budget, _window_key(window), *draws)
+    
+    def enable_cache(
+        self,
+        maxsize: int = 1024, # Maximum number of predictions kept in memory
+        decimals: int|None = None, # Number of decimals kept when quantizing budgets, exact budgets if None
+        path: str|Path|None = None, # Optional sqlite file to persist predictions across restarts
+        cache: PredictionCache|None = None # Use an existing cache instead of creating one
+        ) -> "BaseBudgetModel":
+        """
+        Memoize predictions keyed on the budget and the fingerprint of the model artifact. 
+        Keys are exact by default so finite difference steps are not served the prediction of the base point.
+        """
+        self._fingerprint = artifact_fingerprint(self.model_path) # hashed once, the loaded model does not change
+        if cache is None:
+            cache = (
+                PredictionCache(maxsize, decimals) if path is None 
+                else SqlitePredictionCache(path, maxsize, decimals))
+        self._cache = cache
+        return self
+    
+    def disable_cache(self) -> "BaseBudgetModel":
+        """
+        Stop memoizing predictions
+        """
+        self._cache = None
+        return self
+    
+    def cache_info(self) -> CacheInfo|None:
+        """
+        Hit/miss statistics of the prediction cache
+        """
+        return None if self._cache is None else self._cache.info()
     
     def contributions(
         self, 
@@ -85,3 +432,88 @@ class BaseBudgetModel(AbstractModel):
         """
         data = self._budget_to_data(budget, self._model)
         return self._model.contributions(data)
+    
+    def predict_batch(
+        self,
+        budgets: xr.Dataset|np.ndarray|list[BudgetType], # Budgets stacked along `candidate`, a 2-D array or a list of budgets
+        channels: list[str]|None = None, # Channel names for the columns of a 2-D array
+        window: dict[str, slice]|None = None # Only predict these coordinates, e.g. `{"time": slice(start, end)}`
+        ) -> xr.DataArray: # Predicted target variable with a `candidate` dimension
+        """
+        Predict the target variable for many budgets at once
+        """
+        budgets = stack_budgets(budgets, channels)
+        window = window if _window_key(window) else None
+        if self._cache is None:
+            return self._predict_batch(budgets, window)
+        unstacked = unstack_budgets(budgets)
+        keys = [self._cache_key(budget, window) for budget in unstacked]
+        predictions = [self._cached(budget, window) for budget in unstacked]
+        missing = [i for i, prediction in enumerate(predictions) if prediction is None]
+        if missing:
+            computed = self._predict_batch(budgets.isel({CANDIDATE_DIM: missing}), window)
+            for n, i in enumerate(missing):
+                predictions[i] = computed.isel({CANDIDATE_DIM: n}, drop=True)
+                self._cache.put(keys[i], predictions[i])
+        return xr.concat(predictions, dim=CANDIDATE_DIM)
+    
+    def _predict_batch(self, budgets: xr.Dataset, window: dict[str, slice]|None = None) -> xr.DataArray:
+        if self.has_batch:
+            if self._budget_to_multipliers is not None:
+                prediction = self._model_predict(budgets, window)
+            else:
+                with self._instrumentation.stage("budget_to_data"):
+                    data = self._budget_to_data_batch(budgets, self._model)
+                    if window is not None and self._lookback is not None:
+                        data = data.isel(self._window_indexers(data, window))
+                with self._instrumentation.stage("model_predict"):
+                    prediction = self._model_output(data)
+            if window is not None:
+                prediction = prediction.sel(window)
+        else:
+            prediction = xr.concat(
+                [self._predict(budget, window) for budget in unstack_budgets(budgets)], 
+                dim=CANDIDATE_DIM)
+        return prediction.transpose(CANDIDATE_DIM, ...)
+    
+    def contributions_batch(
+        self,
+        budgets: xr.Dataset|np.ndarray|list[BudgetType], # Budgets stacked along `candidate`, a 2-D array or a list of budgets
+        channels: list[str]|None = None # Channel names for the columns of a 2-D array
+        ) -> xr.Dataset: # Contributions with a `candidate` dimension
+        """
+        Get the contributions for many budgets at once
+        """
+        budgets = stack_budgets(budgets, channels)
+        if self._budget_to_multipliers is not None:
+            return self._model.contributions(self.budget_data(budgets).to_dataset())
+        if self._budget_to_data_batch is not None:
+            data = self._budget_to_data_batch(budgets, self._model)
+            return self._model.contributions(data)
+        return xr.concat(
+            [self.contributions(budget) for budget in unstack_budgets(budgets)], 
+            dim=CANDIDATE_DIM)
+
+# %% ../../nbs/utils/00_model_classes.ipynb 7
+def _window_key(window: dict[str, slice]|None) -> tuple|None:
+    "Hashable key of a prediction window, None if it selects everything"
+    if window is None:
+        return None
+    key = tuple(
+        (dim, selection.start, selection.stop) for dim, selection in sorted(window.items()) 
+        if selection.start is not None or selection.stop is not None)
+    return key or None
+
+def _load_budget_model(
+    cls: type, # Subclass of `BaseBudgetModel` to build
+    model_name: str, # Name used to identify the model
+    model_kpi: str, # Key performance indicator output by the model predict
+    model_path: Path, # Path to the model artifact
+    shared: bytes|None = None # Model pickled by a `SharedMemoryPublisher`
+    ) -> BaseBudgetModel:
+    "Rebuild a pickled model from its artifact without calling the subclass constructor"
+    model = cls.__new__(cls)
+    if shared is not None:
+        model._preloaded = pickle.loads(shared)
+    BaseBudgetModel.__init__(model, model_name, model_kpi, model_path)
+    return model
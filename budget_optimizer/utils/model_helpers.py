@@ -3,19 +3,29 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/utils/01_model_helpers.ipynb.
 
 # %% auto 0
-__all__ = ['BudgetType', 'load_module', 'load_yaml', 'AbstractModel']
+__all__ = ['CONFIG_REGISTRY', 'BudgetType', 'CANDIDATE_DIM', 'load_module', 'load_yaml', 'lazy_import', 'ConfigRegistry',
+           'load_config_module', 'load_config_yaml', 'AbstractModel', 'stack_budgets', 'unstack_budgets',
+           'ScaledDataset', 'budget_multipliers', 'save_mmap_dataset', 'open_mmap_dataset', 'open_model_dataset',
+           'to_scalar']
 
 # %% ../../nbs/utils/01_model_helpers.ipynb 3
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import xarray as xr
 import yaml
 
+import sys
+import copy
+import json
+import time
+import types
+import threading
+import importlib
 import importlib.util as import_utils
 from pathlib import Path
 from abc import ABC, abstractmethod
 from typing import Union, List, Dict
+from collections.abc import Mapping
 
 # %% ../../nbs/utils/01_model_helpers.ipynb 5
 def load_module(
@@ -37,6 +47,93 @@ def load_yaml(
         return yaml.safe_load(file)
 
 # %% ../../nbs/utils/01_model_helpers.ipynb 8
+class _LazyModule(types.ModuleType):
+    "Placeholder importing the module it names on first attribute access"
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self.__name__), attr)
+
+def lazy_import(
+  name: str, # Absolute name of the module
+) -> types.ModuleType: # The module, or a placeholder importing it on first attribute access
+    "Import a module lazily."
+    return sys.modules.get(name) or _LazyModule(name)
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 11
+class ConfigRegistry:
+  """Process-wide cache of loaded config modules and YAML files"""
+  def __init__(self):
+    self._entries: Dict[Path, tuple] = {}
+    self._lock = threading.RLock()
+    self.timings: List[Dict] = []
+  
+  @staticmethod
+  def _stamp(path: Path) -> tuple:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+  
+  def _load(self, path: Path, kind: str, loader, reload: bool):
+    path = Path(path).resolve()
+    with self._lock:
+      stamp = self._stamp(path)
+      entry = self._entries.get(path)
+      if reload or entry is None or entry[0] != stamp:
+        start = time.perf_counter()
+        value = loader(path)
+        self.timings.append(dict(path=str(path), kind=kind, seconds=time.perf_counter() - start))
+        entry = self._entries[path] = (stamp, value)
+      return entry[1]
+  
+  def load_module(
+    self, 
+    module_path: Path, # The path to the module
+    reload: bool = False, # Execute the module again even if it is unchanged
+  ) -> object: # The loaded module
+    "Load a module from a file path once."
+    return self._load(module_path, "module", lambda path: load_module(path.stem, path), reload)
+  
+  def load_yaml(
+    self, 
+    file_path: Path, # The path to the YAML file
+    reload: bool = False, # Read the file again even if it is unchanged
+  ) -> Dict: # A copy of the loaded YAML
+    "Load a yaml file once."
+    return copy.deepcopy(self._load(file_path, "yaml", load_yaml, reload))
+  
+  def reload(
+    self, 
+    path: Path|None = None, # File to drop, all files if None
+  ):
+    "Forget loaded files so they are loaded again on next use"
+    with self._lock:
+      if path is None:
+        self._entries.clear()
+      else:
+        self._entries.pop(Path(path).resolve(), None)
+  
+  def report(self) -> pd.DataFrame:
+    "Number of loads and total load time per file"
+    timings = pd.DataFrame(self.timings, columns=["path", "kind", "seconds"])
+    return timings.groupby(["path", "kind"]).seconds.agg(["count", "sum"]).rename(
+      columns={"count": "loads", "sum": "seconds"})
+
+CONFIG_REGISTRY = ConfigRegistry() # registry shared by every model and optimizer in the process
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 12
+def load_config_module(
+  module_path: Path, # The path to the module
+  reload: bool = False, # Execute the module again even if it is unchanged
+) -> object: # The loaded module
+    "Load a config module through the process-wide `CONFIG_REGISTRY`."
+    return CONFIG_REGISTRY.load_module(module_path, reload)
+
+def load_config_yaml(
+  file_path: Path, # The path to the YAML file
+  reload: bool = False, # Read the file again even if it is unchanged
+) -> Dict: # A copy of the loaded YAML
+    "Load a yaml file through the process-wide `CONFIG_REGISTRY`."
+    return CONFIG_REGISTRY.load_yaml(file_path, reload)
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 16
 class AbstractModel(ABC):
   """An abstract class for models"""
   @abstractmethod
@@ -50,5 +147,152 @@ class AbstractModel(ABC):
   def __repr__(self) -> str:
     return f"Model"
 
-# %% ../../nbs/utils/01_model_helpers.ipynb 11
+# %% ../../nbs/utils/01_model_helpers.ipynb 19
 BudgetType = Union[Dict[str, float], xr.Dataset] # type alias for budget data
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 21
+CANDIDATE_DIM = "candidate" # name of the dimension that indexes stacked budgets
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 22
+def stack_budgets(
+  budgets: Union[xr.Dataset, np.ndarray, List[Dict[str, float]]], # Stacked budgets, 2-D array (candidate, channel) or list of budgets
+  channels: List[str]|None = None, # Channel names for the columns of a 2-D array
+) -> xr.Dataset: # One variable per channel indexed by `CANDIDATE_DIM`
+    "Stack many budgets into a single dataset with a candidate dimension."
+    if isinstance(budgets, xr.Dataset):
+        if CANDIDATE_DIM not in budgets.dims:
+            raise ValueError(f"Stacked budgets must have a '{CANDIDATE_DIM}' dimension")
+        return budgets
+    if isinstance(budgets, np.ndarray):
+        if channels is None:
+            raise ValueError("Channel names are required to stack a 2-D array of budgets")
+        values = np.atleast_2d(budgets)
+        if values.shape[1] != len(channels):
+            raise ValueError(f"Expected {len(channels)} columns, got {values.shape[1]}")
+        return xr.Dataset({name: (CANDIDATE_DIM, values[:, i]) for i, name in enumerate(channels)})
+    budgets = list(budgets)
+    if channels is None:
+        channels = list(budgets[0].keys())
+    return xr.Dataset({
+        name: (CANDIDATE_DIM, np.array([budget[name] for budget in budgets], dtype=float)) 
+        for name in channels})
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 23
+def unstack_budgets(
+  budgets: xr.Dataset, # Budgets stacked along `CANDIDATE_DIM`
+) -> List[Dict[str, float]]: # One budget per candidate
+    "Split stacked budgets back into a list of budgets."
+    values = {name: np.asarray(budgets[name].values, dtype=float) for name in budgets.data_vars}
+    return [
+        {name: float(value[i]) for name, value in values.items()} 
+        for i in range(budgets.sizes[CANDIDATE_DIM])]
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 27
+class ScaledDataset(Mapping):
+  """Read-only view of a dataset with per-channel spend multipliers applied on access"""
+  def __init__(
+    self, 
+    base: xr.Dataset, # Unscaled model data
+    multipliers: Dict[str, Union[float, xr.DataArray]], # Multiplier applied to each scaled variable
+    buffers: Dict[str, np.ndarray]|None = None, # Reusable output arrays for scalar multipliers, keyed by variable
+  ):
+    self.base = base
+    self.multipliers = multipliers
+    self.buffers = buffers
+  
+  def __getitem__(self, key: str) -> xr.DataArray:
+    value = self.base[key]
+    multiplier = self.multipliers.get(key)
+    if multiplier is None:
+      return value
+    if self.buffers is None or isinstance(multiplier, xr.DataArray) or not isinstance(value.data, np.ndarray):
+      return value*multiplier
+    buffer = self.buffers.get(key)
+    if buffer is None or buffer.shape != value.shape:
+      buffer = self.buffers[key] = np.empty(value.shape, dtype=np.result_type(value.dtype, float))
+    np.multiply(value.data, multiplier, out=buffer)
+    return value.copy(deep=False, data=buffer)
+  
+  def __iter__(self):
+    return iter(self.base.data_vars)
+  
+  def __len__(self) -> int:
+    return len(self.base.data_vars)
+  
+  @property
+  def data_vars(self):
+    return self.base.data_vars
+  
+  @property
+  def coords(self):
+    return self.base.coords
+  
+  @property
+  def sizes(self):
+    return self.base.sizes
+  
+  def to_dataset(self) -> xr.Dataset:
+    "Materialize the scaled variables into a new dataset"
+    return xr.Dataset({key: self[key] for key in self}, attrs=self.base.attrs)
+  
+  def __repr__(self) -> str:
+    return f"ScaledDataset({list(self.multipliers)})\n{self.base!r}"
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 28
+def budget_multipliers(
+  budget: Union[Dict[str, float], xr.Dataset], # Budget, or budgets stacked along `CANDIDATE_DIM`
+  reference_budget: Dict[str, float], # Budget the model data corresponds to
+) -> Dict[str, Union[float, xr.DataArray]]: # Spend multiplier per channel
+    "Ratio of each channel's spend to the spend of the reference budget."
+    return {key: value/reference_budget[key] for key, value in budget.items()}
+
+# %% ../../nbs/utils/01_model_helpers.ipynb 32
+_MMAP_METADATA = "dataset.json"
+
+def save_mmap_dataset(
+  data: xr.Dataset, # Dataset with NumPy-backed variables
+  path: str|Path, # Directory to write to
+) -> Path:
+  "Write a dataset as one `.npy` file per variable and coordinate that can be memory-mapped"
+  path = Path(path)
+  path.mkdir(parents=True, exist_ok=True)
+  metadata = {"attrs": data.attrs, "data_vars": {}, "coords": {}}
+  for kind, variables in (("data_vars", data.data_vars), ("coords", data.coords)):
+    for n, (name, variable) in enumerate(variables.items()):
+      file_name = f"{kind}_{n}.npy"
+      np.save(path/file_name, np.asarray(variable.values), allow_pickle=False)
+      metadata[kind][name] = {"dims": list(variable.dims), "file": file_name}
+  (path/_MMAP_METADATA).write_text(json.dumps(metadata))
+  return path
+
+def open_mmap_dataset(
+  path: str|Path, # Directory written by `save_mmap_dataset`
+) -> xr.Dataset: # Dataset backed by read-only memory maps
+  "Open a dataset saved by `save_mmap_dataset` without reading it into memory"
+  path = Path(path)
+  metadata = json.loads((path/_MMAP_METADATA).read_text())
+  load = lambda entry: (entry["dims"], np.load(path/entry["file"], mmap_mode="r"))
+  return xr.Dataset(
+    {name: load(entry) for name, entry in metadata["data_vars"].items()},
+    coords={name: load(entry) for name, entry in metadata["coords"].items()},
+    attrs=metadata["attrs"])
+
+def open_model_dataset(
+  path: str|Path, # `save_mmap_dataset` directory, zarr store or netCDF file
+  chunks: Dict[str, int]|None = None, # Dask chunks, None opens netCDF files eagerly
+) -> xr.Dataset:
+  "Open model data stored on local disk, memory-mapped or lazily chunked"
+  path = Path(path)
+  if (path/_MMAP_METADATA).exists():
+    return open_mmap_dataset(path)
+  if path.suffix == ".zarr":
+    return xr.open_zarr(path, chunks=chunks or "auto")
+  return xr.open_dataset(path, chunks=chunks)
+
+def to_scalar(
+  value: Union[float, np.ndarray, xr.DataArray], # Loss, possibly lazy
+) -> float:
+  "Reduce a loss to a Python float, computing dask-backed values chunk-wise"
+  if hasattr(value, "compute"):
+    value = value.compute()
+  return float(value)
@@ -0,0 +1,200 @@
+"""Memoize model predictions keyed on quantized budgets"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/utils/03_prediction_cache.ipynb.
+
+# %% auto 0
+__all__ = ['CacheInfo', 'budget_key', 'artifact_fingerprint', 'artifact_stats', 'PredictionCache', 'SqlitePredictionCache']
+
+# %% ../../nbs/utils/03_prediction_cache.ipynb 3
+import pickle
+import sqlite3
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import Any, Hashable
+
+# %% ../../nbs/utils/03_prediction_cache.ipynb 5
+def budget_key(
+  budget: dict[str, float], # Budget to canonicalize
+  decimals: int|None = None, # Number of decimals kept when quantizing spends, exact spends if None
+) -> tuple: # Hashable key, identical for budgets equal up to `decimals`
+    "Canonical, optionally quantized key for a budget."
+    if decimals is None:
+        return tuple(sorted((str(name), float(value) + 0.) for name, value in budget.items()))
+    return tuple(sorted((str(name), round(float(value), decimals) + 0.) for name, value in budget.items()))
+
+# %% ../../nbs/utils/03_prediction_cache.ipynb 6
+def _artifact_files(model_path: Path) -> list[tuple[str, Path]]:
+    "Name and path of every file of a model artifact, sorted by name"
+    if not model_path.is_dir():
+        return [(model_path.name, model_path)]
+    return sorted(
+        (path.relative_to(model_path).as_posix(), path) for path in model_path.rglob("*") 
+        if path.is_file() and "__pycache__" not in path.relative_to(model_path).parts)
+
+def artifact_fingerprint(
+  model_path: Path, # Path to the model artifact, a directory or a single file
+) -> str: # Hash of the relative path, size and content of every file of the artifact
+    "Fingerprint a model artifact so cached predictions are invalidated when any file changes, wherever it is stored."
+    digest = hashlib.sha256()
+    for name, path in _artifact_files(Path(model_path)):
+        digest.update(f"{name}:{path.stat().st_size}:".encode())
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+def artifact_stats(
+  model_path: Path, # Path to the model artifact, a directory or a single file
+) -> tuple: # Relative path, size and modification time of every file of the artifact
+    "Cheap signature of a model artifact to tell when its fingerprint has to be computed again."
+    return tuple(
+        (name, stat.st_size, stat.st_mtime_ns) 
+        for name, stat in ((name, path.stat()) for name, path in _artifact_files(Path(model_path))))
+
+# %% ../../nbs/utils/03_prediction_cache.ipynb 10
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# %% ../../nbs/utils/03_prediction_cache.ipynb 11
+class PredictionCache:
+    """
+    Thread-safe in-memory LRU cache of predictions
+    """
+    def __init__(
+        self,
+        maxsize: int = 1024, # Maximum number of predictions kept in memory
+        decimals: int|None = None, # Number of decimals kept when quantizing budgets, exact budgets if None
+        ):
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self.namespace: str|None = None
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def key(self, budget: dict[str, float], *extra: Hashable) -> tuple:
+        "Cache key of a budget, `extra` distinguishes other prediction arguments"
+        return (budget_key(budget, self.decimals), *extra)
+    
+    def set_namespace(
+        self, 
+        namespace: str # Fingerprint of the model producing the predictions
+        ):
+        "Switch to a new namespace, dropping predictions from any other namespace"
+        with self._lock:
+            if namespace != self.namespace:
+                self._data.clear()
+                self.namespace = namespace
+    
+    def _get(self, key: tuple) -> Any:
+        return self._data.get(key)
+    
+    def _put(self, key: tuple, value: Any):
+        pass
+    
+    def get(
+        self, 
+        key: tuple # Key from `PredictionCache.key`
+        ) -> Any: # Cached prediction or None
+        "Look up a prediction, counting hits and misses"
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            else:
+                value = self._get(key)
+                if value is not None:
+                    self._insert(key, value)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+    
+    def _insert(self, key: tuple, value: Any):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def put(
+        self, 
+        key: tuple, # Key from `PredictionCache.key`
+        value: Any # Prediction to store
+        ):
+        "Store a prediction, evicting the least recently used entries"
+        with self._lock:
+            self._insert(key, value)
+            self._put(key, value)
+    
+    def clear(self):
+        "Drop all predictions and reset the counters"
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+    
+    def info(self) -> CacheInfo:
+        "Hit/miss statistics"
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+# %% ../../nbs/utils/03_prediction_cache.ipynb 12
+class SqlitePredictionCache(PredictionCache):
+    """
+    LRU cache that also persists predictions to a sqlite file so they survive process restarts
+    """
+    def __init__(
+        self,
+        path: str|Path, # Path to the sqlite file
+        maxsize: int = 1024, # Maximum number of predictions kept in memory
+        decimals: int|None = None, # Number of decimals kept when quantizing budgets, exact budgets if None
+        max_disk_entries: int|None = None, # Maximum number of predictions kept on disk, unbounded if None
+        ):
+        super().__init__(maxsize, decimals)
+        self.path = Path(path)
+        self.max_disk_entries = max_disk_entries
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS predictions ("
+            "namespace TEXT, key TEXT, value BLOB, last_used REAL, "
+            "PRIMARY KEY (namespace, key))")
+        self._conn.commit()
+    
+    def _get(self, key: tuple) -> Any:
+        row = self._conn.execute(
+            "SELECT value FROM predictions WHERE namespace = ? AND key = ?", 
+            (self.namespace or "", repr(key))).fetchone()
+        if row is None:
+            return None
+        self._conn.execute(
+            "UPDATE predictions SET last_used = ? WHERE namespace = ? AND key = ?",
+            (time.time(), self.namespace or "", repr(key)))
+        self._conn.commit()
+        return pickle.loads(row[0])
+    
+    def _put(self, key: tuple, value: Any):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO predictions VALUES (?, ?, ?, ?)",
+            (self.namespace or "", repr(key), pickle.dumps(value), time.time()))
+        if self.max_disk_entries is not None:
+            self._conn.execute(
+                "DELETE FROM predictions WHERE rowid IN ("
+                "SELECT rowid FROM predictions ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,))
+        self._conn.commit()
+    
+    def clear(self):
+        "Drop all predictions, including the ones stored on disk"
+        with self._lock:
+            super().clear()
+            self._conn.execute("DELETE FROM predictions")
+            self._conn.commit()
+    
+    def close(self):
+        "Close the connection to the sqlite file"
+        self._conn.close()
@@ -3,13 +3,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/utils/02_search_space_helpers.ipynb.
 
 # %% auto 0
-__all__ = ['Trial', 'ConstrainedSearchSpace']
+__all__ = ['Trial', 'ConstrainedSearchSpace', 'project_budgets']
 
 # %% ../../nbs/utils/02_search_space_helpers.ipynb 3
 import numpy as np
 from typing import Generator, List, Tuple, Protocol
 from dataclasses import dataclass
 from collections import OrderedDict
+from itertools import accumulate
 
 # %% ../../nbs/utils/02_search_space_helpers.ipynb 4
 class Trial(Protocol):
@@ -29,6 +30,16 @@ class ConstrainedSearchSpace:
 
     def __post_init__(self):
         self.bounds = OrderedDict(sorted(self.bounds.items(), key=lambda x: x[1]))
+        self.names: list[str] = list(self.bounds)
+        self._lows: list[float] = [float(bound[0]) for bound in self.bounds.values()]
+        self._highs: list[float] = [float(bound[1]) for bound in self.bounds.values()]
+        # sums of the bounds of the channels after each channel
+        self._suffix_lows: list[float] = list(accumulate(reversed(self._lows[1:]), initial=0.))[::-1]
+        self._suffix_highs: list[float] = list(accumulate(reversed(self._highs[1:]), initial=0.))[::-1]
+        if sum(self._lows) > self.constraint[1] or sum(self._highs) < self.constraint[0]:
+            raise ValueError(
+                f"Constraint {self.constraint} is not satisfiable within bounds "
+                f"summing to ({sum(self._lows)}, {sum(self._highs)})")
     
     def __call__(
         self, 
@@ -36,24 +47,102 @@ class ConstrainedSearchSpace:
         ) -> dict[str, float]: # selected budget
         "Sample from constrained search space"
         selected_budget = {}
-        bounds_values = list(self.bounds.values())
-        bounds_items = list(self.bounds.items())
-        for n, (name, bound) in enumerate(bounds_items[:-1]):
-            curr_total = sum(selected_budget.values())
-            new_min_bound = self.constraint[0]-(curr_total+sum(b[1] for b in bounds_values[n+1:]))
-            new_max_bound = self.constraint[1]-(curr_total+sum(b[0] for b in bounds_values[n+1:]))
-            updated_bounds = (
-                    max(bound[0], new_min_bound), 
-                    min(bound[1], new_max_bound)
-            )
-            selection = trial.suggest_float(name, *updated_bounds)
+        curr_total = 0.
+        lower, upper = self.constraint
+        for name, low, high, suffix_low, suffix_high in zip(
+            self.names, self._lows, self._highs, self._suffix_lows, self._suffix_highs):
+            selection = trial.suggest_float(
+                name, 
+                max(low, lower-(curr_total+suffix_high)), 
+                min(high, upper-(curr_total+suffix_low)))
             selected_budget[name] = selection
-        last = bounds_values[-1]
-        last_name = bounds_items[-1][0]
-        choice = trial.suggest_float(
-            last_name, 
-            max(last[0], self.constraint[0]-sum(selected_budget.values())),
-            min(last[1], self.constraint[1]-sum(selected_budget.values()))
-        )
-        selected_budget[last_name] = choice
+            curr_total += selection
         return selected_budget
+    
+    def is_feasible(
+        self,
+        budgets: np.ndarray, # Budgets with columns in the order of `names`
+        tol: float = 1e-6 # Absolute tolerance on the bounds and the constraint
+        ) -> np.ndarray: # Whether each budget satisfies the bounds and the constraint
+        "Check budgets against the bounds and the constraint"
+        budgets = np.atleast_2d(budgets)
+        totals = budgets.sum(axis=1)
+        return (
+            (budgets >= np.array(self._lows) - tol).all(axis=1) 
+            & (budgets <= np.array(self._highs) + tol).all(axis=1)
+            & (totals >= self.constraint[0] - tol) & (totals <= self.constraint[1] + tol))
+    
+    def _center(self) -> np.ndarray:
+        "Feasible point interpolating between the lower and upper bounds"
+        lows, highs = np.array(self._lows), np.array(self._highs)
+        total_low, total_high = lows.sum(), highs.sum()
+        lower = max(self.constraint[0], total_low)
+        upper = min(self.constraint[1], total_high)
+        if total_high == total_low:
+            return lows
+        return lows + (highs - lows)*((lower + upper)/2 - total_low)/(total_high - total_low)
+    
+    def sample(
+        self,
+        n: int, # Number of budgets
+        seed: int|np.random.Generator|None = None, # Seed of the random generator
+        n_steps: int|None = None # Hit-and-run steps per budget, defaults to 20 per channel plus 100
+        ) -> np.ndarray: # Budgets of shape (n, channels) with columns in the order of `names`
+        "Sample budgets uniformly from the constrained polytope with vectorized hit-and-run chains"
+        rng = np.random.default_rng(seed)
+        lows, highs = np.array(self._lows), np.array(self._highs)
+        lower, upper = self.constraint
+        n_channels = len(lows)
+        n_steps = 20*n_channels + 100 if n_steps is None else n_steps
+        x = np.tile(self._center(), (n, 1))
+        totals = x.sum(axis=1)
+        rows = np.arange(n)
+        equality = np.isclose(lower, upper)
+        if equality and n_channels < 2:
+            return x
+        for _ in range(n_steps):
+            # move along a random coordinate, or between two channels when the total is fixed
+            i = rng.integers(n_channels, size=n)
+            if equality:
+                j = (i + rng.integers(1, n_channels, size=n)) % n_channels
+                t_min = np.maximum(lows[i] - x[rows, i], x[rows, j] - highs[j])
+                t_max = np.minimum(highs[i] - x[rows, i], x[rows, j] - lows[j])
+            else:
+                t_min = np.maximum(lows[i] - x[rows, i], lower - totals)
+                t_max = np.minimum(highs[i] - x[rows, i], upper - totals)
+            t = rng.uniform(np.minimum(t_min, 0.), np.maximum(t_max, 0.))
+            x[rows, i] += t
+            if equality:
+                x[rows, j] -= t
+            else:
+                totals += t
+        return np.clip(x, lows, highs)
+
+# %% ../../nbs/utils/02_search_space_helpers.ipynb 18
+def project_budgets(
+    budgets: np.ndarray, # Budgets, one per row
+    lows: np.ndarray, # Lower bound of each column
+    highs: np.ndarray, # Upper bound of each column
+    constraint: tuple[float, float] = (-np.inf, np.inf), # Bounds of the sum of each row
+    n_iter: int = 100 # Bisection steps
+    ) -> np.ndarray: # Projected budgets
+    "Euclidean projection of each row onto the box intersected with the sum constraint"
+    budgets = np.atleast_2d(np.asarray(budgets, dtype=float))
+    lows, highs = np.asarray(lows, dtype=float), np.asarray(highs, dtype=float)
+    clipped = np.clip(budgets, lows, highs)
+    totals = clipped.sum(axis=1)
+    targets = np.clip(totals, *constraint)
+    outside = totals != targets
+    if not outside.any():
+        return clipped
+    x, target = budgets[outside], targets[outside, None]
+    # the sum of clip(x - tau) decreases from sum(highs) at tau_low to sum(lows) at tau_high
+    tau_low = (x - highs).min(axis=1, keepdims=True)
+    tau_high = (x - lows).max(axis=1, keepdims=True)
+    for _ in range(n_iter):
+        tau = (tau_low + tau_high)/2
+        above = np.clip(x - tau, lows, highs).sum(axis=1, keepdims=True) > target
+        tau_low = np.where(above, tau, tau_low)
+        tau_high = np.where(above, tau_high, tau)
+    clipped[outside] = np.clip(x - (tau_low + tau_high)/2, lows, highs)
+    return clipped
@@ -0,0 +1,126 @@
+"""Publish model arrays once so worker processes attach read-only views instead of reloading the model"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/utils/05_shared_memory.ipynb.
+
+# %% auto 0
+__all__ = ['SharedMemoryPublisher']
+
+# %% ../../nbs/utils/05_shared_memory.ipynb 3
+import io
+import pickle
+import types
+import weakref
+from pathlib import Path
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# %% ../../nbs/utils/05_shared_memory.ipynb 5
+_ATTACHED: dict[str, shared_memory.SharedMemory] = {} # blocks attached by this process, kept open for its lifetime
+_PUBLISHED: dict[str, shared_memory.SharedMemory] = {} # blocks created by this process, until they are unlinked
+
+def _attach_array(
+    name: str, # Name of the shared memory block
+    shape: tuple[int, ...], # Shape of the array
+    dtype: np.dtype # Data type of the array
+    ) -> np.ndarray:
+    "Read-only view of an array published in shared memory"
+    block = _ATTACHED.get(name) or _PUBLISHED.get(name)
+    if block is None:
+        try:
+            block = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError: # before Python 3.13 attaching registers the block again with the tracker workers share with their parent
+            block = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = block
+    array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    array.flags.writeable = False
+    return array
+
+def _config_attribute(
+    module_path: str, # Path of the config module
+    qualname: str # Qualified name of the class or function
+    ):
+    "Class or function of a config module, loaded once per process"
+    from budget_optimizer.utils.model_helpers import load_config_module
+    value = load_config_module(Path(module_path))
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+def _release(blocks: dict):
+    "Close and unlink published blocks"
+    for block, _, _ in blocks.values():
+        _PUBLISHED.pop(block.name, None)
+        try:
+            block.unlink()
+        except FileNotFoundError: # already unlinked by the resource tracker of an independent process
+            pass
+        try:
+            block.close()
+        except BufferError: # views attached in this process keep the mapping until they are collected
+            pass
+    blocks.clear()
+
+# %% ../../nbs/utils/05_shared_memory.ipynb 6
+class _SharedPickler(pickle.Pickler):
+    def __init__(self, file, publisher: "SharedMemoryPublisher"):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.publisher = publisher
+    
+    def reducer_override(self, obj):
+        if isinstance(obj, np.ndarray) and not obj.dtype.hasobject and obj.nbytes >= self.publisher.min_bytes:
+            return self.publisher._publish(obj)
+        if isinstance(obj, (type, types.FunctionType)):
+            for path, module in self.publisher.config_modules.items():
+                if getattr(obj, "__module__", None) == module.__name__ and _lookup(module, obj.__qualname__) is obj:
+                    return _config_attribute, (str(path), obj.__qualname__)
+        return NotImplemented
+
+def _lookup(module: types.ModuleType, qualname: str):
+    value = module
+    for name in qualname.split("."):
+        value = getattr(value, name, None)
+    return value
+
+# %% ../../nbs/utils/05_shared_memory.ipynb 7
+class SharedMemoryPublisher:
+    """
+    Pickle objects with their large NumPy arrays moved to shared memory blocks
+    """
+    def __init__(
+        self,
+        min_bytes: int = 1 << 16, # Smaller arrays are pickled by value
+        config_modules: dict[Path, types.ModuleType]|None = None, # Config modules whose classes and functions are pickled by path
+        ):
+        self.min_bytes = min_bytes
+        self.config_modules = config_modules or {}
+        self._blocks: dict[int, tuple[shared_memory.SharedMemory, np.ndarray, tuple]] = {}
+        self._finalizer = weakref.finalize(self, _release, self._blocks)
+    
+    def _publish(self, array: np.ndarray) -> tuple:
+        "Copy an array to a shared memory block once and reduce it to an attachment"
+        published = self._blocks.get(id(array))
+        if published is None or published[1] is not array:
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            published = self._blocks[id(array)] = (block, array, (block.name, array.shape, array.dtype))
+            _PUBLISHED[block.name] = block
+        return _attach_array, published[2]
+    
+    def dumps(
+        self, 
+        obj # Object to pickle
+        ) -> bytes:
+        "Pickle an object, publishing its large arrays"
+        buffer = io.BytesIO()
+        _SharedPickler(buffer, self).dump(obj)
+        return buffer.getvalue()
+    
+    @property
+    def nbytes(self) -> int:
+        "Total size of the published arrays"
+        return sum(array.nbytes for _, array, _ in self._blocks.values())
+    
+    def close(self):
+        "Unlink the published blocks, attached views stay valid until their processes exit"
+        self._finalizer()
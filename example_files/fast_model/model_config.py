@@ -1,7 +1,7 @@
 import xarray as xr
 from pathlib import Path
 import numpy as np
-from budget_optimizer.utils.model_helpers import AbstractModel, BudgetType
+from budget_optimizer.utils.model_helpers import AbstractModel, BudgetType, budget_multipliers
 
 
 INITIAL_BUDGET: BudgetType = dict(a=2., b=3.)
@@ -20,9 +20,8 @@ class SimpleModel(AbstractModel):
     self.data = data
     
   def predict(self, x: xr.Dataset) -> xr.DataArray:
-    x = x.copy()
-    x["prediction"] = np.exp(1 + .2*(x["a"]**2/(x["a"]**2 + np.exp(1)**2)) + .25*(x["b"]**4/(x["b"]**4 + np.exp(2)**4)))
-    return x["prediction"]
+    prediction = np.exp(1 + .2*(x["a"]**2/(x["a"]**2 + np.exp(1)**2)) + .25*(x["b"]**4/(x["b"]**4 + np.exp(2)**4)))
+    return prediction.rename("prediction")
   
   def contributions(self, x: xr.Dataset) -> xr.Dataset:
     return x
@@ -32,6 +31,26 @@ def budget_to_data(budget: BudgetType, model: AbstractModel) -> xr.Dataset:
     for key, value in budget.items():
         data[key] = value/INITIAL_BUDGET[key]*data[key]
     return data
+
+REUSE_BUFFERS = True # the model never returns its inputs, so scaled data buffers can be reused
+
+LOOKBACK = 0 # each period only depends on its own data, so predictions can be restricted to the loss window
+
+def budget_to_multipliers(budget: BudgetType, model: AbstractModel) -> dict:
+    # scale model.data lazily instead of copying it, budgets stacked along the
+    # "candidate" dimension give multipliers that broadcast over every candidate
+    return budget_multipliers(budget, INITIAL_BUDGET)
+  
+def predict_jac(budget: BudgetType, model: AbstractModel) -> xr.DataArray:
+    # derivative of the prediction with respect to the spend of each channel,
+    # stacked along a "channel" dimension
+    data = budget_to_data(budget, model)
+    prediction = model.predict(data)
+    a, b = data["a"], data["b"]
+    ca, cb = np.exp(1)**2, np.exp(2)**4
+    da = .2*2*a*ca/(a**2 + ca)**2*model.data["a"]/INITIAL_BUDGET["a"]
+    db = .25*4*b**3*cb/(b**4 + cb)**2*model.data["b"]/INITIAL_BUDGET["b"]
+    return xr.concat([prediction*da, prediction*db], dim="channel").assign_coords(channel=["a", "b"])
   
 def model_loader(path: Path) -> AbstractModel:
     rng = np.random.default_rng(42)
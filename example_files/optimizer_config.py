@@ -1,10 +1,10 @@
 import numpy as np
 import xarray as xr
-from budget_optimizer.utils.model_helpers import BudgetType, load_yaml
+from budget_optimizer.utils.model_helpers import BudgetType, load_config_yaml
 from pathlib import Path
 
 # Define the optimizer configuration
-CONFIG = load_yaml(Path(__file__).parent / "optimizer_config.yaml")
+CONFIG = load_config_yaml(Path(__file__).parent / "optimizer_config.yaml")
 
 
 def loss_fn(x: xr.DataArray, start_date=None, end_date=None, dim="Period"):
@@ -14,6 +14,20 @@ def loss_fn(x: xr.DataArray, start_date=None, end_date=None, dim="Period"):
     x = x.sel({dim: slice(start_date, end_date)})
     return -np.sum(x)
 
+def loss_fn_grad(x: xr.DataArray, start_date=None, end_date=None, dim="Period"):
+    # derivative of loss_fn with respect to every element of the prediction
+    window = x[dim].sel({dim: slice(start_date, end_date)})
+    return -xr.ones_like(x).where(x[dim].isin(window.values), 0.)
+
+def draw_loss_fn(x: xr.DataArray, draw_dim: str, start_date=None, end_date=None, dim="Period"):
+    # loss_fn of every posterior draw at once, along draw_dim
+    x = x.sel({dim: slice(start_date, end_date)})
+    return -x.sum([d for d in x.dims if d != draw_dim])
+
+def loss_window(start_date=None, end_date=None, dim="Period"):
+    # coordinates of the prediction loss_fn depends on, the model only predicts these
+    return {dim: slice(start_date, end_date)}
+
 def optimizer_array_to_budget(array: np.ndarray) -> BudgetType:
     initial_budget: BudgetType = CONFIG['initial_budget']
     budget: BudgetType = {}
@@ -0,0 +1,54 @@
+
+import xarray as xr
+from pathlib import Path
+import numpy as np
+from budget_optimizer.utils.model_helpers import AbstractModel, BudgetType, budget_multipliers
+
+
+INITIAL_BUDGET: BudgetType = dict(a=2., b=3.)
+
+class PosteriorModel(AbstractModel):
+  """
+  Bayesian version of the simple model, the effect of each variable is
+  uncertain and given by posterior draws of its coefficient.
+  Predictions have a "draw" dimension, one prediction per posterior draw.
+  """
+  def __init__(self, data: xr.Dataset, posterior: xr.Dataset):
+    self.data = data
+    self.posterior = posterior
+
+  def predict(self, x: xr.Dataset) -> xr.DataArray:
+    effect_a = self.posterior["beta_a"]*(x["a"]**2/(x["a"]**2 + np.exp(1)**2))
+    effect_b = self.posterior["beta_b"]*(x["b"]**4/(x["b"]**4 + np.exp(2)**4))
+    return np.exp(1 + effect_a + effect_b).rename("prediction")
+
+  def contributions(self, x: xr.Dataset) -> xr.Dataset:
+    return x
+
+def budget_to_data(budget: BudgetType, model: AbstractModel) -> xr.Dataset:
+    data = model.data.copy()
+    for key, value in budget.items():
+        data[key] = value/INITIAL_BUDGET[key]*data[key]
+    return data
+
+def budget_to_multipliers(budget: BudgetType, model: AbstractModel) -> dict:
+    return budget_multipliers(budget, INITIAL_BUDGET)
+
+REUSE_BUFFERS = True # the model never returns its inputs, so scaled data buffers can be reused
+
+LOOKBACK = 0 # each period only depends on its own data
+
+POSTERIOR_DRAWS = {"draw": 400} # predictions have 400 posterior draws along "draw"
+
+def select_draws(model: AbstractModel, draws: np.ndarray) -> AbstractModel:
+    # the same model restricted to a subset of the posterior draws, so predictions only compute those
+    return PosteriorModel(model.data, model.posterior.isel(draw=draws))
+
+def model_loader(path: Path) -> AbstractModel:
+    rng = np.random.default_rng(42)
+    data_a = xr.DataArray(np.exp(1+rng.normal(0, .4, size=156)), dims='time', coords={"time": np.arange(1, 157)})
+    data_b = xr.DataArray(np.exp(2+rng.normal(0, .2, size=156)), dims='time', coords={"time": np.arange(1, 157)})
+    posterior = xr.Dataset({
+      "beta_a": ("draw", rng.normal(.2, .08, size=400)),
+      "beta_b": ("draw", rng.normal(.25, .02, size=400))})
+    return PosteriorModel(xr.Dataset({"a": data_a, "b": data_b}), posterior)
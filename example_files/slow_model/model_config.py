@@ -1,7 +1,7 @@
 import xarray as xr
 from pathlib import Path
 import numpy as np
-from budget_optimizer.utils.model_helpers import AbstractModel, BudgetType
+from budget_optimizer.utils.model_helpers import AbstractModel, BudgetType, budget_multipliers
 from time import sleep
 
 INITIAL_BUDGET: BudgetType = dict(a=2., b=3.)
@@ -20,10 +20,9 @@ class SimpleModel(AbstractModel):
     self.data = data
     
   def predict(self, x: xr.Dataset) -> xr.DataArray:
-    x = x.copy()
     sleep(2) # Simulate a long computation
-    x["prediction"] = np.exp(1 + .2*(x["a"]**2/(x["a"]**2 + np.exp(1)**2)) + .25*(x["b"]**4/(x["b"]**4 + np.exp(2)**4)))
-    return x["prediction"]
+    prediction = np.exp(1 + .2*(x["a"]**2/(x["a"]**2 + np.exp(1)**2)) + .25*(x["b"]**4/(x["b"]**4 + np.exp(2)**4)))
+    return prediction.rename("prediction")
   
   def contributions(self, x: xr.Dataset) -> xr.Dataset:
     return x
@@ -33,6 +32,15 @@ def budget_to_data(budget: BudgetType, model: AbstractModel) -> xr.Dataset:
     for key, value in budget.items():
         data[key] = value/INITIAL_BUDGET[key]*data[key]
     return data
+
+REUSE_BUFFERS = True # the model never returns its inputs, so scaled data buffers can be reused
+
+LOOKBACK = 0 # each period only depends on its own data, so predictions can be restricted to the loss window
+
+def budget_to_multipliers(budget: BudgetType, model: AbstractModel) -> dict:
+    # scale model.data lazily instead of copying it, budgets stacked along the
+    # "candidate" dimension give multipliers that broadcast over every candidate
+    return budget_multipliers(budget, INITIAL_BUDGET)
   
 def model_loader(path: Path) -> AbstractModel:
     rng = np.random.default_rng(42)